@@ -0,0 +1,237 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import math
+from src.Solvers.Solver import Solver
+from src.Utils.LowerBound import LowerBound
+
+"""
+Branch and bound solver for a given problem.
+"""
+
+class BranchAndBoundSolver(Solver):
+
+    """
+    Exact solver branching on the shots instead of the defenders. Every shot has to be blocked,
+    so at each step the uncovered shot with the fewest remaining compatible blockers is chosen
+    and the search tries each of these blockers in turn (a shot with a single blocker does not
+    even branch, a shot without any blocker ends the branch). Once a blocker has been tried, it
+    is forbidden in the next branches of the same step, since every solution containing it has
+    already been explored.
+
+    The state of the search is made of three integers used as bitsets: the blocked shots, the
+    forbidden defenders (colliding with a selected one, or already tried) and, for every shot,
+    the defenders blocking it. A branch is pruned as soon as the selected defenders plus a lower
+    bound of the defenders still needed is not smaller than the best solution found so far (see
+    lower_bound). Unlike BruteForceSolver, the search is done once and not once per size.
+
+    :ivar nb_shots: The number of shots of the graph.
+
+    :ivar full: The numerical representation of the set of every shot.
+
+    :ivar covers: For each defender, the shots it blocks (without the leading 1 of Graph.edges).
+
+    :ivar blockers: For each shot, the defenders blocking it.
+
+    :ivar best: The indices of the defenders of the best solution found so far (None if none).
+
+    :ivar root_bound: The lower bound of the size of a minimum solution computed before the \
+    search (see LowerBound.py), the search stops as soon as a solution of this size is found.
+    """
+
+    def __init__(self, graph):
+        """
+        Creates a new BranchAndBoundSolver object.
+
+        :param graph: The graph the solver will have to find a minimum dominating set in.
+        """
+        super().__init__(graph)
+        self.nb_shots = graph.nb_shots
+        self.full = (1 << self.nb_shots) - 1
+        self.covers = []
+        self.blockers = []
+        self.best = None
+        self.root_bound = 0
+
+    def candidates(self, covered, forbidden):
+        """
+        Finds the uncovered shot with the fewest compatible blockers.
+
+        :param covered: The shots already blocked.
+
+        :param forbidden: The defenders that can not be selected anymore.
+
+        :return: A tuple (blockers, bound), blockers being the compatible blockers of the chosen \
+        shot (0 if a shot can not be blocked anymore, None if every shot is blocked) and bound \
+        a lower bound of the number of defenders still needed (see lower_bound).
+        """
+        best = None
+        best_count = 0
+        available = []
+
+        uncovered = ~covered & self.full
+        while uncovered:
+            low = uncovered & -uncovered
+            uncovered ^= low
+            mask = self.blockers[low.bit_length() - 1] & ~forbidden
+            count = bin(mask).count("1")
+
+            # this shot can not be blocked anymore, no need to look further
+            if count == 0:
+                return (0, 0)
+
+            if best == None or count < best_count:
+                best = mask
+                best_count = count
+            available.append((count, mask))
+
+        if best == None:
+            return (None, 0)
+        return (best, self.lower_bound(available))
+
+    def last_blockers(self, covered, forbidden):
+        """
+        Finds the compatible defenders blocking every remaining shot on their own (at least one
+        shot must remain).
+
+        :param covered: The shots already blocked.
+
+        :param forbidden: The defenders that can not be selected anymore.
+
+        :return: The numerical representation of these defenders (0 if there is none).
+        """
+        mask = ~forbidden
+        uncovered = ~covered & self.full
+        while uncovered and mask:
+            low = uncovered & -uncovered
+            uncovered ^= low
+            mask &= self.blockers[low.bit_length() - 1]
+        return mask
+
+    def lower_bound(self, available):
+        """
+        Computes a lower bound of the number of defenders needed to block the remaining shots.
+        Shots are taken from the one with the fewest compatible blockers, and kept if none of
+        their blockers blocks a shot already kept: the kept shots need pairwise different
+        defenders. The bound is the maximum of this number and the number of remaining shots
+        divided by the maximum degree of the graph.
+
+        :param available: For each uncovered shot, a tuple (count, mask) of its number of \
+        compatible blockers and of these blockers.
+
+        :return: The lower bound.
+        """
+        available.sort(key=lambda x: x[0])
+
+        used = 0
+        packing = 0
+        for _, mask in available:
+            if mask & used == 0:
+                used |= mask
+                packing += 1
+
+        degree = -(-len(available) // max(1, self.graph.max_deg))
+        return max(packing, degree)
+
+    def solve_(self, selected, covered, forbidden):
+        """
+        Explores every solution containing the selected defenders (recursively) and stores
+        the best one in self.best.
+
+        :param selected: The indices of the selected defenders.
+
+        :param covered: The shots blocked by the selected defenders.
+
+        :param forbidden: The defenders that can not be selected (colliding with a selected one, \
+        or already explored in a previous branch).
+
+        :return: returns nothing.
+        """
+        self.count("nodes")
+
+        # every shot is blocked, this is the best solution so far (otherwise it would have been pruned)
+        if covered == self.full:
+            self.best = selected.copy()
+            return
+
+        # only a solution with a single additional defender would be better than the current one,
+        # no need to branch: this defender must block every remaining shot
+        if self.best != None and len(selected) + 2 == len(self.best):
+            mask = self.last_blockers(covered, forbidden)
+            if mask != 0:
+                selected.append((mask & -mask).bit_length() - 1)
+                self.best = selected.copy()
+                del selected[-1]
+            return
+
+        mask, bound = self.candidates(covered, forbidden)
+
+        # a shot can not be blocked anymore
+        if mask == 0:
+            self.count("collision_pruned")
+            return
+
+        # even the best completion of this set is not better than the current solution
+        if self.best != None and len(selected) + max(1, bound) >= len(self.best):
+            self.count("bound_pruned")
+            return
+
+        # the blockers of the chosen shot, the ones blocking the most remaining shots first
+        # (the first solution found is then close to the greedy one)
+        candidates = []
+        while mask:
+            low = mask & -mask
+            mask ^= low
+            i = low.bit_length() - 1
+            candidates.append((-bin(self.covers[i] & ~covered).count("1"), i))
+        candidates.sort()
+
+        for _, i in candidates:
+            selected.append(i)
+            self.solve_(selected, covered | self.covers[i], forbidden | self.graph.conflicts[i])
+            del selected[-1]
+
+            # the solutions with this defender have all been explored
+            forbidden |= 1 << i
+
+            # a smaller solution may have been found, the bound is checked again (a solution
+            # as small as the lower bound is a minimum one, the search is over)
+            if self.best != None and (len(selected) + max(1, bound) >= len(self.best) or
+                                      len(self.best) <= self.root_bound):
+                self.count("bound_pruned")
+                return
+
+    def solve(self, params):
+        """
+        Finds a minimum dominating set for the given graph. The search is exhaustive (it has an
+        exponential complexity), the solution returned is therefore a minimum one.
+
+        :param params: A SolverArgs object (the compare function is not used, the order of \
+        the defenders does not matter).
+
+        :return: a list of defender that is a dominating set, None if there is none.
+        """
+        self.stats = {}
+        self.best = None
+
+        # the shots blocked by each defender and the defenders blocking each shot
+        bounds = LowerBound(self.graph)
+        self.covers = bounds.covers
+        self.blockers = bounds.blockers
+
+        self.root_bound = bounds.compute()
+        if self.root_bound != math.inf:
+            self.solve_([], 0, 0)
+
+        res = self.graph.index_list_to_defenders(self.best)
+        return self.report(res, len(res) if res != None else math.inf)
+
+    def sort(self, compare_func):
+        """
+        Sorts the graph's defenders according to their degrees.
+
+        :param compare_func: Used to know how to compare degrees.
+        """
+        arrays = [self.graph.deg, self.graph.defenders, self.graph.edges]
+        self.graph.bubble_sort(arrays, compare_func)
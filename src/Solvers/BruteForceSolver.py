@@ -2,7 +2,11 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 
+import math
 from src.Solvers.Solver import Solver
+from src.Solvers.GreedySolver import GreedySolver
+from src.Utils.LowerBound import LowerBound
+from src.Utils.TranspositionTable import TranspositionTable
 
 """
 BruteForce solver for a given problem.
@@ -12,6 +16,21 @@ class BruteForceSolver(Solver):
 
     """
     BruteForce solver for a given problem.
+
+    The search looks for a dominating set of at most a given size. The solution of the greedy
+    solver is found first, then sets smaller than the best solution found so far are searched
+    for until there is none (or until the best solution reaches the lower bound given by the
+    greedy solver, see Solver.report). The sizes are only searched upward from the lower bound
+    if the greedy solver finds no solution.
+
+    A state of the search is the set of blocked shots and the index of the next defender to
+    try. The states leading to no solution are stored in a transposition table (see
+    TranspositionTable.py) with the number of defenders that could still be added and the
+    defenders that could not: a state reached again with at most as many defenders to add and
+    at least the same forbidden defenders is not explored again, during the same search or the
+    next ones (smaller sizes).
+
+    :ivar memo: The transposition table of the last search.
     """
 
     def __init__(self, graph):
@@ -21,18 +40,20 @@ class BruteForceSolver(Solver):
         :param graph: The graph the solver will have to find a minimum dominating set in.
         """
         super().__init__(graph)
+        self.memo = None
 
-    def solve_(self, size, defenders_list=[], index=0, dominant_value=0, max_possible_deg=0):
+    def solve_(self, size, defenders_list=[], index=0, dominant_value=0, max_possible_deg=0, forbidden=0):
         """
         Solves the problem recursively. It is a brute force algorithm with slight improvements. 
 
         - If there is a collision with the current defender and a selected one, skip 
         - If a solution is found, stop looking for new solutions 
+        - If the state has already been found to lead nowhere, skip (see above)
 
-        It basically checks if every subset of the set of defender of size 'size' is a dominant 
-        set of the shot set. 
+        It basically checks if every subset of the set of defender of size at most 'size' is a 
+        dominant set of the shot set. 
 
-        :param size: The size of the subset to find (faster, especially if you have an intuition or \
+        :param size: The maximum size of the subset to find (faster, especially if you have an intuition or \
         are looking for a specific kind of solution). 
 
         :param defenders_list: The list of defenders that are selected at any given point. To be more \
@@ -51,21 +72,31 @@ class BruteForceSolver(Solver):
         is n, then this variable will be equal to: \
         deg(def10) + deg(def16) + def(def25) + (n - 3) * max_deg(graph) 
 
+        :param forbidden: The numerical representation of the defenders colliding with the selected \
+        defenders (see Graph.forbidden_mask). 
+
         :return: None if there isn't any solution, the list of indexes otherwise. 
         """
 
-        # If there isn't any more defender to add and the size of the team is still
-        # not valid, return None (obviously we don't go further as
-        # there aren't any defender to add next)
-        if index == len(self.graph.defenders) and size != 0:
+        self.count("nodes")
+
+        # If the current set is a dominant set, return the list
+        if dominant_value == self.graph.dominant_value:
+            return defenders_list.copy()
+
+        # If the team is full or if there isn't any more defender to add, return None 
+        # (obviously we don't go further as no defender can be added)
+        if size == 0 or index == len(self.graph.defenders):
             return None
 
-        # If the team is full, check if this is a dominant set, if so
-        # return the list, otherwise return None (not going further because
-        # we need to remove the last added defender, to add the next one)
-        if size == 0:
-            if dominant_value == self.graph.dominant_value:
-                return defenders_list.copy()
+        # If this state (or a state with more defenders to add and fewer forbidden ones)
+        # already led nowhere, so does this one. The defenders before index can not be
+        # added anymore, only the next ones matter
+        key = (dominant_value, index)
+        next_forbidden = forbidden >> index
+        dead = self.memo.get(key)
+        if dead != None and dead[0] >= size and next_forbidden & dead[1] == dead[1]:
+            self.count("memo_hits")
             return None
 
         # If the team isn't full and there are defenders to add
@@ -87,9 +118,10 @@ class BruteForceSolver(Solver):
                     index += 1
                     continue
  
-                # Collision detection (should be done an other way preferably
-                # for this is not so efficient)
-                if not self.graph.valid_defender(defenders_list, index):
+                # Collision detection, a single and with the defenders colliding
+                # with the selected ones
+                if not self.graph.valid_defender_mask(forbidden, index):
+                    self.count("collision_pruned")
                     index += 1
                     continue
 
@@ -114,7 +146,8 @@ class BruteForceSolver(Solver):
                 # New defender added and solution checking
                 defenders_list.append(index)
                    
-                res = self.solve_(size-1, defenders_list, index+1, tmp_dominant_value, tmp_max_possible_deg)
+                res = self.solve_(size-1, defenders_list, index+1, tmp_dominant_value, tmp_max_possible_deg,
+                                  forbidden | self.graph.conflicts[index])
 
                 # Remove current defender and go to the next one
                 del defenders_list[-1]
@@ -126,6 +159,7 @@ class BruteForceSolver(Solver):
                 index += 1
 
         # If the previous defender didn't yield any valid solution, return None
+        self.memo.store(key, (size, next_forbidden))
         return None
 
     def solve(self, params):
@@ -134,18 +168,55 @@ class BruteForceSolver(Solver):
         it has to be a minimum one. This algorithm has an exponential complexity. 
 
         :param params: A SolverArgs object storing different values to modify the behavior of \
-        the solving algorithm. 
+        the solving algorithm (brute_memo_size is the maximum size of the transposition table). 
 
         :return: a list of defender that is a dominating set, None otherwise.
         """
         
+        self.stats = {}
+
+        # the solution of the greedy solver and a lower bound of the size of a minimum
+        # dominating set (see LowerBound.py), before the defenders are sorted
+        greedy = GreedySolver(self.graph)
+        res = greedy.solve(params)
+        lower_bound = greedy.stats["lower_bound"]
+        if lower_bound == math.inf:
+            return self.report(None, lower_bound)
+
+        # the greedy solution is a minimum one
+        if res != None:
+            self.count("greedy_defenders", len(res))
+            if len(res) == lower_bound:
+                return self.report(res, lower_bound)
+
+        # the search is long anyway, the linear relaxation may give a tighter bound
+        lower_bound = max(lower_bound, LowerBound(self.graph).compute())
+        if lower_bound == math.inf or (res != None and len(res) == lower_bound):
+            return self.report(res, lower_bound)
+
         # sorts the list of defenders given a compare func
         self.sort(params.compare_func)
 
-        res = None
+        self.memo = TranspositionTable(params.brute_memo_size)
+
+        # the shots blocked by no defender (only the leading 1 of the edges)
+        start = (self.graph.dominant_value + 1) // 2
+
+        # downward search from the greedy solution, a smaller set is searched for until
+        # there is none or the lower bound is reached
+        if res != None:
+            while len(res) > lower_bound:
+                smaller = self.solve_(len(res) - 1, [], 0, start, 0, 0)
+
+                # if no valid result has been found, the current one is a minimum one
+                if smaller == None:
+                    break
+                res = self.graph.index_list_to_defenders(smaller)
+            self.count("memo_evictions", self.memo.evictions)
+            return self.report(res, len(res))
 
         # iterative search for a minimum dominating set
-        for i in range(1, len(self.graph.opponents) + 10):
+        for i in range(lower_bound, len(self.graph.opponents) + 10):
 
             # if a solution of this size is impossible, go to the next step
             # here, if DELTA(G) * i < nb_shots then there are no solution
@@ -156,12 +227,16 @@ class BruteForceSolver(Solver):
                 continue
             
             # try to solve for this size of dominating set
-            res = self.solve_(i, [], 0, 0, 0)
+            res = self.solve_(i, [], 0, start, 0, 0)
 
             # if a valid result has been found, return it
             if res != None:
                 break
-        return self.graph.index_list_to_defenders(res) if res != None else res
+
+            # there is no solution of this size
+            lower_bound = i + 1
+        self.count("memo_evictions", self.memo.evictions)
+        return self.report(self.graph.index_list_to_defenders(res), len(res) if res != None else lower_bound)
 
     def sort(self, compare_func):
         """
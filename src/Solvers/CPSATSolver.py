@@ -0,0 +1,117 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import math
+from src.Solvers.Solver import Solver
+from src.Utils.CoverModel import CoverModel
+
+# ortools is optional, it is only required by this solver
+try:
+    from ortools.sat.python import cp_model
+except ImportError:
+    cp_model = None
+
+"""
+Constraint programming solver for a given problem.
+"""
+
+class CPSATSolver(Solver):
+
+    """
+    Solver writing the problem as a constraint program (see CoverModel) solved by the CP-SAT
+    solver of OR-Tools, with a boolean per defender: the defenders blocking a shot form a clause
+    (at least one of them is selected), the defenders of a clique of colliding defenders form an
+    at-most-one constraint and the number of selected defenders is minimized.
+
+    For goal keeper problems, the number of selected defenders in the goalkeeper area can be
+    bounded as well (sat_goalkeeper). CP-SAT runs several search strategies in parallel
+    (sat_workers), and once stopped (sat_timeout) the best solution found so far is returned
+    with the proven lower bound (see Solver.report).
+    """
+
+    def __init__(self, graph):
+        """
+        Creates a new CPSATSolver object.
+
+        :param graph: The graph to find a minimum dominating set in.
+        """
+        super().__init__(graph)
+
+    def build(self, model, params):
+        """
+        Builds the constraint program.
+
+        :param model: The CoverModel of the graph.
+
+        :param params: A SolverArgs object (sat_goalkeeper is used).
+
+        :return: A tuple (program, variables), the CpModel object and its boolean per defender.
+        """
+        program = cp_model.CpModel()
+        variables = [program.NewBoolVar("d" + str(i)) for i in range(model.nb_def)]
+
+        # every shot is blocked by at least one selected defender
+        for blockers in model.blockers():
+            program.AddBoolOr([variables[i] for i in blockers])
+
+        # at most one defender of each clique of colliding defenders
+        cliques = model.conflict_cliques()
+        self.count("collision_constraints", len(cliques))
+        for clique in cliques:
+            program.AddAtMostOne([variables[i] for i in clique])
+
+        # the number of defenders in the goalkeeper area (only for goal keeper problems)
+        area = self.graph.problem["goalkeeper_area"]
+        if params.sat_goalkeeper != None and area != None:
+            low, high = params.sat_goalkeeper
+            inside = model.defenders_in_area(self.graph.problem["gk_bottom_left"], self.graph.problem["gk_top_right"])
+            program.Add(sum(variables[i] for i in inside) >= low)
+            program.Add(sum(variables[i] for i in inside) <= high)
+
+        program.Minimize(sum(variables))
+        return (program, variables)
+
+    def solve(self, params):
+        """
+        Solves the constraint program of the graph.
+
+        :param params: A SolverArgs object, sat_timeout, sat_workers and sat_goalkeeper are used.
+
+        :return: A list of defenders dominating the graph (a minimum one if it reaches the lower bound), None \
+        if there is none or if none has been found in time.
+        """
+        if cp_model == None:
+            raise ImportError("CPSATSolver requires ortools (pip install ortools)")
+
+        self.stats = {}
+
+        model = CoverModel(self.graph)
+        program, variables = self.build(model, params)
+
+        solver = cp_model.CpSolver()
+        solver.parameters.num_workers = params.sat_workers
+        if params.sat_timeout != None:
+            solver.parameters.max_time_in_seconds = params.sat_timeout
+
+        status = solver.Solve(program)
+
+        # 1 if the solution is proven to be a minimum one (or proven not to exist)
+        self.stats["optimal"] = 1 if status in (cp_model.OPTIMAL, cp_model.INFEASIBLE) else 0
+        if status == cp_model.INFEASIBLE:
+            return self.report(None, math.inf)
+        if status != cp_model.FEASIBLE and status != cp_model.OPTIMAL:
+            return self.report(None)
+
+        selected = [i for i in range(model.nb_def) if solver.Value(variables[i])]
+        return self.report(self.graph.index_list_to_defenders(selected),
+                           int(math.ceil(solver.BestObjectiveBound() - 1e-6)))
+
+    def sort(self, compare_func):
+        """
+        Sorts the graph's defenders according to their degrees.
+
+        :param compare_func: Used to know how to compare degrees.
+        """
+        arrays = [self.graph.deg, self.graph.defenders, self.graph.edges]
+        self.graph.bubble_sort(arrays, compare_func)
@@ -0,0 +1,112 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import math
+from src.Solvers.Solver import Solver
+from concurrent.futures import ProcessPoolExecutor
+
+"""
+Solver splitting a graph into independent parts, solved separately.
+"""
+
+def solve_component(solver, graph, indices, params):
+    """
+    Solves a component of a graph (possibly executed by a worker process).
+
+    :param solver: The class of the solver to use.
+
+    :param graph: The graph of the component (see Graph.subgraph).
+
+    :param indices: For each defender of the component, its index in the whole graph.
+
+    :param params: A SolverArgs object given to the solver.
+
+    :return: A tuple (res, stats), res being the indices (in the whole graph) of the selected \
+    defenders (None if no solution has been found) and stats the statistics of the solver.
+    """
+    # the solver may sort the defenders, they are identified by their positions
+    positions = {(d.pos.x, d.pos.y): indices[k] for k, d in enumerate(graph.defenders)}
+
+    s = solver(graph)
+    res = s.solve(params)
+    return (None if res == None else [positions[(d.pos.x, d.pos.y)] for d in res], s.stats)
+
+class ComponentSolver(Solver):
+
+    """
+    This solver splits the graph into its independent parts (see Graph.components) and solves
+    each of them with another solver. When the opponents are far from each other, the graph
+    is made of several small graphs, and the exponential solvers are much faster on each of
+    them than on the whole graph. If the solver finds minimum dominating sets of the components,
+    their union is a minimum dominating set of the graph.
+
+    :ivar solver: The class of the solver used on each component.
+
+    :ivar workers: The number of processes solving the components (the arguments of the solver \
+    are sent to these processes, they must not contain lambda functions).
+    """
+
+    def __init__(self, graph, solver, workers=1):
+        """
+        Creates a new ComponentSolver object.
+
+        :param graph: The graph to find a minimum dominating set in.
+
+        :param solver: The class of the solver to use on each component (BruteForceSolver...).
+
+        :param workers (opt): The number of processes solving the components (default: 1).
+        """
+        super().__init__(graph)
+        self.solver = solver
+        self.workers = workers
+
+    def solve(self, params):
+        """
+        Solves every component, then merges the results.
+
+        :param params: A SolverArgs object given to the solver of each component.
+
+        :return: A list of defenders dominating the graph, None if a component has no solution \
+        (or if the solver found none).
+        """
+        self.stats = {}
+
+        components = self.graph.components()
+        self.count("components", len(components))
+
+        graphs = []
+        indices = []
+        for defenders, shots in components:
+
+            # a shot that no defender blocks
+            if len(defenders) == 0:
+                return self.report(None, math.inf)
+
+            graphs.append(self.graph.subgraph(defenders, shots))
+            indices.append(defenders)
+
+        n = len(graphs)
+        if self.workers > 1 and n > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(solve_component, [self.solver] * n, graphs, indices, [params] * n))
+        else:
+            results = [solve_component(self.solver, graphs[k], indices[k], params) for k in range(n)]
+
+        # the lower bounds of the components add up (see Solver.report)
+        res = []
+        for selected, stats in results:
+            for key in stats:
+                self.count(key, stats[key])
+            if selected == None:
+                return self.report(None, lower_bound=self.stats.get("lower_bound"))
+            res.extend(selected)
+        return self.report(self.graph.index_list_to_defenders(sorted(res)), lower_bound=self.stats.get("lower_bound"))
+
+    def sort(self, compare_func):
+        """
+        Does nothing, each component is sorted by its own solver.
+
+        :param compare_func: Not used.
+        """
+        pass
@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from src.Solvers.Solver import Solver
 from src.Solvers.RandomSolver import RandomSolver
 from src.Solvers.SolverArgs import SolverArgs
+from src.Utils.BitMatrix import BitMatrix
 
 
 """
@@ -86,6 +87,15 @@ class GreedySolver(Solver):
         :param edges: The matrix of defenders x shots.
         """
 
+        # with a packed matrix, the whole computation is done at once for all defenders
+        # (there is no leading 1 here, hence the + 1 for max_current)
+        if isinstance(edges, BitMatrix):
+            edges.andnot(edges.rows(index).copy())
+            counts = edges.popcount()
+            self.max_uncovered = int(counts.argmax())
+            self.max_current = int(counts[self.max_uncovered]) + 1
+            return
+
         # the value of the removed defender
         val1 = edges[index]
 
@@ -146,6 +156,9 @@ class GreedySolver(Solver):
         such set have been found.
         """
 
+        # the defenders colliding with the selected ones
+        forbidden = self.graph.forbidden_mask(def_list)
+
         # while there are still some defenders available
         # try to find a dominant set
         depth = 0
@@ -162,7 +175,8 @@ class GreedySolver(Solver):
 
             # if the current defender with maximum degree is not valid,
             # for example colliding with another defender, skip
-            if not self.graph.valid_defender(def_list, self.max_uncovered):
+            if not self.graph.valid_defender_mask(forbidden, self.max_uncovered):
+                self.count("collision_pruned")
                 depth += 1
                 continue
 
@@ -170,6 +184,7 @@ class GreedySolver(Solver):
             # dominant value accordingly
             def_list.append(self.max_uncovered)
             dom_val = dom_val | edges[self.max_uncovered]
+            forbidden |= self.graph.conflicts[self.max_uncovered]
 
             # remove all the blocked shots from the graph
             self.max_current = 0
@@ -252,6 +267,10 @@ class GreedySolver(Solver):
 
         :return: True if there exists at least one dominating set in the graph.
         """
+        # with a packed matrix, all the rows are or-ed at once
+        if isinstance(edges, BitMatrix):
+            return edges.is_full(edges.or_rows() | edges.words_from_int(dom_val))
+
         s = dom_val
         for e in edges:
             s = s | e
@@ -270,9 +289,11 @@ class GreedySolver(Solver):
         exist/could be found.
         """
 
+        self.stats = {}
+
         # if there are no solution at all, we can stop here
         if not self.has_solution(self.graph.edges, 0):
-            return None
+            return self.report(None)
 
         # creates a copy of the edges of the graph because they
         # are going to be modified
@@ -300,8 +321,8 @@ class GreedySolver(Solver):
 
                 # solve with random solver
                 solver = RandomSolver(self.graph)
-                return solver.solve(random_args)
-            return None
+                return self.report(solver.solve(random_args))
+            return self.report(None)
 
         # if a solution has been found, it is possible that some node
         # are actually useless wrt the other nodes
@@ -310,8 +331,8 @@ class GreedySolver(Solver):
         while changed:
             res, changed = self.purge(res, self.graph.edges)
 
-        # return the list of defenders
-        return self.graph.index_list_to_defenders(res)
+        # return the list of defenders (with the lower bound of the size of a minimum one)
+        return self.report(self.graph.index_list_to_defenders(res))
 
     def sort(self, compare_func):
         """
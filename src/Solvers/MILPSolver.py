@@ -0,0 +1,117 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import math
+import numpy as np
+from src.Solvers.Solver import Solver
+from src.Utils.CoverModel import CoverModel
+
+# scipy is optional, it is only required by this solver
+try:
+    from scipy.optimize import milp, Bounds, LinearConstraint
+    from scipy.sparse import csr_matrix
+except ImportError:
+    milp = None
+
+"""
+Mixed integer programming solver for a given problem.
+"""
+
+class MILPSolver(Solver):
+
+    """
+    Solver writing the problem as an integer linear program (see CoverModel) solved by HiGHS
+    through scipy.optimize.milp: minimize the number of selected defenders, such that every shot
+    is blocked by at least one of them and at most one defender of each clique of colliding
+    defenders (or of each colliding pair) is selected.
+
+    The search can be limited in time. Once stopped, the best solution found so far is returned
+    and the statistics of the solver give the proven lower bound (see Solver.report), the solution
+    is a minimum one if both are equal.
+    """
+
+    def __init__(self, graph):
+        """
+        Creates a new MILPSolver object.
+
+        :param graph: The graph to find a minimum dominating set in.
+        """
+        super().__init__(graph)
+
+    def constraints(self, model, cliques):
+        """
+        Builds the constraints of the program.
+
+        :param model: The CoverModel of the graph.
+
+        :param cliques: True to use the cliques of colliding defenders, False to use the pairs.
+
+        :return: A list of LinearConstraint objects.
+        """
+        res = []
+
+        # every shot is blocked: sum of the defenders blocking it >= 1
+        coverage = csr_matrix((np.ones(len(model.shots)), (model.shots, model.defenders)),
+                              shape=(model.nb_shots, model.nb_def))
+        res.append(LinearConstraint(coverage, 1, np.inf))
+
+        # collisions: sum of the defenders of a clique (or a pair) <= 1
+        groups = model.conflict_cliques() if cliques else model.conflict_pairs()
+        self.count("collision_constraints", len(groups))
+        if len(groups) > 0:
+            rows = np.repeat(np.arange(len(groups)), [len(g) for g in groups])
+            columns = np.concatenate([np.array(g, dtype=np.int64) for g in groups])
+            collisions = csr_matrix((np.ones(len(columns)), (rows, columns)), shape=(len(groups), model.nb_def))
+            res.append(LinearConstraint(collisions, -np.inf, 1))
+        return res
+
+    def solve(self, params):
+        """
+        Solves the integer program of the graph.
+
+        :param params: A SolverArgs object, milp_timeout and milp_cliques are used.
+
+        :return: A list of defenders dominating the graph (a minimum one if it reaches the lower bound), None \
+        if there is none or if none has been found in time.
+        """
+        if milp == None:
+            raise ImportError("MILPSolver requires scipy (pip install scipy)")
+
+        self.stats = {}
+
+        model = CoverModel(self.graph)
+
+        # nothing to block
+        if model.nb_shots == 0:
+            return self.report([], 0)
+
+        # a shot no defender blocks, the program has no solution
+        if len(np.unique(model.shots)) < model.nb_shots:
+            return self.report(None, math.inf)
+
+        options = {"disp": False}
+        if params.milp_timeout != None:
+            options["time_limit"] = params.milp_timeout
+
+        res = milp(np.ones(model.nb_def), integrality=np.ones(model.nb_def), bounds=Bounds(0, 1),
+                   constraints=self.constraints(model, params.milp_cliques), options=options)
+
+        # 1 if the solution is proven to be a minimum one (or proven not to exist)
+        self.stats["optimal"] = 1 if res.status in (0, 2) else 0
+        if res.status == 2:
+            return self.report(None, math.inf)
+        if res.x is None:
+            return self.report(None)
+
+        selected = [i for i in range(model.nb_def) if res.x[i] > 0.5]
+        return self.report(self.graph.index_list_to_defenders(selected), int(math.ceil(res.mip_dual_bound - 1e-6)))
+
+    def sort(self, compare_func):
+        """
+        Sorts the graph's defenders according to their degrees.
+
+        :param compare_func: Used to know how to compare degrees.
+        """
+        arrays = [self.graph.deg, self.graph.defenders, self.graph.edges]
+        self.graph.bubble_sort(arrays, compare_func)
@@ -0,0 +1,228 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import copy
+import bisect
+from src.Solvers.Solver import Solver
+from src.Utils.Graph import Graph
+from src.Utils.Point import Point
+from src.Utils.Vector import Vector
+
+"""
+Solver working on a coarse version of the problem first, then refining its solution.
+"""
+
+class MultiResolutionSolver(Solver):
+
+    """
+    This solver never computes the whole graph of the problem, which is what is slow when
+    pos_step is small. It first solves the same problem with a pos_step factor times bigger
+    (the positions of this coarse lattice are positions of the requested lattice), then computes
+    the graph of the requested lattice only around the selected defenders: the positions closer
+    than window coarse steps to a selected defender, and the positions along the sides of the
+    triangles going through it (up to twice this distance), since the useful defenders are on
+    these sides (see Graph.point_in_triangles). This graph is solved with the same solver.
+
+    The result is the smallest of the refined solution and of the coarse solution (the coarse
+    defenders are on the requested lattice too). Both only contain defenders of the requested
+    lattice. If the coarse problem has no solution, the whole graph is computed.
+
+    :ivar problem: The problem to solve.
+
+    :ivar solver: The class of the solver used on both graphs (GreedySolver, RandomSolver...).
+
+    :ivar factor: The ratio between the coarse pos_step and the requested one.
+
+    :ivar window: The size of the neighbourhoods, in coarse steps.
+
+    :ivar graph_args: The arguments given to the graphs (optimized, engine...).
+
+    :ivar coarse: The graph of the coarse problem (None until solve is called).
+    """
+
+    def __init__(self, problem, solver, factor=4, window=2, graph_args=None):
+        """
+        Creates a new MultiResolutionSolver object. The graph of the solver is the refined
+        graph, it is only computed by solve.
+
+        :param problem: The problem to solve.
+
+        :param solver: The class of the solver to use on both graphs.
+
+        :param factor (opt): The ratio between the coarse pos_step and the requested one (default: 4).
+
+        :param window (opt): The size of the neighbourhoods, in coarse steps (default: 2).
+
+        :param graph_args (opt): A dictionnary of arguments given to the graphs (default: None, \
+        the default arguments of Graph).
+        """
+        super().__init__(None)
+        self.problem = problem
+        self.solver = solver
+        self.factor = factor
+        self.window = window
+        self.graph_args = graph_args if graph_args != None else {}
+        self.coarse = None
+
+    def coarse_problem(self):
+        """
+        Creates the coarse version of the problem (everything is the same except pos_step).
+
+        :return: The new Problem object.
+        """
+        res = copy.copy(self.problem)
+        res.inputs = dict(self.problem.inputs)
+        res.inputs["pos_step"] = self.problem["pos_step"] * self.factor
+        return res
+
+    def region(self, defenders, xs, ys):
+        """
+        Computes the positions of the requested lattice around some defenders (see above).
+
+        :param defenders: The list of defenders (of the coarse graph).
+
+        :param xs: The x coordinates of the requested lattice.
+
+        :param ys: The y coordinates of the requested lattice.
+
+        :return: The set of positions, as tuples (i, j) (see Graph.cells).
+        """
+        window = self.window * self.problem["pos_step"] * self.factor
+        margin = self.problem["radius"] + Graph.tolerance
+
+        # the lines of the sides of the triangles
+        lines = []
+        for triangle in self.coarse.triangles:
+            apex = triangle.points[0]
+            for post in triangle.points[1:]:
+                v = Vector.v_from_pp(apex, post)
+                if v.norm() != 0:
+                    lines.append((apex, v.normalize()))
+
+        res = set()
+        for defender in defenders:
+            p = defender.pos
+
+            # the sides going through the neighbourhood of the defender
+            near = [(apex, v) for apex, v in lines
+                    if abs(v.x * (p.y - apex.y) - v.y * (p.x - apex.x)) <= window]
+
+            for i in range(bisect.bisect_left(xs, p.x - 2 * window), bisect.bisect_right(xs, p.x + 2 * window)):
+                for j in range(bisect.bisect_left(ys, p.y - 2 * window), bisect.bisect_right(ys, p.y + 2 * window)):
+                    dst = p.distance(Point(xs[i], ys[j]))
+                    if dst <= window:
+                        res.add((i, j))
+                    elif dst <= 2 * window:
+                        for apex, v in near:
+                            if abs(v.x * (ys[j] - apex.y) - v.y * (xs[i] - apex.x)) <= margin:
+                                res.add((i, j))
+                                break
+        return res
+
+    def snap(self, defenders, xs, ys):
+        """
+        Finds the defenders of the refined graph placed at the positions of some defenders of
+        the coarse graph.
+
+        :param defenders: The list of defenders (of the coarse graph).
+
+        :param xs: The x coordinates of the requested lattice.
+
+        :param ys: The y coordinates of the requested lattice.
+
+        :return: The list of indices in the refined graph, None if one of them is not in it.
+        """
+        indices = {}
+        for k in range(len(self.graph.defenders)):
+            pos = self.graph.defenders[k].pos
+            indices[(pos.x, pos.y)] = k
+
+        # the closest position of the requested lattice
+        step = self.problem["pos_step"]
+        res = []
+        for defender in defenders:
+            p = defender.pos
+            i = min(len(xs) - 1, max(0, round((p.x - xs[0]) / step)))
+            j = min(len(ys) - 1, max(0, round((p.y - ys[0]) / step)))
+            pos = Point(xs[i], ys[j])
+            if (pos.x, pos.y) not in indices:
+                return None
+            res.append(indices[(pos.x, pos.y)])
+        return res
+
+    def is_solution(self, indices):
+        """
+        Checks if some defenders of the refined graph dominate it without colliding.
+
+        :param indices: The indices of the defenders.
+
+        :return: True if they are a valid solution, False otherwise.
+        """
+        dom_val = 0
+        for k in range(len(indices)):
+            if not self.graph.valid_defender_mask(self.graph.forbidden_mask(indices[:k]), indices[k]):
+                return False
+            dom_val |= self.graph.edges[indices[k]]
+        return dom_val == self.graph.dominant_value
+
+    def solve(self, params):
+        """
+        Solves the coarse problem, then refines the solution (see above).
+
+        :param params: A SolverArgs object given to the solver (for both graphs).
+
+        :return: A list of defenders of the requested lattice dominating the graph, None if no \
+        solution has been found.
+        """
+        self.stats = {}
+
+        self.coarse = Graph(self.coarse_problem(), **self.graph_args)
+        self.count("coarse_defenders", len(self.coarse.defenders))
+
+        s = self.solver(self.coarse)
+        coarse_res = s.solve(params)
+        for key in s.stats:
+            self.count("coarse_" + key, s.stats[key])
+
+        bottom_left = self.problem["bottom_left"]
+        top_right = self.problem["top_right"]
+        step = self.problem["pos_step"]
+        xs = [Point(x, 0).x for x in self.coarse.lattice(bottom_left.x, top_right.x, step)]
+        ys = [Point(0, y).y for y in self.coarse.lattice(bottom_left.y, top_right.y, step)]
+
+        # the requested lattice, only around the coarse solution
+        cells = None
+        if coarse_res != None:
+            cells = self.region(coarse_res, xs, ys)
+        self.graph = Graph(self.problem, cells=cells, **self.graph_args)
+        self.count("refined_defenders", len(self.graph.defenders))
+
+        # the coarse solution, on the requested lattice
+        snapped = None
+        if coarse_res != None:
+            snapped = self.snap(coarse_res, xs, ys)
+            if snapped != None and not self.is_solution(snapped):
+                snapped = None
+            snapped = self.graph.index_list_to_defenders(snapped)
+
+        s = self.solver(self.graph)
+        res = s.solve(params)
+        for key in s.stats:
+            if key not in Solver.bound_keys:
+                self.count(key, s.stats[key])
+
+        if res == None or (snapped != None and len(snapped) < len(res)):
+            res = snapped
+
+        # the lower bound of the refined graph is only a lower bound of the problem if the
+        # whole graph has been computed
+        return self.report(res, s.stats.get("lower_bound", 0) if cells == None else 0)
+
+    def sort(self, compare_func):
+        """
+        Does nothing, each graph is sorted by the solver.
+
+        :param compare_func: Not used.
+        """
+        pass
@@ -42,6 +42,8 @@ class RandomSolver(Solver):
         found, None otherwise.
         """
 
+        self.stats = {}
+
         # if the compare_function is defined, sort the graph with it
         if params.compare_func != None:
             self.sort(params.compare_func)
@@ -52,7 +54,8 @@ class RandomSolver(Solver):
                           params.random_timeout, 
                           params.random_perm)
 
-        return self.graph.index_list_to_defenders(res)
+        # the solution, with the lower bound of the size of a minimum one
+        return self.report(self.graph.index_list_to_defenders(res))
 
     def solve_(self, tries, i_m, prob, timeout, perm=None):
         """
@@ -193,6 +196,9 @@ class RandomSolver(Solver):
         # current iteration
         index = 0
 
+        # the defenders colliding with the current set
+        forbidden = 0
+
         # while the current set is not dominant
         while coloration != self.graph.dominant_value:
             
@@ -207,12 +213,14 @@ class RandomSolver(Solver):
                 index = 0
                 s = []
                 coloration = 0
+                forbidden = 0
 
             # get the current defender
             p_i = permutation[index]
 
             # if it collides with a previous defender, go to the next one
-            if not self.graph.valid_defender(s, p_i):
+            if not self.graph.valid_defender_mask(forbidden, p_i):
+                self.count("collision_pruned")
                 p.append(p_i)
                 index += 1
                 continue
@@ -238,6 +246,12 @@ class RandomSolver(Solver):
                 s.append(p_i)
                 coloration = new_coloration
 
+                # some defenders may have been removed, the collisions are computed again
+                if to_delete != []:
+                    forbidden = self.graph.forbidden_mask(s)
+                else:
+                    forbidden |= self.graph.conflicts[p_i]
+
             # otherwise, do not add it
             else:
                 p.append(p_i)
@@ -1,3 +1,10 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import math
+from src.Utils.LowerBound import LowerBound
+
 """
 This class is just the generic representation of a Solver. It clearly has
 no use as such but allows for a simple documentation.
@@ -21,8 +28,15 @@ class Solver:
     is done because different arrays of the graph are linked (for example the index i of 
     array A, specifically corresponds to the index i of array B). This could be solved by
     adding some classes, for now this isn not solved. 
+
+    Once a solver is done, its statistics give the size of the solution found ("best") and a proven
+    lower bound of the size of a minimum one ("lower_bound", see report). Both are sums over the
+    components of a graph (see ComponentSolver), a solution is a minimum one when they are equal.
     """
 
+    # the statistics about the size of the solution (see report)
+    bound_keys = ("best", "lower_bound")
+
     def __init__(self, graph):
         """
         Creates a new Solver object. 
@@ -31,6 +45,39 @@ class Solver:
         """
         self.graph = graph
 
+        # statistics about the last search (number of nodes explored, of branches pruned...)
+        # the keys depend on the solver
+        self.stats = {}
+
+    def count(self, key, value=1):
+        """
+        Increments a statistic of the solver. 
+
+        :param key: The name of the statistic.
+
+        :param value (opt): The value to add (default: 1).
+        """
+        self.stats[key] = self.stats.get(key, 0) + value
+
+    def report(self, res, lower_bound=None):
+        """
+        Stores the size of the solution found and a lower bound of the size of a minimum
+        dominating set in the statistics ("best" and "lower_bound", math.inf if there is none).
+
+        :param res: The solution found (a list of defenders, None if none has been found).
+
+        :param lower_bound (opt): The lower bound proven by the solver, if None the cheap bounds \
+        are computed on the graph (see LowerBound.py, the linear relaxation is only computed if a \
+        solver asks for it).
+
+        :return: The solution (unchanged).
+        """
+        if lower_bound == None:
+            lower_bound = LowerBound(self.graph).compute(relaxation=False)
+        self.stats["best"] = len(res) if res != None else math.inf
+        self.stats["lower_bound"] = lower_bound
+        return res
+
     def solve(self):
         """
         Returns a minimum dominating set (or an approximation) of the graph given to the solver. 
@@ -30,6 +30,23 @@ class SolverArgs:
 
     :ivar greedy_random: (GREEDY) If the greedy algorithm does not find a solution \
     eventhough there exists one, the random solver will be used to find one instead.
+
+    :ivar brute_memo_size: (BRUTE) The maximum number of states leading to no solution remembered \
+    by the search (0 to remember none). The least recently used ones are forgotten first.
+
+    :ivar milp_timeout: (MILP) The maximum amount of time the integer program can be solved for \
+    (in seconds, None for no limit). The best solution found so far is returned once stopped.
+
+    :ivar milp_cliques: (MILP) If True, the collisions are written as cliques of colliding defenders \
+    (tighter), otherwise as pairs of defenders.
+
+    :ivar sat_timeout: (CPSAT) The maximum amount of time the constraint program can be solved for \
+    (in seconds, None for no limit). The best solution found so far is returned once stopped.
+
+    :ivar sat_workers: (CPSAT) The number of search workers (threads) used by the solver.
+
+    :ivar sat_goalkeeper: (CPSAT) For goal keeper problems, a tuple (min, max) bounding the number of \
+    selected defenders in the goalkeeper area, None to not constrain it.
     """
 
     def __init__(self):
@@ -39,4 +56,10 @@ class SolverArgs:
         self.random_prob = None
         self.random_timeout = None
         self.random_perm = None
-        self.greedy_random = False
\ No newline at end of file
+        self.greedy_random = False
+        self.brute_memo_size = 100000
+        self.milp_timeout = None
+        self.milp_cliques = True
+        self.sat_timeout = None
+        self.sat_workers = 1
+        self.sat_goalkeeper = None
\ No newline at end of file
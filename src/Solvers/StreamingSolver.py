@@ -0,0 +1,133 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import time
+from src.Solvers.Solver import Solver
+
+"""
+Solver working on a graph while its defenders are still being computed.
+"""
+
+class StreamingSolver(Solver):
+
+    """
+    This solver does not wait for the whole graph to be computed. The graph must be lazy
+    (see Graph.py): its positions are computed by batches, the most promising ones first (see
+    Graph.stream). As soon as the defenders computed so far block every shot, the graph made of
+    them (see Graph.snapshot) is solved with another solver, and its solution is returned. If
+    the solver finds none, it is called again each time the number of defenders has doubled,
+    and on the whole graph once every position is computed.
+
+    The first defenders being the ones placed at the perfect distance of the triangles, they
+    usually block every shot on their own, and the first solution is found long before the
+    whole graph is computed. If the graph is not lazy, the whole graph is solved directly.
+
+    :ivar solver: The class of the solver used on the graphs (GreedySolver, RandomSolver...).
+
+    :ivar batch_size: The number of positions computed between two checks.
+
+    :ivar exhaustive: If True, the rest of the graph is computed after the first solution, \
+    the whole graph is solved too and the smallest solution is returned.
+
+    :ivar lower_bound: The lower bound given by the solver on the last graph solved.
+    """
+
+    def __init__(self, graph, solver, batch_size=1024, exhaustive=False):
+        """
+        Creates a new StreamingSolver object.
+
+        :param graph: The lazy graph to find a minimum dominating set in.
+
+        :param solver: The class of the solver to use (GreedySolver, RandomSolver...).
+
+        :param batch_size (opt): The number of positions computed between two checks (default: 1024).
+
+        :param exhaustive (opt): If True, the whole graph is solved too (default: False).
+        """
+        super().__init__(graph)
+        self.solver = solver
+        self.batch_size = batch_size
+        self.exhaustive = exhaustive
+
+    def attempt(self, graph, params):
+        """
+        Solves a graph with the solver, its statistics are added to the ones of this solver.
+
+        :param graph: The graph to solve.
+
+        :param params: A SolverArgs object given to the solver.
+
+        :return: The solution of the solver, None if it has found none.
+        """
+        self.count("attempts")
+        s = self.solver(graph)
+        res = s.solve(params)
+        for key in s.stats:
+            if key not in Solver.bound_keys:
+                self.count(key, s.stats[key])
+
+        # the lower bound of the graph, only valid for the whole graph (see solve)
+        self.lower_bound = s.stats.get("lower_bound", 0)
+        return res
+
+    def solve(self, params):
+        """
+        Computes the graph by batches until the defenders computed so far contain a solution
+        (see above).
+
+        :param params: A SolverArgs object given to the solver.
+
+        :return: A list of defenders dominating the graph, None if no solution has been found.
+        """
+        self.stats = {}
+        start = time.time()
+        graph = self.graph
+
+        # the shots blocked by the defenders computed so far (the edges are integers until
+        # the graph is complete)
+        covered = (graph.dominant_value + 1) // 2
+        seen = 0
+
+        # the number of defenders of the last attempt
+        tried = 0
+
+        res = None
+        for nb in graph.stream(self.batch_size):
+            for k in range(seen, nb):
+                covered |= graph.edges[k]
+            seen = nb
+
+            if covered != graph.dominant_value or nb < 2 * tried:
+                continue
+
+            tried = nb
+            res = self.attempt(graph.snapshot(), params)
+            if res != None:
+                self.count("first_solution_defenders", nb)
+                self.count("first_solution_time", time.time() - start)
+                break
+
+        # the graph solved has fewer defenders than the whole graph, its lower bound is not
+        # a lower bound of the whole graph
+        if res != None and not self.exhaustive:
+            return self.report(res, 0)
+
+        # the rest of the positions, the whole graph is solved (unless it has just been)
+        for _ in graph.stream(self.batch_size):
+            pass
+        if tried > 0 and tried == len(graph.defenders):
+            return self.report(res, self.lower_bound)
+
+        full = self.attempt(graph, params)
+        if res == None or (full != None and len(full) < len(res)):
+            res = full
+        return self.report(res, self.lower_bound)
+
+    def sort(self, compare_func):
+        """
+        Does nothing, each graph is sorted by the solver.
+
+        :param compare_func: Not used.
+        """
+        pass
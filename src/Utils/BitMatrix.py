@@ -0,0 +1,304 @@
+import numpy as np
+
+"""
+This module is used to store the edges of a graph as a packed matrix of bits.
+"""
+
+class BitMatrix:
+
+    """
+    This class stores a matrix of bits (one row per defender, one column per shot) as a
+    contiguous array of 64 bits words, of shape (rows, ceil(columns / 64)). The bit of the
+    column c is the bit c % 64 of the word c // 64.
+
+    It can replace the list of integers used by Graph.edges: indexing it returns (and assigning
+    it expects) the same integers as before, with the leading 1 (see Graph.py). That being said,
+    the interesting part is the batch operations (or, and, popcount...) which work on many rows
+    at once, without creating a single Python integer.
+
+    :ivar nb_bits: The number of columns (shots) of the matrix.
+
+    :ivar nb_words: The number of words used by a row.
+
+    :ivar words: The array of words, of shape (rows, nb_words).
+
+    :ivar ints: The rows already converted to integers (None if not converted yet), so that \
+    solvers using the integers do not convert the same row over and over.
+    """
+
+    def __init__(self, nb_rows, nb_bits, words=None):
+        """
+        Constructs a new 'BitMatrix' object, filled with zeros if no words are given.
+
+        :param nb_rows: The number of rows (defenders).
+
+        :param nb_bits: The number of columns (shots).
+
+        :param words (opt): The array of words to use (not copied).
+
+        :return: returns nothing.
+        """
+        self.nb_bits = nb_bits
+        self.nb_words = max(1, (nb_bits + 63) // 64)
+        if words is None:
+            words = np.zeros((nb_rows, self.nb_words), dtype=np.uint64)
+        self.words = words
+        self.ints = [None] * self.words.shape[0]
+
+    @classmethod
+    def from_ints(cls, values, nb_bits):
+        """
+        Creates a new 'BitMatrix' from a list of integers as used by Graph.edges.
+
+        :param values: The list of integers (with the leading 1).
+
+        :param nb_bits: The number of columns (shots).
+
+        :return: The newly created 'BitMatrix' object.
+        """
+        # all the integers are converted to bytes at once (the leading 1 included)
+        nb_bytes = (nb_bits + 1 + 7) // 8
+        raw = b"".join(value.to_bytes(nb_bytes, "big") for value in values)
+        bits = np.unpackbits(np.frombuffer(raw, dtype=np.uint8).reshape(len(values), nb_bytes), axis=1)
+        res = cls.from_bools(bits[:, nb_bytes * 8 - nb_bits:])
+        res.ints = list(values)
+        return res
+
+    @classmethod
+    def from_bools(cls, rows):
+        """
+        Creates a new 'BitMatrix' from a boolean matrix.
+
+        :param rows: The boolean matrix (rows x columns).
+
+        :return: The newly created 'BitMatrix' object.
+        """
+        rows = np.asarray(rows, dtype=bool)
+        res = cls(rows.shape[0], rows.shape[1])
+        res.words[:] = res.pack(rows)
+        return res
+
+    def pack(self, rows):
+        """
+        Packs a boolean matrix into words.
+
+        :param rows: The boolean matrix (rows x nb_bits).
+
+        :return: The corresponding array of words.
+        """
+        padded = np.zeros((rows.shape[0], self.nb_words * 64), dtype=bool)
+        padded[:, :rows.shape[1]] = rows
+        packed = np.packbits(padded, axis=1, bitorder="little")
+        return np.ascontiguousarray(packed).view("<u8").astype(np.uint64)
+
+    def unpack(self, words):
+        """
+        Unpacks words into booleans.
+
+        :param words: A row (or a matrix) of words.
+
+        :return: The corresponding booleans, one per column.
+        """
+        words = np.atleast_2d(np.asarray(words, dtype="<u8"))
+        bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder="little")
+        return bits[:, :self.nb_bits].astype(bool)
+
+    def words_from_int(self, value):
+        """
+        Converts an integer as used by Graph.edges into a row of words.
+
+        :param value: The integer (the leading 1 is ignored).
+
+        :return: The corresponding row of words.
+        """
+        value &= (1 << self.nb_bits) - 1
+        nb_bytes = (self.nb_bits + 7) // 8
+        bits = np.unpackbits(np.frombuffer(value.to_bytes(nb_bytes, "big"), dtype=np.uint8))
+        return self.pack(bits[len(bits) - self.nb_bits:][None, :])[0]
+
+    def int_from_words(self, words):
+        """
+        Converts a row of words into an integer as used by Graph.edges.
+
+        :param words: The row of words.
+
+        :return: The corresponding integer (with the leading 1).
+        """
+        bits = np.concatenate(([True], self.unpack(words)[0]))
+        padding = (-len(bits)) % 8
+        return int.from_bytes(np.packbits(bits).tobytes(), "big") >> padding
+
+    def __len__(self):
+        """
+        Allows the use of len(m) where m is a 'BitMatrix' object.
+
+        :return: The number of rows.
+        """
+        return self.words.shape[0]
+
+    def __getitem__(self, index):
+        """
+        Allows the use of m[i] where m is a 'BitMatrix' object.
+
+        :param index: The index of the row.
+
+        :return: The row as an integer (with the leading 1).
+        """
+        if self.ints[index] == None:
+            self.ints[index] = self.int_from_words(self.words[index])
+        return self.ints[index]
+
+    def __setitem__(self, index, value):
+        """
+        Allows the use of m[i] = value where m is a 'BitMatrix' object.
+
+        :param index: The index of the row.
+
+        :param value: The integer (with the leading 1) to store.
+
+        :return: returns nothing.
+        """
+        self.words[index] = self.words_from_int(value)
+        self.ints[index] = value
+
+    def __iter__(self):
+        """
+        Allows the use of for value in m where m is a 'BitMatrix' object.
+
+        :return: An iterator over the rows as integers.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def copy(self):
+        """
+        Copies the matrix.
+
+        :return: The new 'BitMatrix' object.
+        """
+        res = BitMatrix(len(self), self.nb_bits, self.words.copy())
+        res.ints = self.ints.copy()
+        return res
+
+    def swap(self, i, j):
+        """
+        Swaps two rows of the matrix (without converting them to integers).
+
+        :param i: The index of the first row.
+
+        :param j: The index of the second row.
+
+        :return: returns nothing.
+        """
+        tmp = self.words[i].copy()
+        self.words[i] = self.words[j]
+        self.words[j] = tmp
+        self.ints[i], self.ints[j] = self.ints[j], self.ints[i]
+
+    def rows(self, indices=None):
+        """
+        Returns the words of some rows.
+
+        :param indices (opt): The indices of the rows, all of them if None.
+
+        :return: The array of words.
+        """
+        if indices is None:
+            return self.words
+        return self.words[indices]
+
+    def or_rows(self, indices=None):
+        """
+        Computes the disjunction of some rows (the shots blocked by a set of defenders).
+
+        :param indices (opt): The indices of the rows, all of them if None.
+
+        :return: The resulting row of words.
+        """
+        rows = self.rows(indices)
+        if len(rows) == 0:
+            return np.zeros(self.nb_words, dtype=np.uint64)
+        return np.bitwise_or.reduce(rows, axis=0)
+
+    def and_rows(self, indices=None):
+        """
+        Computes the conjunction of some rows (the shots blocked by every defender of a set).
+
+        :param indices (opt): The indices of the rows, all of them if None.
+
+        :return: The resulting row of words.
+        """
+        rows = self.rows(indices)
+        if len(rows) == 0:
+            return self.full_row()
+        return np.bitwise_and.reduce(rows, axis=0)
+
+    def popcount(self, indices=None, mask=None):
+        """
+        Counts the number of bits set in some rows (their degrees).
+
+        :param indices (opt): The indices of the rows, all of them if None.
+
+        :param mask (opt): If given, only the bits set in this row of words are counted.
+
+        :return: The array of counts, one per row.
+        """
+        rows = self.rows(indices)
+        if mask is not None:
+            rows = rows & mask
+        return BitMatrix.count_bits(rows).sum(axis=-1)
+
+    def andnot(self, mask, indices=None):
+        """
+        Clears, in place, the bits set in the given row of words from some rows (removes
+        the shots blocked by a defender from the graph).
+
+        :param mask: The row of words to remove.
+
+        :param indices (opt): The indices of the rows, all of them if None.
+
+        :return: returns nothing.
+        """
+        if indices is None:
+            self.words &= ~mask
+            self.ints = [None] * len(self)
+        else:
+            self.words[indices] &= ~mask
+            for i in np.atleast_1d(np.arange(len(self))[indices]):
+                self.ints[i] = None
+
+    def full_row(self):
+        """
+        Returns the row of words with every column set (every shot blocked).
+
+        :return: The row of words.
+        """
+        return self.pack(np.ones((1, self.nb_bits), dtype=bool))[0]
+
+    def is_full(self, row):
+        """
+        Checks if a row of words has every column set (is a dominant value).
+
+        :param row: The row of words.
+
+        :return: True if every column is set, False otherwise.
+        """
+        return bool(np.array_equal(row & self.full_row(), self.full_row()))
+
+    # number of bits set in every byte (used when numpy has no bitwise_count)
+    byte_counts = np.array([bin(b).count("1") for b in range(256)], dtype=np.int64)
+
+    @classmethod
+    def count_bits(cls, words):
+        """
+        Counts the number of bits set in every word.
+
+        :param words: An array of words.
+
+        :return: The array of counts (same shape).
+        """
+        if hasattr(np, "bitwise_count"):
+            return np.bitwise_count(words).astype(np.int64)
+        as_bytes = np.ascontiguousarray(words).view(np.uint8)
+        counts = cls.byte_counts[as_bytes].reshape(words.shape + (8,))
+        return counts.sum(axis=-1)
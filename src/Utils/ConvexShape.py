@@ -75,6 +75,37 @@ class ConvexShape:
         cosine = p1.x * p2.y - p1.y * p2.x
         return 0 if not cosine else cosine / abs(cosine)
 
+    def y_range(self, x_min, x_max):
+        """
+        Computes the y coordinates covered by this polygon in a vertical strip. The polygon
+        must be convex.
+
+        :param x_min: The left bound of the strip.
+
+        :param x_max: The right bound of the strip.
+
+        :return: A tuple (y_min, y_max), None if the polygon does not intersect the strip.
+        """
+        ys = []
+        nb_vertices = len(self.points)
+
+        for v in range(nb_vertices):
+            a, b = self.points[v], self.points[(v+1) % nb_vertices]
+
+            # the vertices in the strip
+            if x_min <= a.x and a.x <= x_max:
+                ys.append(a.y)
+
+            # the intersections of the sides with the bounds of the strip
+            if a.x != b.x:
+                for x in (x_min, x_max):
+                    if min(a.x, b.x) <= x and x <= max(a.x, b.x):
+                        ys.append(a.y + (b.y - a.y) * (x - a.x) / (b.x - a.x))
+
+        if ys == []:
+            return None
+        return (min(ys), max(ys))
+
     @classmethod
     def compute_triangle(self, opponent, goal):
         """
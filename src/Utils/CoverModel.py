@@ -0,0 +1,148 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import numpy as np
+from src.Utils.BitMatrix import BitMatrix
+
+"""
+This module is used to describe a graph as a set cover problem with collisions, so that it can
+be given to a generic solver (mixed integer programming, constraint programming...).
+"""
+
+class CoverModel:
+
+    """
+    This class describes the problem solved on a graph with a binary variable per defender (1
+    if the defender is selected): every shot must be blocked by at least one selected defender,
+    two colliding defenders can not be both selected and the number of selected defenders must
+    be minimum.
+
+    The collisions can be given as pairs of defenders or as cliques of the graph of collisions
+    (sets of defenders colliding with each other, at most one of them can be selected). The
+    cliques are found greedily (see conflict_cliques), a single clique replaces many pairs and
+    gives a much tighter relaxation of the problem.
+
+    :ivar graph: The graph described.
+
+    :ivar nb_def: The number of defenders (variables).
+
+    :ivar nb_shots: The number of shots (coverage constraints).
+
+    :ivar shots: The index of the shot of every edge of the graph (sorted by shot).
+
+    :ivar defenders: The index of the defender of every edge of the graph (same order).
+    """
+
+    def __init__(self, graph):
+        """
+        Constructs a new 'CoverModel' object.
+
+        :param graph: The graph to describe, its edges can be integers or a BitMatrix.
+
+        :return: returns nothing.
+        """
+        self.graph = graph
+        self.nb_def = len(graph.defenders)
+        self.nb_shots = graph.nb_shots
+
+        edges = graph.edges
+        if not isinstance(edges, BitMatrix):
+            edges = BitMatrix.from_ints(edges, self.nb_shots)
+        matrix = edges.unpack(edges.words) if self.nb_def > 0 else np.zeros((0, self.nb_shots), dtype=bool)
+
+        # transposed so that the edges are sorted by shot
+        self.shots, self.defenders = np.nonzero(matrix.T)
+
+    def blockers(self):
+        """
+        Lists the defenders blocking each shot.
+
+        :return: A list of arrays of indices, one per shot (an empty array if the shot can not \
+        be blocked).
+        """
+        bounds = np.searchsorted(self.shots, np.arange(self.nb_shots + 1))
+        return [self.defenders[bounds[s]:bounds[s + 1]] for s in range(self.nb_shots)]
+
+    def neighbours(self, index):
+        """
+        Returns the defenders colliding with a defender, as an integer (see Graph.conflicts).
+
+        :param index: The index of the defender.
+
+        :return: The numerical representation of the defenders colliding with it (itself excluded).
+        """
+        return self.graph.conflicts[index] & ~(1 << index)
+
+    def conflict_pairs(self):
+        """
+        Lists the pairs of colliding defenders.
+
+        :return: A list of tuples (i, j) with i < j.
+        """
+        res = []
+        for i in range(self.nb_def):
+            # only the defenders with a greater index, so that each pair is listed once
+            value = self.neighbours(i) >> (i + 1)
+            while value:
+                low = value & -value
+                res.append((i, i + low.bit_length()))
+                value ^= low
+        return res
+
+    def conflict_cliques(self):
+        """
+        Covers the pairs of colliding defenders with cliques. For each defender, a clique is
+        started from one of its pairs not covered yet and extended with every defender
+        colliding with all the defenders of the clique, until all its pairs are covered.
+
+        :return: A list of cliques, each clique being a sorted list of at least two indices. \
+        Every pair of colliding defenders is in at least one clique.
+        """
+        res = []
+
+        # the pairs not covered yet, the defender j is in remaining[i] if the pair (i, j) is
+        # not covered and i < j
+        remaining = [self.neighbours(i) >> (i + 1) << (i + 1) for i in range(self.nb_def)]
+
+        for i in range(self.nb_def):
+            while remaining[i]:
+                low = remaining[i] & -remaining[i]
+                clique = [i, low.bit_length() - 1]
+                candidates = self.neighbours(i) & self.neighbours(clique[1])
+
+                # the defenders whose pairs are not covered yet first, then the others
+                for pool in (candidates & remaining[i], candidates):
+                    pool &= candidates
+                    while pool:
+                        low = pool & -pool
+                        j = low.bit_length() - 1
+                        clique.append(j)
+                        candidates &= self.neighbours(j)
+                        pool &= candidates
+
+                clique.sort()
+                mask = 0
+                for j in clique:
+                    mask |= 1 << j
+                for j in clique:
+                    remaining[j] &= ~mask
+                res.append(clique)
+        return res
+
+    def defenders_in_area(self, bottom_left, top_right):
+        """
+        Lists the defenders placed in a rectangular area (the goalkeeper area for example).
+
+        :param bottom_left: The bottom left corner of the area (a Point).
+
+        :param top_right: The top right corner of the area (a Point).
+
+        :return: The list of indices of these defenders.
+        """
+        res = []
+        for i, defender in enumerate(self.graph.defenders):
+            if (bottom_left.x <= defender.pos.x <= top_right.x and
+                bottom_left.y <= defender.pos.y <= top_right.y):
+                res.append(i)
+        return res
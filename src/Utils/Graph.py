@@ -2,13 +2,26 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 
+import copy
 import math
+import bisect
+import itertools
+import numpy as np
 from src.Utils.Vector import Vector
 from src.Utils.Point import Point
 from src.Utils.ConvexShape import ConvexShape
 from src.Utils.UsefulTypes import Opponent, Shot, Defender, Goal
 from src.Utils.LinearEquation import LinearEquation
 from src.ProblemUtils.ProblemType import ProblemType
+from src.Utils.NumpyGraphBuilder import NumpyGraphBuilder
+from src.Utils.BitMatrix import BitMatrix
+from src.Utils.SpatialHash import SpatialHash
+from src.Utils.ShotStencil import ShotStencil
+from src.Utils.ParallelGraphBuilder import ParallelGraphBuilder
+from src.Utils.GraphReduction import GraphReduction
+from src.Utils.UnionFind import UnionFind
+from src.Utils.Tables import DefenderTable, ShotTable
+from src.Utils.MappedStorage import MappedArray, MappedDefenders, MappedBitMatrix, LazyConflicts, temporary_directory
 
 """
 This modules is used to represent a graph for this specific problem, so 
@@ -21,12 +34,14 @@ class Graph:
     This class represents a graph.
 
     :ivar defenders: This is a list of all the Defender objects that can be placed on \
-    the field (at first). These are one of the two parts of our vertices. 
+    the field (at first). These are one of the two parts of our vertices. Only their positions \
+    are stored (see Tables.py), the objects are created when accessed. 
 
     :ivar opponents: A list of all the opponents on the field. This isn't used in the \
     Graph per se, but it is important for efficiency reasons (see exists_collision). 
 
-    :ivar shots: This is a list of all the possible shots. This is the second part of our vertices.
+    :ivar shots: This is a list of all the possible shots. This is the second part of our vertices. \
+    Only their angles, opponents and goals are stored (see Tables.py), the objects are created when accessed.
 
     :ivar edges: This is a specific representation of edges. This is a list of numbers where their \
     binary representation represents the graph's matrix. 
@@ -50,7 +65,21 @@ class Graph:
     of the selected vertices is a dominant set. 
     """
 
-    def __init__(self, problem, optimized=True):
+    # Any value closer than this to a threshold is checked with the scalar methods
+    # (see blocked_shots and NumpyGraphBuilder.py)
+    tolerance = 1e-7
+
+    # The version of the generation of the graph, it must be increased whenever the generated
+    # graph changes, so that the graphs stored before are not used (see GraphCache.py)
+    version = 1
+
+    # The stencils of the graphs by parameters (see shot_stencil), at most max_stencils of them
+    stencils = {}
+    max_stencils = 4
+
+    def __init__(self, problem, optimized=True, engine="python", edges_backend="int", analytic=True,
+                 workers=1, columns=None, cache=None, storage="memory", storage_dir=None,
+                 memory_budget=256 * 1024 * 1024, cells=None, lazy=False):
         """
         Construct a new 'Graph' object. 
 
@@ -61,23 +90,73 @@ class Graph:
         by default. Note that this optimization can lead to losing some valid solution and in the \
         worst cases can lead to not find solutions when some exist.
 
+        :param engine (opt): The engine used to compute the positions of the defenders, either \
+        "python" (one defender and one shot at a time) or "numpy" (whole blocks of the field at \
+        once, see NumpyGraphBuilder.py). Both engines produce the exact same graph. "python" by default.
+
+        :param edges_backend (opt): How the edges are stored, either "int" (a list of integers, see \
+        below) or "bitset" (a packed matrix of bits that can be used with the same integers but \
+        also allows batch operations over many defenders at once, see BitMatrix.py). "int" by default.
+
+        :param analytic (opt): If set to true, the "python" engine computes the range of shots blocked \
+        by a defender once per opponent and goal (see blocked_shots) instead of checking every single \
+        shot. The graph is exactly the same. True by default.
+
+        :param workers (opt): The number of processes used to compute the positions of the defenders, \
+        the field being split into vertical strips (see ParallelGraphBuilder.py). The graph is exactly \
+        the same. 1 by default.
+
+        :param columns (opt): If given, only the positions of this range of columns of the lattice are \
+        computed, and the collisions between defenders are not. Used to compute a strip of the field \
+        (see ParallelGraphBuilder.py). None by default.
+
+        :param cache (opt): If given, the graph is loaded from this cache if it has already been \
+        computed, and stored in it otherwise (see GraphCache.py). None by default.
+
+        :param storage (opt): Where the defenders and edges are stored, either "memory" (Python lists) \
+        or "mmap" (memory-mapped files filled while the graph is computed, see MappedStorage.py). With \
+        "mmap", the edges are a packed matrix of bits, the defenders are only created when accessed and \
+        the collisions between defenders are computed when accessed, so that the memory used is bounded \
+        by memory_budget instead of the size of the problem. The cache is not used in this case. \
+        "memory" by default.
+
+        :param storage_dir (opt): The directory of the files of the "mmap" storage, a new temporary \
+        directory if None. None by default.
+
+        :param memory_budget (opt): The memory (in bytes) the "mmap" storage can use for its computations \
+        (blocks of positions, chunks of rows...). 256MB by default.
+
+        :param cells (opt): If given, only these positions of the lattice (a set of tuples (i, j), \
+        see candidate_cells) are considered, used to compute the graph of some regions of the field \
+        only (see MultiResolutionSolver.py). The cache is not used in this case. None by default.
+
+        :param lazy (opt): If set to true, the constructor only computes the shots, the positions of \
+        the defenders are computed afterwards by batches, the most promising ones first (see stream), \
+        so that a solver can start before the graph is complete. Only possible with the "memory" \
+        storage, the graph is computed by a single process and the cache is not used. False by default.
+
         :return: returns nothing.
         """
 
         # the list of defenders in the final graph
         # that is those that block at least one shot
-        self.defenders = []
+        # (stored as arrays of coordinates, see Tables.py)
+        self.defenders = DefenderTable(problem["radius"])
 
         # the list of opponents in the graph
         self.opponents = []
 
+        # a spatial hash of the opponents, to only check the collisions with the closest ones
+        self.opponent_grid = None
+
         # the list of all shots in the graph
         # this list is actually a list of list
         # each sub list corresponds to all the valid shots
         # between a given opponent and a given goal
         # therefore if there 3 opponents and 2 goals for example
         # there will be 6 sub lists
-        self.shots = []
+        # (stored as arrays of angles, opponents and goals, see Tables.py)
+        self.shots = ShotTable(problem["opponents"])
 
         # the list of edges in the graph, an edge exists
         # between a defender and a shot if the shot is intercepted
@@ -136,6 +215,64 @@ class Graph:
         # make it much much easier for solvers to find an optimal solution
         self.optimized = optimized
 
+        # the engine used to compute the positions of the defenders
+        self.engine = engine
+
+        # how the edges are stored once the graph is computed
+        self.edges_backend = edges_backend
+
+        # if True, the blocked shots are computed as ranges of angles
+        self.analytic = analytic
+
+        # the number of processes used to compute the positions
+        self.workers = workers
+
+        # the range of columns of the lattice to compute (None for the whole field)
+        self.columns = columns
+
+        # the positions of the lattice to consider (None for every position)
+        self.cells = cells
+
+        # if True the positions are computed by stream, the positions not computed yet are
+        # stored by order of priority (None until stream is called)
+        self.lazy = lazy
+        self.pending = None
+
+        # the cache the graph is loaded from or stored in (None if not used)
+        self.cache = cache
+
+        # where the defenders and edges are stored
+        self.storage = storage
+        self.storage_dir = storage_dir
+        self.memory_budget = memory_budget
+
+        # for each defender, the numerical representation of the defenders it collides with
+        # (the ith bit is 1 if it collides with the ith defender, including itself), a set of
+        # defenders can therefore be checked for collisions with a single and
+        self.conflicts = []
+
+        # the angles of the shots of every sub list of shots (sorted, see compute_all_shots)
+        self.shot_angles = []
+
+        # the cosine, sine and tangent of the shots of every sub list of shots (see trigonometry)
+        self.shot_trigonometry = []
+
+        # every angle a shot can have (see angle_lattice)
+        self.angles = None
+
+        # for each triangle, the line of its goal as (nx, ny, c) so that nx * x + ny * y + c
+        # is the distance to the line, positive on the side of the opponent (None if the
+        # opponent is on the line)
+        self.goal_lines = []
+
+        # for each triangle, the lines of its sides and its bounding box, computed once 
+        # (see compute_triangle_geometry)
+        self.triangle_geometry = []
+
+        # the ranges of shots blocked by a defender wrt its offset to an opponent, shared by
+        # every opponent (see shot_stencil)
+        self.stencil = None
+
         # compute everything needed for the graph
         self.compute_graph(problem)
 
@@ -148,6 +285,20 @@ class Graph:
         """
         # Computes all valid shots
         self.opponents = problem["opponents"]
+        self.compute_opponent_grid()
+
+        if self.lazy and self.storage == "mmap":
+            raise ValueError("A lazy graph can not be stored in files")
+
+        # the graphs stored in files (or restricted to some positions or lazy) are not cached
+        if self.storage == "mmap" or self.cells != None or self.lazy:
+            self.cache = None
+
+        # everything below has already been computed
+        if self.cache != None and self.columns == None and self.cache.load(self):
+            self.convert_edges()
+            return
+
         self.compute_all_shots(problem["opponents"], problem["theta_step"], problem["goals"])
         self.dominant_value = pow(2, self.nb_shots + 1) - 1
 
@@ -155,8 +306,136 @@ class Graph:
         # (impossible for now in the case of ball speed, although it should be possible
         # also, some defenders should be easy to exclude in this extension...)
         self.compute_triangles(problem["goals"])
-        self.compute_all_positions(problem["bottom_left"], problem["top_right"], 
-                                   problem["pos_step"], problem["radius"], problem["goals"])
+
+        # the positions are computed by stream
+        if self.lazy:
+            return
+
+        if self.storage == "mmap":
+            self.create_mapped_storage()
+
+        if self.workers > 1 and self.columns == None:
+            builder = ParallelGraphBuilder(self, self.workers)
+            builder.compute_all_positions(problem["bottom_left"], problem["top_right"], 
+                                          problem["pos_step"], problem["radius"], problem["goals"])
+        elif self.engine == "numpy":
+            builder = NumpyGraphBuilder(self, self.block_size())
+            builder.compute_all_positions(problem["bottom_left"], problem["top_right"], 
+                                          problem["pos_step"], problem["radius"], problem["goals"])
+        else:
+            self.compute_all_positions(problem["bottom_left"], problem["top_right"], 
+                                       problem["pos_step"], problem["radius"], problem["goals"])
+
+        # a strip of the field is only used to compute the positions
+        if self.columns != None:
+            return
+
+        # Computes the collisions between defenders
+        self.compute_conflicts()
+
+        if self.cache != None:
+            self.cache.store(self)
+
+        self.convert_edges()
+
+    def create_mapped_storage(self):
+        """
+        Creates the memory-mapped files the defenders, edges, degrees and distances are 
+        added to while the graph is computed (see storage). 
+
+        :return: returns nothing.
+        """
+        if self.storage_dir == None:
+            self.storage_dir = temporary_directory()
+        os.makedirs(self.storage_dir, exist_ok=True)
+
+        self.defenders = MappedDefenders(os.path.join(self.storage_dir, "defenders.bin"), self.problem["radius"])
+        self.edges = MappedBitMatrix(os.path.join(self.storage_dir, "edges.bin"), self.nb_shots, self.memory_budget)
+        self.deg = MappedArray(os.path.join(self.storage_dir, "deg.bin"), "int64")
+        self.total_distance_defender = MappedArray(os.path.join(self.storage_dir, "distances.bin"), "float64")
+
+    def block_size(self):
+        """
+        Computes the number of positions the NumPy engine can consider at once. With the "mmap" 
+        storage it is bounded by the memory budget (a position takes about 64 bytes per shot). 
+
+        :return: The number of positions.
+        """
+        if self.storage != "mmap":
+            return 4096
+        return max(1, min(4096, self.memory_budget // (64 * max(1, self.nb_shots))))
+
+    def convert_edges(self):
+        """
+        Converts the edges (computed as integers) to the storage of the graph (see edges_backend).
+
+        :return: returns nothing.
+        """
+        # already stored as a packed matrix of bits
+        if self.storage == "mmap":
+            return
+
+        if self.edges_backend == "bitset":
+            self.edges = BitMatrix.from_ints(self.edges, self.nb_shots)
+
+    def collision_distance(self):
+        """
+        Returns the minimum distance between two robots (defenders or opponents) for them
+        to not collide.
+
+        :return: The distance.
+        """
+        if self.problem.type == ProblemType.MIN_DIST:
+            return self.problem["min_dist"]
+        return self.problem["radius"] * 2
+
+    def compute_conflicts(self):
+        """
+        Computes, for each defender, the numerical representation of the defenders it collides 
+        with (see conflicts). A spatial hash is used so that only the defenders close to each other
+        are compared. This must be computed again whenever the defenders are moved (sorted for example).
+
+        :return: returns nothing.
+        """
+        # too many defenders to store the collisions, they are computed when needed
+        if self.storage == "mmap":
+            self.conflicts = LazyConflicts(self)
+            return
+
+        distance = self.collision_distance()
+        nb = len(self.defenders)
+        self.conflicts = []
+
+        # the defenders are only created once (see Tables.py)
+        defenders = list(self.defenders)
+
+        grid = SpatialHash(distance)
+        for i in range(nb):
+            grid.insert(defenders[i].pos, i)
+
+        for i in range(nb):
+            defender = defenders[i]
+
+            # building the integer byte by byte is much faster than or-ing big integers
+            bits = bytearray((nb + 7) // 8)
+            for _, j in grid.neighbours(defender.pos, distance):
+                if defender.collision(defenders[j], distance):
+                    bits[j // 8] |= 1 << (j % 8)
+            self.conflicts.append(int.from_bytes(bits, "little"))
+
+    def forbidden_mask(self, def_list):
+        """
+        Computes the numerical representation of the defenders colliding with at least one
+        defender of the given list (the defenders of the list included).
+
+        :param def_list: The list of defenders (indices).
+
+        :return: The corresponding integer.
+        """
+        res = 0
+        for d in def_list:
+            res |= self.conflicts[d]
+        return res
 
     def compute_triangles(self, goals):
         """
@@ -169,10 +448,58 @@ class Graph:
         for goal in goals:
             for opponent in self.opponents:
                 self.triangles.append(ConvexShape.compute_triangle(opponent, goal))
+                self.goal_lines.append(self.compute_goal_line(goal, opponent))
+                self.triangle_geometry.append(self.compute_triangle_geometry(self.triangles[-1]))
+
+    def compute_goal_line(self, goal, opponent):
+        """
+        Computes the line of a goal, oriented towards the given opponent.
+
+        :param goal: The goal to consider.
+
+        :param opponent: The opponent to consider.
+
+        :return: (nx, ny, c) such that nx * x + ny * y + c is the distance of the point (x, y) \
+        to the line of the goal, positive on the side of the opponent. None if the opponent is on the line.
+        """
+        if goal.normal == None:
+            return None
+        n_x, n_y, c = goal.normal
+
+        side = n_x * opponent.pos.x + n_y * opponent.pos.y + c
+        if side == 0:
+            return None
+        if side < 0:
+            return (-n_x, -n_y, -c)
+        return (n_x, n_y, c)
+
+    def compute_triangle_geometry(self, triangle):
+        """
+        Computes what point_in_triangles needs to know about a triangle, once and for all: the
+        lines of its two sides going towards the goal and its bounding box.
+
+        :param triangle: The triangle to consider. 
+
+        :return: A tuple (sides, box). sides is a list of two tuples (angle, cos, sin), the angle \
+        of the line of a side (the arctangent of its coefficient, pi / 2 if it is vertical) and its \
+        direction, the unit normal of the line being (sin, -cos). box is (x_min, y_min, x_max, y_max).
+        """
+        apex = triangle.points[0]
+        sides = []
+        for post in triangle.points[1:3]:
+            le = LinearEquation.create_le_from_pp(apex, post)
+            angle = math.pi / 2 if le == None else math.atan(le.a)
+            sides.append((angle, math.cos(angle), math.sin(angle)))
+
+        x = [p.x for p in triangle.points]
+        y = [p.y for p in triangle.points]
+        return (sides, (min(x), min(y), max(x), max(y)))
 
     def point_in_triangles(self, point):
         """
-        Computes the list of all triangles the point is in. 
+        Computes the list of all triangles the point is in. This is the reference computation,
+        the positions of the lattice are checked a column at a time by points_in_triangles,
+        which only uses this method for the positions too close to a threshold. 
 
         :param point: The point to check. 
 
@@ -182,9 +509,6 @@ class Graph:
         # the list of triangles (by index) the points is in
         tmp = []
 
-        # the current index of the triangle considered
-        index = 0
-        
         # get the radius of the robots
         radius = self.problem["radius"]
 
@@ -195,11 +519,12 @@ class Graph:
         defender = Defender(point, radius)
 
         # loop through all the triangles
-        for triangle in self.triangles:
+        for index in range(len(self.triangles)):
+            apex = self.triangles[index].points[0]
             
-            # get the angles of the two sides of the triangle going towards the goal
-            angle1 = math.atan(LinearEquation.create_le_from_pp(triangle.points[0], triangle.points[1]).a)
-            angle2 = math.atan(LinearEquation.create_le_from_pp(triangle.points[0], triangle.points[2]).a)
+            # the angles of the two sides of the triangle going towards the goal
+            # (see compute_triangle_geometry)
+            sides = self.triangle_geometry[index][0]
 
             # if the defender does not intersect either of those lines, then it is not interesting
             # the idea behind this choice is that, except in specific cases, a defender in the middle
@@ -209,12 +534,116 @@ class Graph:
             # although this is true in most cases, it's important to note that this does
             # remove some possible solutions, and in the worst cases, it removes all the 
             # possible solutions, this why there is an option to deactivate this optimization
-            if (LinearEquation.intersection_circle(defender, angle1, triangle.points[0], radius) != None or
-                LinearEquation.intersection_circle(defender, angle2, triangle.points[0], radius) != None or
-                (not self.optimized and triangle.point_in(point))):
+            on_side = False
+            for angle, _, _ in sides:
+
+                # a vertical side (the opponent is in front of a post)
+                if angle == math.pi / 2:
+                    on_side = on_side or abs(point.x - apex.x) <= radius
+                else:
+                    on_side = on_side or LinearEquation.intersection_circle(defender, angle, apex, radius) != None
+
+            if on_side or (not self.optimized and self.triangles[index].point_in(point)):
                 tmp.append(index)
-            index += 1
-        return tmp.copy()
+        return tmp
+
+    def points_in_triangles(self, xs, ys):
+        """
+        Computes, for arrays of positions, the triangles every position is in (in the sense of
+        point_in_triangles), using the geometry of the triangles (see compute_triangle_geometry).
+        The positions too close to a threshold (see tolerance) are computed with point_in_triangles.
+
+        :param xs: The x coordinates of the positions (rounded like a Point).
+
+        :param ys: The y coordinates of the positions (rounded like a Point).
+
+        :return: A boolean matrix (positions x triangles).
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        tol = self.tolerance
+        radius = self.problem["radius"]
+        res = np.zeros((len(xs), len(self.triangles)), dtype=bool)
+        ambiguous = np.zeros(len(xs), dtype=bool)
+
+        for i in range(len(self.triangles)):
+            triangle = self.triangles[i]
+            sides, box = self.triangle_geometry[i]
+            apex = triangle.points[0]
+
+            inside = np.zeros(len(xs), dtype=bool)
+            for angle, cos, sin in sides:
+
+                # horizontal and vertical sides, computed exactly like the scalar method
+                if angle == 0:
+                    inside |= np.abs(ys - apex.y) <= radius
+                    continue
+                if angle == math.pi / 2:
+                    inside |= np.abs(xs - apex.x) <= radius
+                    continue
+
+                # distance between the position and the line of the side
+                dst = np.abs((xs - apex.x) * sin - (ys - apex.y) * cos)
+                inside |= dst <= radius
+                ambiguous |= np.abs(dst - radius) <= tol
+
+            # the position can also be strictly inside the triangle, which is only possible
+            # in its bounding box
+            if not self.optimized:
+                in_box = np.nonzero((box[0] - tol <= xs) & (xs <= box[2] + tol) & 
+                                    (box[1] - tol <= ys) & (ys <= box[3] + tol))[0]
+                b_x, b_y = xs[in_box], ys[in_box]
+                in_tr = np.ones(len(in_box), dtype=bool)
+                prev = np.zeros(len(in_box))
+                nb_vertices = len(triangle.points)
+                for v in range(nb_vertices):
+                    a, b = triangle.points[v], triangle.points[(v+1) % nb_vertices]
+                    cosine = (a.x - b.x) * (b_y - a.y) - (a.y - b.y) * (b_x - a.x)
+                    ambiguous[in_box[np.abs(cosine) <= tol]] = True
+                    side = np.sign(cosine)
+                    in_tr &= (side != 0) & ((prev == 0) | (prev == side))
+                    prev = np.where(prev == 0, side, prev)
+                inside[in_box[in_tr]] = True
+
+            res[:, i] = inside
+
+        # positions too close to a threshold are computed with the scalar method
+        for k in np.nonzero(ambiguous)[0]:
+            res[k, :] = False
+            res[k, self.point_in_triangles(Point(float(xs[k]), float(ys[k])))] = True
+        return res
+
+    def cells_in_triangles(self, cells, xs, ys):
+        """
+        Computes the triangles some positions of the lattice are in, a column of the lattice 
+        at a time (see points_in_triangles). 
+
+        :param cells: An iterable of tuples (i, j), (xs[i], ys[j]) being a position.
+
+        :param xs: The x coordinates of the lattice. 
+
+        :param ys: The y coordinates of the lattice. 
+
+        :return: A generator of tuples (i, j, triangles), triangles being the list of the indices \
+        of the triangles the position is in (None in the case of max_speed, a defender can block \
+        the shots of any triangle), in the order of the cells.
+        """
+        if self.problem.type == ProblemType.MAX_SPEED:
+            for i, j in cells:
+                yield i, j, None
+            return
+
+        column = []
+        for cell in itertools.chain(cells, [None]):
+            if len(column) > 0 and (cell == None or cell[0] != column[0][0]):
+                x = [round(xs[i], Point.n_digits_round) for i, _ in column]
+                y = [round(ys[j], Point.n_digits_round) for _, j in column]
+                mask = self.points_in_triangles(x, y)
+                for k in range(len(column)):
+                    yield column[k][0], column[k][1], np.nonzero(mask[k])[0].tolist()
+                column = []
+            if cell != None:
+                column.append(cell)
 
     def compute_all_shots(self, opponents, step, goals):
         """
@@ -233,27 +662,116 @@ class Graph:
         """
         
         # Parsing the list of goals
-        for goal in goals:
+        for g in range(len(goals)):
 
             # Parsing the opponents list
-            for opponent in opponents:
+            for o in range(len(opponents)):
+                tmp = self.compute_shots(opponents[o], step, goals[g])
+                self.nb_shots += len(tmp)
+                self.shot_angles.append([shot.angle for shot in tmp])
+                self.shots.append(self.shot_angles[-1], o, g)
+                self.shot_trigonometry.append(self.trigonometry(self.shot_angles[-1]))
+
+    def angle_lattice(self, step):
+        """
+        Computes every angle a shot can have, from -pi to pi (excluded). The angles are
+        accumulated, exactly like the shots have always been computed. This is only 
+        computed once per graph. 
+
+        :param step: The angle between two consecutive shots. 
+
+        :return: The list of angles.
+        """
+        if self.angles == None:
+            self.angles = []
+            angle = -math.pi
+            while angle < math.pi:
+                self.angles.append(angle)
+                angle += step
+        return self.angles
+
+    def trigonometry(self, angles):
+        """
+        Computes the cosine, sine and tangent of a list of angles (used by the interception tests 
+        of the NumPy engine). 
+
+        :param angles: The list of angles. 
 
-                # Low bound for an angle
-                angle = -math.pi
+        :return: A tuple of three arrays (cos, sin, tan).
+        """
+        angles = np.array(angles, dtype=np.float64)
+        return (np.cos(angles), np.sin(angles), np.tan(angles))
 
-                tmp = []
+    def compute_shots(self, opponent, step, goal):
+        """
+        Computes the valid shots of an opponent towards a goal. Instead of checking every
+        angle, the circle is split by the angles at which the validity of a shot can change 
+        (see Goal.shot_angle_boundaries), each arc being either fully valid or fully invalid.
+        Only the angles too close to a boundary (or special, see Goal.check_shot_on_target) 
+        are checked with Goal.is_shot_valid. The cost is then proportional to the number of 
+        valid shots.
 
-                # Parse all possible angle in [-pi ; pi[
-                while angle < math.pi:
+        :param opponent: The opponent to consider.
 
-                    # If this shot is valid (i.e: goes in the goal), it is added to the list of shots
-                    shot = Shot(opponent, angle)
-                    if goal.is_shot_valid(shot):
-                        self.nb_shots += 1
-                        tmp.append(shot)
-                    angle += step
-                
-                self.shots.append(tmp.copy())
+        :param step: Used to compute a finite number of angles.
+
+        :param goal: The goal to consider.
+
+        :return: The list of valid shots, sorted by angle.
+        """
+        angles = self.angle_lattice(step)
+
+        # this does not depend on the angle
+        if not goal.check_position(opponent):
+            return []
+
+        boundaries = goal.shot_angle_boundaries(opponent)
+        if boundaries == None:
+            return self.compute_shots_scalar(opponent, goal, range(len(angles)))
+
+        boundaries += [-math.pi, -math.pi / 2, 0, math.pi / 2, math.pi]
+        boundaries.sort()
+
+        indices = []
+        for k in range(len(boundaries) - 1):
+            low = boundaries[k] + self.tolerance
+            high = boundaries[k + 1] - self.tolerance
+
+            # every angle of the arc is valid
+            if low < high and goal.shot_goes_in(opponent, (low + high) / 2):
+                indices += range(bisect.bisect_right(angles, low), bisect.bisect_left(angles, high))
+
+        # the angles close to a boundary
+        ambiguous = set()
+        for b in boundaries:
+            ambiguous.update(range(bisect.bisect_left(angles, b - self.tolerance), 
+                                   bisect.bisect_right(angles, b + self.tolerance)))
+
+        res = [Shot(opponent, angles[i]) for i in indices]
+        res += self.compute_shots_scalar(opponent, goal, sorted(ambiguous))
+        res.sort(key=lambda shot: shot.angle)
+        return res
+
+    def compute_shots_scalar(self, opponent, goal, indices):
+        """
+        Computes the valid shots of an opponent towards a goal, one angle at a time.
+
+        :param opponent: The opponent to consider.
+
+        :param goal: The goal to consider.
+
+        :param indices: The indices of the angles to check (see angle_lattice).
+
+        :return: The list of valid shots.
+        """
+        tmp = []
+        for i in indices:
+
+            # If this shot is valid (i.e: goes in the goal), it is added to the list of shots
+            shot = Shot(opponent, self.angles[i])
+            if goal.is_shot_valid(shot):
+                tmp.append(shot)
+        return tmp
 
     def perfect_distance_from_triangle(self, triangle, radius):
         """
@@ -278,17 +796,16 @@ class Graph:
         opt = (radius / 2) / math.tan(angle)
         return opt
 
-    def compute_distance_sum(self, defender, index_tr, index_def):
+    def distance_from_triangle(self, defender, index_tr):
         """
-        Computes a value to know how optimal a defender's position is. 
+        Computes a value to know how optimal a defender's position is wrt a triangle. 
+        The value of a defender is the minimum over all the triangles it is in.
 
         :param defender: The defender ton consider. 
 
         :param index_tr: Index correspoding to the current triangle. 
 
-        :param index_def: The index correspoding to the current defender. 
-
-        :return: returns nothing.
+        :return: The difference between the distance of the defender and the optimal distance.
         """
 
         # get the optimal distance from the opponent
@@ -297,28 +814,232 @@ class Graph:
         # get the distance of the current defender
         dst = defender.pos.distance(self.triangles[index_tr].points[0])
 
-        # if this is the first time we consider this defender, create a new 
-        # cell for it
-        if len(self.total_distance_defender) <= index_def:
-            self.total_distance_defender.append(abs(opt - dst) * 10)
+        return abs(opt - dst) * 10
 
-        # otherwise sum the difference of this placement with all the previously computed distances
-        else:
-            self.total_distance_defender[index_def] = min(self.total_distance_defender[index_def], abs(opt - dst) * 10)
+    def blocked_shots(self, defender, index_tr, goals):
+        """
+        Computes the shots of a sub list of shots (one opponent, one goal) blocked by a defender. 
+
+        For a given opponent, a defender at a distance d blocks every shot whose angle is in
+        [phi - alpha ; phi + alpha], phi being the angle from the opponent to the defender and 
+        alpha = asin(radius / d). These ranges of angles only depend on the offset between the
+        defender and the opponent, they are computed once per offset (see shot_stencil) and
+        clipped to the sub list (see clip_range). If the defender is in front of the goal (further
+        than its radius from the goal's line), every one of these shots is blocked before reaching
+        the goal, and the range is directly converted to bits.
+
+        The shots that are too close to the bounds of the interval (rounding errors), the shots
+        whose line goes through the defender behind the opponent (they can still be intercepted
+        wrt another goal, see exist_goal) and every shot when the defender is not clearly in front
+        of the goal are checked one by one, exactly like compute_all_positions does without this 
+        method. Therefore, the result is exactly the same.
+
+        :param defender: The defender to consider. 
+
+        :param index_tr: The index of the sub list of shots (= of the triangle). 
+
+        :param goals: The list of goals. 
+
+        :return: A tuple (bits, deg), bits being the numerical representation of the blocked shots \
+        of the sub list (without the leading 1) and deg the number of blocked shots.
+        """
+        angles = self.shot_angles[index_tr]
+        nb = len(angles)
+        if nb == 0:
+            return (0, 0)
+
+        # the apex of the triangle is the opponent
+        opponent = self.triangles[index_tr].points[0]
+        radius = defender.radius
+        stencil = self.shot_stencil()
+
+        # the defender is (almost) on the opponent, no interval can be defined
+        entry = stencil.ranges_of(defender.pos.x - opponent.x, defender.pos.y - opponent.y)
+        if entry == None:
+            return self.blocked_shots_scalar(defender, index_tr, goals, range(nb))
+        dst, ranges = entry
+
+        # the index of the first shot of the sub list in the lattice of angles, the valid shots
+        # of an opponent are usually consecutive angles of the lattice
+        start = bisect.bisect_left(stencil.angles, angles[0])
+        if start + nb > len(stencil.angles) or stencil.angles[start + nb - 1] != angles[-1]:
+            start = None
+
+        # the distance between the defender and the goal's line (minus its radius)
+        # if it is positive, the defender intercepts the shots before they reach the goal
+        line = self.goal_lines[index_tr]
+        front = -1
+        if line != None:
+            front = line[0] * defender.pos.x + line[1] * defender.pos.y + line[2] - radius
+
+        bits = 0
+        to_check = []
+        for low, in_low, in_high, high, forward in ranges:
+            if start != None:
+                low, high = min(max(low - start, 0), nb), min(max(high - start, 0), nb)
+            else:
+                low, high = self.clip_range(angles, low, high)
+            if low >= high:
+                continue
+
+            # the shots that are surely blocked
+            if start != None:
+                in_low, in_high = min(max(in_low - start, 0), nb), min(max(in_high - start, 0), nb)
+            else:
+                in_low, in_high = self.clip_range(angles, in_low, in_high)
+            if (not forward or in_low >= in_high or
+                not self.surely_blocked(angles[in_low], angles[in_high - 1], dst, radius, front)):
+                in_low, in_high = low, low
+
+            # a range of bits, the first shot is the most significant bit
+            if in_low < in_high:
+                bits |= ((1 << (in_high - in_low)) - 1) << (nb - in_high)
+
+            to_check.extend(range(low, in_low))
+            to_check.extend(range(in_high, high))
+
+        checked, _ = self.blocked_shots_scalar(defender, index_tr, goals, to_check)
+        bits |= checked
+        return (bits, bin(bits).count('1'))
+
+    def shot_stencil(self):
+        """
+        Returns the stencil of the graph (see ShotStencil.py). It only depends on the lattice of
+        angles and the radius of the robots, it is then shared by every opponent, kept when the
+        opponents move (see update_opponent) and shared by every graph with the same parameters
+        (see stencils), a problem solved again with other opponents reuses it.
+
+        :return: The 'ShotStencil' object.
+        """
+        if self.stencil == None:
+            key = (self.problem["theta_step"], self.problem["radius"], self.tolerance)
+            if key not in Graph.stencils:
+                if len(Graph.stencils) >= Graph.max_stencils:
+                    del Graph.stencils[next(iter(Graph.stencils))]
+                angles = self.angle_lattice(self.problem["theta_step"])
+                Graph.stencils[key] = ShotStencil(angles, self.problem["radius"], self.tolerance)
+            self.stencil = Graph.stencils[key]
+        return self.stencil
+
+    def clip_range(self, angles, low, high):
+        """
+        Converts a range of indices in the lattice of angles (see ShotStencil) to the range of
+        the shots of a sub list whose angles are in it, when the angles of the sub list are not
+        consecutive in the lattice (they are simply translated otherwise, see blocked_shots).
+
+        :param angles: The angles of the sub list. 
+
+        :param low: The first index of the range in the lattice. 
+
+        :param high: The index following the last one of the range in the lattice. 
+
+        :return: The range (low, high) of indices in the sub list.
+        """
+        nb = len(angles)
+
+        # the number of angles of the sub list that are smaller than the bounds
+        lattice = self.stencil.angles
+        low = bisect.bisect_left(angles, lattice[low]) if low < len(lattice) else nb
+        high = bisect.bisect_left(angles, lattice[high]) if high < len(lattice) else nb
+        return (low, high)
+
+    def surely_blocked(self, angle1, angle2, dst, radius, front):
+        """
+        Checks if the shots of a range of angles going towards a defender are surely blocked
+        (the rounding errors of the scalar methods can not change the result). 
+
+        :param angle1: The smallest angle of the range. 
+
+        :param angle2: The greatest angle of the range. 
+
+        :param dst: The distance between the defender and the opponent. 
+
+        :param radius: The radius of the defender. 
+
+        :param front: The distance between the defender and the goal's line, minus its radius. 
+
+        :return: True if every shot of the range is blocked, False if it is not sure.
+        """
+        tol = self.tolerance
+
+        # horizontal and vertical shots are special cases in the scalar methods
+        for special in (-math.pi, -math.pi / 2, 0, math.pi / 2, math.pi):
+            if angle1 <= special and special <= angle2:
+                return False
+
+        # the interception is checked on the x coordinate, which must not be too close
+        # to the opponent's or the goal's
+        cos_min = min(abs(math.cos(angle1)), abs(math.cos(angle2)))
+        return front * cos_min > tol and math.sqrt(dst * dst - radius * radius) * cos_min > tol
+
+    def blocked_shots_scalar(self, defender, index_tr, goals, indices):
+        """
+        Checks one by one if some shots of a sub list of shots are blocked by a defender. 
+
+        :param defender: The defender to consider. 
+
+        :param index_tr: The index of the sub list of shots. 
+
+        :param goals: The list of goals. 
+
+        :param indices: The indices of the shots to check in the sub list. 
+
+        :return: A tuple (bits, deg), see blocked_shots.
+        """
+        shots = self.shots[index_tr]
+        bits = 0
+        deg = 0
+        for i in indices:
+            if self.exist_goal(defender, shots[i], goals):
+                bits |= 1 << (len(shots) - 1 - i)
+                deg += 1
+        return (bits, deg)
+
+    def compute_opponent_grid(self):
+        """
+        Computes the spatial hash of the opponents (see SpatialHash.py), so that only the 
+        opponents close to a defender are checked for collisions. It must be computed again
+        whenever the opponents move.
+
+        :return: returns nothing.
+        """
+        self.opponent_grid = SpatialHash(self.collision_distance())
+        for i in range(len(self.opponents)):
+            self.opponent_grid.insert(self.opponents[i].pos, i)
 
     def exists_collision_opponents(self, defender, radius):
         """
         Check if there exists a collision between at least one opponent and one defender. 
+        Only the opponents close to the defender are checked (see compute_opponent_grid). 
 
         :param defender: The defender to check the collisions of. 
 
         :return: True if at least one collision exists, False otherwise.
         """
-        for opponent in self.opponents:
-            if defender.collision(opponent, radius):
+        for _, i in self.opponent_grid.neighbours(defender.pos, radius):
+            if defender.collision(self.opponents[i], radius):
                 return True
         return False
 
+    def opponents_near(self, x_min, y_min, x_max, y_max, distance):
+        """
+        Returns the opponents that might be closer than the given distance to a rectangle 
+        of the field (a whole row or block of positions). 
+
+        :param x_min: The left bound of the rectangle. 
+
+        :param y_min: The bottom bound of the rectangle. 
+
+        :param x_max: The right bound of the rectangle. 
+
+        :param y_max: The top bound of the rectangle. 
+
+        :param distance: The distance to consider. 
+
+        :return: The list of opponents.
+        """
+        return [self.opponents[i] for _, i in self.opponent_grid.neighbours_in_box(x_min, y_min, x_max, y_max, distance)]
+
     def exist_goal(self, defender, shot, goals):
         """
         Checks if the current defender intercepts the shot, with regard to at least
@@ -371,94 +1092,865 @@ class Graph:
 
         :return: returns nothing.
         """
-        index = 0
-        # x coordinate being considered
+
+        # x coordinates being considered
         # goes from left to right
-        x = bottom_left.x
-        while x <= top_right.x:
+        xs = self.lattice(bottom_left.x, top_right.x, step)
 
-            # y coordinate being considered
-            # goes bottom to top
-            y = bottom_left.y
-            while y <= top_right.y:
+        # y coordinates being considered
+        # goes bottom to top
+        ys = self.lattice(bottom_left.y, top_right.y, step)
 
-                p = Point(x, y)
+        # only the positions that can block a shot are considered
+        cells = self.candidate_cells(xs, ys, radius, goals)
+        for i_x, i_y, triangles in self.cells_in_triangles(cells, xs, ys):
+            res = self.compute_position(xs[i_x], ys[i_y], radius, goals, triangles)
 
-                in_triangle = None
-                if not self.problem.type == ProblemType.MAX_SPEED:
-                    in_triangle = self.point_in_triangles(p)
-                    if in_triangle == []:
-                        y += step
-                        continue
+            # The defender is added (because it isn't useless)
+            if res != None:
+                self.add_defender(*res)
 
-                # Current defender (if it were to be placed here)
-                defender = Defender(p, radius)
-                deg = 0
+    def compute_position(self, x, y, radius, goals, triangles=False):
+        """
+        Computes the defender placed at a given position, if it is useful. 
 
-                # If there is a collision, go to the next position
-                if self.problem.type == ProblemType.MIN_DIST:
-                    if self.exists_collision_opponents(defender, self.problem["min_dist"]):
+        :param x: The x coordinate of the position. 
 
-                        # Okay so, putting a break here works somehow much better
-                        # but neglects a lot of solutions
-                        y += step
-                        continue
+        :param y: The y coordinate of the position. 
 
-                else:
-                    if self.exists_collision_opponents(defender, self.problem["radius"] * 2):
+        :param radius: Radius of a robot. 
 
-                        # Okay so, putting a break here works somehow much better
-                        # but neglects a lot of solutions
-                        y += step
-                        continue
+        :param goals: The list of goals. 
+
+        :param triangles (opt): The indices of the triangles the position is in, if they are \
+        already known (see cells_in_triangles). 
 
-                # The numerical representation of the edge for now
-                # it is 1 and not 0 because otherwise, as long as no shots is intercepted, the number would
-                # remain 0, losing a lot of information
-                edges = 1
-
-                # Checking every valid shot, if at least one is intercepted, the defender gets added to
-                # the list
-                for i in range(len(self.triangles)):
-                    if in_triangle == None or i in in_triangle:
-                        self.compute_distance_sum(defender, i, index)
-                        for shot in self.shots[i]:
-
-                            if self.exist_goal(defender, shot, goals):
-                                # Shifting to the left (*2) and adding one to signify that
-                                # an edge exists
-                                edges = (edges << 1) + 1
-                                deg += 1
-                            else:
-                                edges = edges << 1
+        :return: A tuple (defender, edges, deg, distance) as expected by add_defender, None if \
+        the defender blocks no shot or collides with an opponent.
+        """
+        p = Point(x, y)
+
+        in_triangle = None
+        if not self.problem.type == ProblemType.MAX_SPEED:
+            in_triangle = triangles if triangles != False else self.point_in_triangles(p)
+            if in_triangle == []:
+                return None
+
+        # Current defender (if it were to be placed here)
+        defender = Defender(p, radius)
+        deg = 0
+        distance = None
+
+        # If there is a collision, go to the next position
+        if self.problem.type == ProblemType.MIN_DIST:
+            if self.exists_collision_opponents(defender, self.problem["min_dist"]):
+
+                # Okay so, putting a break here works somehow much better
+                # but neglects a lot of solutions
+                return None
+
+        else:
+            if self.exists_collision_opponents(defender, self.problem["radius"] * 2):
+
+                # Okay so, putting a break here works somehow much better
+                # but neglects a lot of solutions
+                return None
+
+        # The numerical representation of the edge for now
+        # it is 1 and not 0 because otherwise, as long as no shots is intercepted, the number would
+        # remain 0, losing a lot of information
+        edges = 1
+
+        # Checking every valid shot, if at least one is intercepted, the defender gets added to
+        # the list
+        for i in range(len(self.triangles)):
+            if in_triangle == None or i in in_triangle:
+                d = self.distance_from_triangle(defender, i)
+                distance = d if distance == None else min(distance, d)
+
+                # the blocked shots are computed as a range of angles
+                # (not possible with max_speed, the defender can move)
+                if self.analytic and in_triangle != None:
+                    blocked, nb_blocked = self.blocked_shots(defender, i, goals)
+                    edges = (edges << len(self.shots[i])) | blocked
+                    deg += nb_blocked
+                    continue
+
+                for shot in self.shots[i]:
+
+                    if self.exist_goal(defender, shot, goals):
+                        # Shifting to the left (*2) and adding one to signify that
+                        # an edge exists
+                        edges = (edges << 1) + 1
+                        deg += 1
                     else:
-                        edges = edges << len(self.shots[i])
-                
-                # If the result is not 1
-                # The defender is added (because it isn't useless)
-                if edges != (self.dominant_value + 1) // 2:
+                        edges = edges << 1
+            else:
+                edges = edges << len(self.shots[i])
 
-                    # add the defender to the list of possible defenders
-                    self.defenders.append(defender)
+        # If the result is 1, the defender is useless
+        if edges == (self.dominant_value + 1) // 2:
+            return None
+        return (defender, edges, deg, distance)
 
-                    # add the corresponding edge (= blocked shots)
-                    self.edges.append(edges)
+    def candidate_regions(self, goals):
+        """
+        Computes the regions of the field in which a defender (its center) must be to block
+        at least one shot of a given sub list of shots, once widened by the radius of the robots.
 
-                    # update the maximum degree found (and its index)
-                    if self.max_deg != max(self.max_deg, deg):
-                        self.max_deg = deg
-                        self.max_deg_index = index
+        With a single goal, this is the triangle going from the opponent to the goal. With
+        multiple goals, a shot is blocked if it is intercepted wrt any goal (see exist_goal),
+        the intersection can then be anywhere on the line of the shot, between the opponent and
+        the line of another goal (even behind the opponent). The regions are then the two cones
+        defined by the triangle (forward and backward) up to the end of the field.
 
-                    # add the degree of this node to the list of degrees
-                    self.deg.append(deg)
-                    index += 1
+        :param goals: The list of goals.
 
-                # we created a cell in case, but we can remove it if the defender is useless
-                else:
-                    del self.total_distance_defender[-1]
-                
-                y += step
-            x += step
+        :return: The list of convex regions (a sub list per triangle).
+        """
+        if len(goals) <= 1:
+            return [[triangle] for triangle in self.triangles]
+
+        # long enough to go through the whole field from anywhere on the field
+        bottom_left = self.problem["bottom_left"]
+        top_right = self.problem["top_right"]
+        length = 2 * bottom_left.distance(top_right)
+
+        res = []
+        for triangle in self.triangles:
+            apex = triangle.points[0]
+            cones = []
+            for direction in (1, -1):
+                points = [apex]
+                for post in triangle.points[1:]:
+                    v = Vector.v_from_pp(apex, post)
+                    if v.norm() == 0:
+                        continue
+                    v = v.normalize() * (direction * (length + apex.distance(bottom_left)))
+                    points.append(apex + v)
+                cones.append(ConvexShape(points))
+            res.append(cones)
+        return res
+
+    def reach_distances(self, goals):
+        """
+        Computes, in the case of max_speed, how far from the region of a triangle (see 
+        candidate_regions) a defender can be and still intercept one of its shots. The defender
+        must reach the point of the shot the closest to it before the ball (see 
+        Goal.shot_intercepted_with_speed), its distance to the shot is then at most 
+        robot_max_speed / ball_max_speed times the distance covered by the ball.
+
+        With a single goal, this point is between the opponent and the goal, the ball covers at
+        most the distance between the opponent and the farthest post. With multiple goals, it can
+        be anywhere on the line of the shot, but it is closer to the opponent than the defender, 
+        which is on the field: the ball covers at most the distance between the opponent and the
+        farthest corner of the field.
+
+        :param goals: The list of goals.
+
+        :return: The list of distances (one per triangle).
+        """
+        ratio = self.problem["robot_max_speed"] / self.problem["ball_max_speed"]
+        bottom_left = self.problem["bottom_left"]
+        top_right = self.problem["top_right"]
+        corners = [Point(x, y) for x in (bottom_left.x, top_right.x) for y in (bottom_left.y, top_right.y)]
+
+        res = []
+        for triangle in self.triangles:
+            apex = triangle.points[0]
+            if len(goals) <= 1:
+                length = max(apex.distance(post) for post in triangle.points[1:])
+            else:
+                length = max(apex.distance(corner) for corner in corners)
+            res.append(ratio * length)
+        return res
+
+    def candidate_cells(self, xs, ys, radius, goals, triangles=None):
+        """
+        Enumerates the positions of the lattice that can block at least one shot, by rasterizing
+        the regions defined by candidate_regions, widened by the radius of the robots, column by 
+        column. This is a superset of the positions that block a shot, and the cost is proportional
+        to the area of the regions instead of the area of the field. 
+
+        In the case of max_speed, a defender can move, the regions are also widened by the
+        distance it can move before the ball passes (see reach_distances). Only the columns of
+        the strip are enumerated if the graph is a strip of the field (see columns), and only
+        the given positions if the graph is restricted to some positions (see cells).
+
+        :param xs: The x coordinates of the lattice. 
+
+        :param ys: The y coordinates of the lattice. 
+
+        :param radius: The radius of the robots. 
+
+        :param goals: The list of goals. 
+
+        :param triangles (opt): If given, only the positions that can block a shot of these \
+        triangles (indices) are enumerated. 
+
+        :return: A generator of tuples (i, j), (xs[i], ys[j]) being a position, in the same order \
+        as the lattice (x first, then y).
+        """
+        # only the columns of the strip (see ParallelGraphBuilder.py)
+        columns = range(len(xs))
+        if self.columns != None:
+            columns = range(max(0, self.columns.start), min(len(xs), self.columns.stop))
+
+        # only the given positions (see cells)
+        for cell in self.candidate_cells_(xs, ys, radius, goals, triangles, columns):
+            if self.cells == None or cell in self.cells:
+                yield cell
+
+    def candidate_cells_(self, xs, ys, radius, goals, triangles, columns):
+        """
+        Enumerates the positions of the lattice that can block at least one shot in some columns
+        (see candidate_cells).
+
+        :param xs: The x coordinates of the lattice. 
+
+        :param ys: The y coordinates of the lattice. 
+
+        :param radius: The radius of the robots. 
+
+        :param goals: The list of goals. 
+
+        :param triangles: The indices of the triangles to consider, None for all of them. 
+
+        :param columns: The range of columns to enumerate. 
+
+        :return: A generator of tuples (i, j), in the same order as the lattice.
+        """
+        regions = self.candidate_regions(goals)
+
+        # rounding errors should not remove a position
+        margins = [radius + self.tolerance] * len(regions)
+
+        # a defender can move towards the shots (see reach_distances)
+        if self.problem.type == ProblemType.MAX_SPEED:
+            margins = [margins[i] + reach for i, reach in enumerate(self.reach_distances(goals))]
+
+        if triangles != None:
+            regions = [regions[i] for i in triangles]
+            margins = [margins[i] for i in triangles]
+        regions = [(shape, margins[i]) for i in range(len(regions)) for shape in regions[i]]
+
+        for i in columns:
+
+            # all the intervals of rows of this column
+            intervals = []
+            for shape, margin in regions:
+                y_range = shape.y_range(xs[i] - margin, xs[i] + margin)
+                if y_range == None:
+                    continue
+                low = bisect.bisect_left(ys, y_range[0] - margin)
+                high = bisect.bisect_right(ys, y_range[1] + margin)
+                if low < high:
+                    intervals.append((low, high))
+
+            # merging the intervals so that a position is only enumerated once
+            intervals.sort()
+            current = 0
+            for low, high in intervals:
+                for j in range(max(low, current), high):
+                    yield (i, j)
+                current = max(current, high)
+
+    def lattice(self, low, high, step):
+        """
+        Computes every coordinate of the lattice between two bounds. The coordinates
+        are accumulated (and not computed as low + k * step) so that every engine
+        uses the exact same floating point values. 
+
+        :param low: The first coordinate. 
+
+        :param high: The maximum coordinate (included). 
+
+        :param step: The distance between two consecutive coordinates. 
+
+        :return: The list of coordinates.
+        """
+        res = []
+        c = low
+        while c <= high:
+            res.append(c)
+            c += step
+        return res
+
+    def add_defender(self, defender, edges, deg, distance):
+        """
+        Adds a new defender (that blocks at least one shot) to the graph. 
+
+        :param defender: The defender to add. 
+
+        :param edges: The numerical representation of the shots it blocks (see above). 
+
+        :param deg: The number of shots it blocks. 
+
+        :param distance: How optimal its position is (see distance_from_triangle). 
+
+        :return: returns nothing.
+        """
+        index = len(self.defenders)
+        self.defenders.append(defender)
+        self.edges.append(edges)
+        self.deg.append(deg)
+        self.total_distance_defender.append(distance)
+
+        # update the maximum degree found (and its index)
+        if deg > self.max_deg:
+            self.max_deg = deg
+            self.max_deg_index = index
+
+    def prioritized_cells(self, xs, ys, radius, goals):
+        """
+        Lists the positions of the lattice that can block a shot (see candidate_cells), the most
+        promising ones first. A position is as promising as its distance from the perfect distance
+        of the triangles it is in is small (see distance_from_triangle): a defender placed at
+        the perfect distance blocks every shot of a triangle. The positions in no triangle are
+        last, the others are in the same order as the lattice in case of equality.
+
+        :param xs: The x coordinates of the lattice (rounded like a Point).
+
+        :param ys: The y coordinates of the lattice (rounded like a Point).
+
+        :param radius: The radius of the robots.
+
+        :param goals: The list of goals.
+
+        :return: The list of tuples (i, j), (xs[i], ys[j]) being a position.
+        """
+        cells = list(self.candidate_cells(xs, ys, radius, goals))
+        if len(cells) == 0:
+            return cells
+
+        builder = NumpyGraphBuilder(self)
+        opt = np.array([self.perfect_distance_from_triangle(tr, radius) for tr in self.triangles])
+        apex_x = np.array([tr.points[0].x for tr in self.triangles])
+        apex_y = np.array([tr.points[0].y for tr in self.triangles])
+
+        indices = np.array(cells, dtype=np.int64)
+        lattice_x = np.array(xs, dtype=np.float64)
+        lattice_y = np.array(ys, dtype=np.float64)
+        scores = np.empty(len(cells))
+
+        for start in range(0, len(cells), builder.block_size):
+            block = indices[start:start + builder.block_size]
+            b_x = lattice_x[block[:, 0]]
+            b_y = lattice_y[block[:, 1]]
+
+            # with max_speed, a defender can block the shots of any triangle
+            if self.problem.type == ProblemType.MAX_SPEED:
+                in_tr = np.ones((len(block), len(self.triangles)), dtype=bool)
+            else:
+                in_tr = self.points_in_triangles(b_x, b_y)
+
+            dst = np.sqrt((apex_x - b_x[:, None]) ** 2 + (apex_y - b_y[:, None]) ** 2)
+            scores[start:start + len(block)] = np.where(in_tr, np.abs(opt - dst) * 10, np.inf).min(axis=1)
+
+        return [cells[k] for k in np.argsort(scores, kind="stable")]
+
+    def stream(self, batch_size=1024):
+        """
+        Computes the positions of the defenders of a lazy graph (see lazy) by batches, the most
+        promising positions first (see prioritized_cells). The useful defenders are added to the
+        graph after each batch, a copy of the graph made of the defenders computed so far can then
+        be given to a solver (see snapshot). Once every position is computed, the collisions 
+        between the defenders are computed and the graph is a complete graph (not lazy anymore), 
+        the same as the one the constructor computes except for the order of the defenders. 
+
+        The generator can be stopped at any time, the positions not computed yet are kept 
+        (see pending) and calling this method again resumes the computation.
+
+        :param batch_size (opt): The number of positions computed by batch (default: 1024).
+
+        :return: A generator yielding the number of defenders computed so far after each batch \
+        (nothing if the graph is not lazy).
+        """
+        if not self.lazy:
+            return
+
+        problem = self.problem
+        radius = problem["radius"]
+        goals = problem["goals"]
+        bottom_left = problem["bottom_left"]
+        top_right = problem["top_right"]
+        step = problem["pos_step"]
+
+        # the exact same coordinates for both engines (rounded like a Point)
+        xs = [round(x, Point.n_digits_round) for x in self.lattice(bottom_left.x, top_right.x, step)]
+        ys = [round(y, Point.n_digits_round) for y in self.lattice(bottom_left.y, top_right.y, step)]
+
+        # reversed, so that the next batch is removed from the end of the list
+        if self.pending == None:
+            self.pending = self.prioritized_cells(xs, ys, radius, goals)
+            self.pending.reverse()
+
+        builder = None
+        if self.engine == "numpy":
+            builder = NumpyGraphBuilder(self, self.block_size())
+
+        while len(self.pending) > 0:
+            batch = self.pending[-batch_size:]
+            del self.pending[-batch_size:]
+            batch.reverse()
+
+            if builder != None:
+                builder.compute_positions(batch, xs, ys, radius, goals)
+            else:
+                for i, j, triangles in self.cells_in_triangles(batch, xs, ys):
+                    res = self.compute_position(xs[i], ys[j], radius, goals, triangles)
+                    if res != None:
+                        self.add_defender(*res)
+
+            yield len(self.defenders)
+
+        # every position has been computed
+        self.lazy = False
+        self.pending = None
+        self.compute_conflicts()
+        self.convert_edges()
+
+    def snapshot(self):
+        """
+        Creates a graph made of the defenders of a lazy graph computed so far (see stream). The 
+        shots, triangles and problem are shared with this graph, the lists of defenders are copied,
+        the collisions between the defenders are computed and the edges are stored as requested
+        (see edges_backend). The snapshot is not lazy, it is not updated by stream. 
+
+        :return: The new Graph object.
+        """
+        res = copy.copy(self)
+        res.lazy = False
+        res.pending = None
+        res.defenders = self.defenders.copy()
+        res.edges = list(self.edges)
+        res.deg = list(self.deg)
+        res.total_distance_defender = list(self.total_distance_defender)
+        res.compute_conflicts()
+        res.convert_edges()
+        return res
+
+    def move_opponent(self, index, position):
+        """
+        Moves an opponent and updates the graph accordingly (see update_opponent). 
+
+        :param index: The index of the opponent to move. 
+
+        :param position: The new position of the opponent (a Point). 
+
+        :return: returns nothing.
+        """
+        self.update_opponent(index, Opponent(position))
+
+    def add_opponent(self, position):
+        """
+        Adds an opponent (at the end of the list of opponents) and updates the graph 
+        accordingly (see update_opponent). 
+
+        :param position: The position of the opponent (a Point). 
+
+        :return: returns nothing.
+        """
+        self.update_opponent(len(self.opponents), Opponent(position))
+
+    def remove_opponent(self, index):
+        """
+        Removes an opponent and updates the graph accordingly (see update_opponent). 
+
+        :param index: The index of the opponent to remove. 
+
+        :return: returns nothing.
+        """
+        self.update_opponent(index, None)
+
+    def update_opponent(self, index, opponent):
+        """
+        Replaces (or adds, or removes) an opponent without computing the whole graph again. 
+        Only the shots of this opponent are computed again, and only the positions that could
+        block a shot of this opponent (before or after) or that collide with it (before or after)
+        are computed again. Every other defender keeps the same blocked shots, its edges are only
+        shifted to make room for the new shots of the opponent.
+
+        The resulting graph has the same defenders (and edges, degrees...) as a graph computed
+        from scratch, except for their order: the defenders that still exist keep their order,
+        the new ones are added at the end. The list of opponents of the problem is modified too.
+        With max_speed, the distance of every defender to the triangles is computed again, since
+        it depends on every triangle. This is not possible with the "mmap" storage.
+
+        :param index: The index of the opponent (len(self.opponents) to add a new one). 
+
+        :param opponent: The new opponent, None to remove it. 
+
+        :return: returns nothing.
+        """
+        if self.storage == "mmap":
+            raise ValueError("the graph can not be updated with the mmap storage")
+
+        problem = self.problem
+        goals = problem["goals"]
+        radius = problem["radius"]
+        old = self.opponents[index] if index < len(self.opponents) else None
+        nb_opp = len(self.opponents)
+        new_nb_opp = nb_opp + (old == None) - (opponent == None)
+
+        xs = [Point(x, 0).x for x in self.lattice(problem["bottom_left"].x, problem["top_right"].x, problem["pos_step"])]
+        ys = [Point(0, y).y for y in self.lattice(problem["bottom_left"].y, problem["top_right"].y, problem["pos_step"])]
+
+        # the positions to compute again, wrt the previous opponent
+        cells = set()
+        if old != None:
+            triangles = [g * nb_opp + index for g in range(len(goals))]
+            cells.update(self.candidate_cells(xs, ys, radius, goals, triangles))
+            cells.update(self.cells_around(xs, ys, old.pos))
+            cells.update(self.cells_on_sides(xs, ys, triangles))
+
+        # the edges are manipulated as integers
+        edges = list(self.edges)
+
+        # the bits of the opponent (one range per goal) in the previous edges
+        lengths = [len(shots) for shots in self.shots]
+        splices = []
+        for g in range(len(goals)):
+            t = g * nb_opp + index
+            suffix = sum(lengths[t + (old != None):])
+            splices.append((suffix, lengths[t] if old != None else 0))
+
+        # updating the shots and triangles of the opponent
+        if old == None:
+            self.opponents.append(opponent)
+        elif opponent == None:
+            del self.opponents[index]
+            self.shots.remove_opponent(index)
+        else:
+            self.opponents[index] = opponent
+        self.compute_opponent_grid()
+
+        new_lengths = []
+        for g in range(len(goals)):
+            t = g * new_nb_opp + index
+            if old != None:
+                self.nb_shots -= len(self.shots[t])
+                del self.shots[t]
+                del self.shot_angles[t]
+                del self.shot_trigonometry[t]
+                del self.triangles[t]
+                del self.goal_lines[t]
+                del self.triangle_geometry[t]
+            if opponent == None:
+                new_lengths.append(0)
+                continue
+            shots = self.compute_shots(opponent, problem["theta_step"], goals[g])
+            self.nb_shots += len(shots)
+            self.shot_angles.insert(t, [shot.angle for shot in shots])
+            self.shots.insert(t, self.shot_angles[t], index, g)
+            self.shot_trigonometry.insert(t, self.trigonometry(self.shot_angles[t]))
+            self.triangles.insert(t, ConvexShape.compute_triangle(opponent, goals[g]))
+            self.goal_lines.insert(t, self.compute_goal_line(goals[g], opponent))
+            self.triangle_geometry.insert(t, self.compute_triangle_geometry(self.triangles[t]))
+            new_lengths.append(len(shots))
+        self.dominant_value = pow(2, self.nb_shots + 1) - 1
+
+        # making room for the new shots (the first bits are the ones of the first goal)
+        for i in range(len(edges)):
+            for g in range(len(goals)):
+                edges[i] = self.splice_edges(edges[i], splices[g][0], splices[g][1], new_lengths[g])
+
+        # the positions to compute again, wrt the new opponent
+        if opponent != None:
+            triangles = [g * new_nb_opp + index for g in range(len(goals))]
+            cells.update(self.candidate_cells(xs, ys, radius, goals, triangles))
+            cells.update(self.cells_around(xs, ys, opponent.pos))
+            cells.update(self.cells_on_sides(xs, ys, triangles))
+
+        indices = {}
+        for i in range(len(self.defenders)):
+            indices[(self.defenders[i].pos.x, self.defenders[i].pos.y)] = i
+
+        removed = set()
+        added = []
+        for i_x, i_y, triangles in self.cells_in_triangles(sorted(cells), xs, ys):
+            res = self.compute_position(xs[i_x], ys[i_y], radius, goals, triangles)
+            i = indices.get((xs[i_x], ys[i_y]))
+            if i == None:
+                if res != None:
+                    added.append(res)
+            elif res == None:
+                removed.add(i)
+            else:
+                self.defenders[i], edges[i], self.deg[i], self.total_distance_defender[i] = res
+
+        keep = [i for i in range(len(self.defenders)) if i not in removed]
+        self.defenders = self.defenders.take(keep)
+        self.deg = [self.deg[i] for i in keep]
+        self.total_distance_defender = [self.total_distance_defender[i] for i in keep]
+        self.edges = [edges[i] for i in keep]
+        for res in added:
+            self.add_defender(*res)
+        self.update_conflicts(keep)
+
+        # with max_speed, the distance of a defender is the minimum over every triangle (see
+        # compute_position), it may have changed with the triangles of the opponent
+        if self.problem.type == ProblemType.MAX_SPEED:
+            for i in range(len(self.defenders)):
+                self.total_distance_defender[i] = min((self.distance_from_triangle(self.defenders[i], t)
+                                                       for t in range(len(self.triangles))), default=None)
+
+        # the maximum degree may have been removed
+        self.max_deg = 0
+        self.max_deg_index = 0
+        for i in range(len(self.deg)):
+            if self.deg[i] > self.max_deg:
+                self.max_deg = self.deg[i]
+                self.max_deg_index = i
+
+        self.convert_edges()
+
+    def update_conflicts(self, keep):
+        """
+        Updates the collisions between defenders (see conflicts) after some defenders have been
+        removed and some added at the end of the list. The kept defenders did not move, the 
+        collisions between them are the same, only the collisions of the new defenders are computed.
+
+        :param keep: The previous indices of the kept defenders, in order (the defenders after \
+        them are the new ones).
+
+        :return: returns nothing.
+        """
+        nb = len(self.defenders)
+        nb_old = len(self.conflicts)
+        distance = self.collision_distance()
+
+        # the kept defenders are renumbered
+        conflicts = []
+        if len(keep) == nb_old:
+            conflicts = self.conflicts.copy()
+        else:
+            keep_bits = np.array(keep, dtype=np.int64)
+            for i in keep:
+                bits = np.frombuffer(self.conflicts[i].to_bytes((nb_old + 7) // 8, "little"), dtype=np.uint8)
+                bits = np.unpackbits(bits, bitorder="little")[keep_bits]
+                conflicts.append(int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little"))
+
+        # the defenders are only created once (see Tables.py)
+        defenders = list(self.defenders)
+
+        grid = SpatialHash(distance)
+        for i in range(nb):
+            grid.insert(defenders[i].pos, i)
+
+        for i in range(len(keep), nb):
+            defender = defenders[i]
+            bits = bytearray((nb + 7) // 8)
+            for _, j in grid.neighbours(defender.pos, distance):
+                if defender.collision(defenders[j], distance):
+                    bits[j // 8] |= 1 << (j % 8)
+
+                    # the kept defenders were not colliding with this one before
+                    if j < len(keep):
+                        conflicts[j] |= 1 << i
+            conflicts.append(int.from_bytes(bits, "little"))
+
+        self.conflicts = conflicts
+
+    def splice_edges(self, edges, suffix, old_length, new_length):
+        """
+        Replaces a range of bits of the numerical representation of the edges of a defender 
+        by a range of 0 of another length (the bits of the shots of an opponent that moved). 
+
+        :param edges: The numerical representation of the edges (with the leading 1). 
+
+        :param suffix: The number of bits after the range. 
+
+        :param old_length: The number of bits of the range. 
+
+        :param new_length: The number of bits of the new range. 
+
+        :return: The new numerical representation.
+        """
+        return ((edges >> (suffix + old_length)) << (suffix + new_length)) | (edges & ((1 << suffix) - 1))
+
+    def cells_on_sides(self, xs, ys, triangles):
+        """
+        Computes the positions of the defenders that intersect the lines of the sides of some
+        triangles. Such a defender is considered in the triangle (see point_in_triangles), which
+        changes its distance (see distance_from_triangle), even if it is far from the triangle
+        and blocks none of its shots.
+
+        :param xs: The x coordinates of the lattice. 
+
+        :param ys: The y coordinates of the lattice. 
+
+        :param triangles: The indices of the triangles. 
+
+        :return: The list of tuples (i, j), (xs[i], ys[j]) being the position of a defender.
+        """
+        margin = self.problem["radius"] + self.tolerance
+        lines = []
+        for t in triangles:
+            apex = self.triangles[t].points[0]
+            for post in self.triangles[t].points[1:]:
+                v = Vector.v_from_pp(apex, post)
+                if v.norm() != 0:
+                    v = v.normalize()
+                    lines.append((apex, v))
+
+        res = []
+        for defender in self.defenders:
+            p = defender.pos
+            for apex, v in lines:
+                if abs(v.x * (p.y - apex.y) - v.y * (p.x - apex.x)) <= margin:
+                    res.append((bisect.bisect_left(xs, p.x), bisect.bisect_left(ys, p.y)))
+                    break
+        return res
+
+    def cells_around(self, xs, ys, point):
+        """
+        Computes the positions of the lattice that could collide with an opponent at a given point. 
+
+        :param xs: The x coordinates of the lattice. 
+
+        :param ys: The y coordinates of the lattice. 
+
+        :param point: The position of the opponent. 
+
+        :return: The list of tuples (i, j), (xs[i], ys[j]) being a position.
+        """
+        distance = self.collision_distance() + self.tolerance
+        x_range = range(bisect.bisect_left(xs, point.x - distance), bisect.bisect_right(xs, point.x + distance))
+        y_range = range(bisect.bisect_left(ys, point.y - distance), bisect.bisect_right(ys, point.y + distance))
+        return [(i, j) for i in x_range for j in y_range]
+
+    def reduce(self):
+        """
+        Reduces the graph before solving it: removes the defenders dominated by another one, the 
+        shots implied by another one, and selects the defenders that are the only ones blocking 
+        a shot (see GraphReduction.py). The graph itself is not modified. This is not possible 
+        with the "mmap" storage. 
+
+        :return: A GraphReduction object, its reduced graph can be given to any solver, and its \
+        expand method converts the solution back to a solution of this graph.
+        """
+        if self.storage == "mmap":
+            raise ValueError("the graph can not be reduced with the mmap storage")
+        return GraphReduction(self)
+
+    def components(self):
+        """
+        Splits the graph into independent parts: the connected components of the graph made of
+        the defenders and the shots, a defender being linked to the shots it blocks and to the 
+        defenders it collides with. Two components share no shot and their defenders can not 
+        collide, therefore a minimum dominating set of the graph is the union of minimum 
+        dominating sets of its components. This is not possible with the "mmap" storage. 
+
+        :return: The list of components, each one being a tuple (defenders, shots) of sorted lists \
+        of indices (shots indexed in the whole list of shots). A component without defenders is a \
+        shot that can not be blocked.
+        """
+        if self.storage == "mmap":
+            raise ValueError("the graph can not be split with the mmap storage")
+
+        nb_def = len(self.defenders)
+        sets = UnionFind(nb_def + self.nb_shots)
+
+        # the shots blocked by each defender (the shot s is the element nb_def + s)
+        edges = self.edges
+        if not isinstance(edges, BitMatrix):
+            edges = BitMatrix.from_ints(edges, self.nb_shots)
+        if nb_def > 0:
+            rows, columns = np.nonzero(edges.unpack(edges.words))
+            for d, s in zip(rows.tolist(), columns.tolist()):
+                sets.union(d, nb_def + s)
+
+        # the collisions between defenders
+        for i in range(nb_def):
+            bits = np.frombuffer(self.conflicts[i].to_bytes((nb_def + 7) // 8, "little"), dtype=np.uint8)
+            for j in np.nonzero(np.unpackbits(bits, bitorder="little"))[0].tolist():
+                if j > i:
+                    sets.union(i, j)
+
+        res = []
+        for group in sets.groups():
+            res.append(([e for e in group if e < nb_def], [e - nb_def for e in group if e >= nb_def]))
+        return res
+
+    def subgraph(self, defenders, shots):
+        """
+        Creates the graph made of some defenders and some shots of this graph. The triangles
+        and problem are shared with this graph, everything indexed by the defenders or the
+        shots (positions, edges, degrees, collisions...) is computed again. The subgraph
+        can not be updated (see update_opponent). 
+
+        :param defenders: The indices of the defenders to keep, in increasing order. 
+
+        :param shots: The indices of the shots to keep (in the whole list of shots), in \
+        increasing order. 
+
+        :return: The new Graph object.
+        """
+        res = copy.copy(self)
+        res.cache = None
+        nb_def = len(self.defenders)
+
+        # the sub lists of shots are filtered
+        res.shots = self.shots.take(shots)
+        res.shot_angles = []
+        res.shot_trigonometry = []
+        kept = set(shots)
+        start = 0
+        for t in range(len(self.shots)):
+            indices = [i for i in range(len(self.shots[t])) if start + i in kept]
+            res.shot_angles.append([self.shot_angles[t][i] for i in indices])
+            res.shot_trigonometry.append(tuple(values[indices] for values in self.shot_trigonometry[t]))
+            start += len(self.shots[t])
+        res.nb_shots = len(shots)
+        res.dominant_value = pow(2, res.nb_shots + 1) - 1
+
+        # the kept columns of the edges, the first shot being the most significant bit
+        edges = self.edges
+        if not isinstance(edges, BitMatrix):
+            edges = BitMatrix.from_ints(edges, self.nb_shots)
+        matrix = edges.unpack(edges.rows(defenders)) if len(defenders) > 0 else np.zeros((0, self.nb_shots), dtype=bool)
+        matrix = matrix[:, shots]
+        nb_bytes = (res.nb_shots + 1 + 7) // 8
+        padded = np.zeros((len(defenders), nb_bytes * 8), dtype=bool)
+        padded[:, nb_bytes * 8 - res.nb_shots - 1] = True
+        padded[:, nb_bytes * 8 - res.nb_shots:] = matrix
+        raw = np.packbits(padded, axis=1).tobytes()
+
+        res.defenders = DefenderTable(self.problem["radius"])
+        res.edges = []
+        res.deg = []
+        res.total_distance_defender = []
+        res.max_deg = 0
+        res.max_deg_index = 0
+        for k in range(len(defenders)):
+            res.add_defender(self.defenders[defenders[k]], int.from_bytes(raw[k * nb_bytes:(k + 1) * nb_bytes], "big"),
+                             int(matrix[k].sum()), self.total_distance_defender[defenders[k]])
+
+        # the kept defenders are renumbered in the collisions
+        keep_bits = np.array(defenders, dtype=np.int64)
+        res.conflicts = []
+        for i in defenders:
+            bits = np.frombuffer(self.conflicts[i].to_bytes((nb_def + 7) // 8, "little"), dtype=np.uint8)
+            bits = np.unpackbits(bits, bitorder="little")[keep_bits]
+            res.conflicts.append(int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little"))
+
+        res.convert_edges()
+        return res
+
+    def valid_defender_mask(self, forbidden, new_def):
+        """
+        Checks if a new defender collides with a set of defenders, given the numerical representation
+        of the defenders colliding with this set (see forbidden_mask). This is the same as
+        valid_defender, but in constant time. 
+
+        :param forbidden: The defenders colliding with the set. 
+
+        :param new_def: The defender that shall not have collisions with the set. 
+
+        :return: True if there is no collision, False otherwise.
+        """
+        return not (forbidden >> new_def) & 1
 
     def valid_defender(self, def_list, new_def):
         """
@@ -472,9 +1964,7 @@ class Graph:
 
         :return: True if there exists a collision, False otherwise.
         """
-        radius = self.problem["radius"] * 2
-        if self.problem.type == ProblemType.MIN_DIST:
-            radius = self.problem["min_dist"]
+        radius = self.collision_distance()
 
         for defender in def_list:
             if self.defenders[defender].collision(self.defenders[new_def], radius):
@@ -493,6 +1983,11 @@ class Graph:
 
         :return: returns nothing.
         """
+        # some arrays (BitMatrix for example) know how to swap their elements faster
+        if hasattr(arr, "swap"):
+            arr.swap(i, j)
+            return
+
         tmp = arr[i]
         arr[i] = arr[j]
         arr[j] = tmp
@@ -518,6 +2013,11 @@ class Graph:
                     for arr in arrays:
                         self.swap(arr, j, j+1)
 
+        # the conflicts are indexed by defender, they have moved
+        for arr in arrays:
+            if arr is self.defenders:
+                self.compute_conflicts()
+
     def index_list_to_defenders(self, indices):
         """
         Transforms a list of defenders indices into a list of defenders.
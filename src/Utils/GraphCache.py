@@ -0,0 +1,259 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import hashlib
+import numpy as np
+from src.Utils.Point import Point
+from src.Utils.Vector import Vector
+from src.Utils.ConvexShape import ConvexShape
+from src.Utils.UsefulTypes import Player, Goal
+from src.Utils.Tables import DefenderTable
+
+"""
+This module is used to store the graphs already computed on the disk, so that the same
+problem does not have to be computed again (by another solver for example).
+"""
+
+class GraphCache:
+
+    """
+    This class is a directory of computed graphs. Each graph is stored in a .npz file named
+    after a hash of the decoded inputs of its problem, the optimized flag and the version
+    of the graph generation (see Graph.version). Loading a graph from the cache gives exactly
+    the same graph as computing it.
+
+    When the files of the cache exceed the maximum size, the least recently used ones are
+    removed (a file is used when it is loaded or stored).
+
+    :ivar directory: The directory of the cache.
+
+    :ivar max_size: The maximum size of the cache in bytes (None for no limit).
+    """
+
+    def __init__(self, directory, max_size=None):
+        """
+        Constructs a new 'GraphCache' object, the directory is created if needed.
+
+        :param directory: The directory of the cache.
+
+        :param max_size (opt): The maximum size of the cache in bytes (default: None, no limit).
+
+        :return: returns nothing.
+        """
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def describe(self, value):
+        """
+        Converts a decoded input of a problem into a representation that only depends on its
+        content (used to hash the problem).
+
+        :param value: The value to convert.
+
+        :return: The representation (made of tuples, strings and numbers).
+        """
+        if isinstance(value, (Point, Vector)):
+            return ("point", value.x, value.y)
+        if isinstance(value, Goal):
+            return ("goal", self.describe(value.s_pos), self.describe(value.e_pos), self.describe(value.dir))
+        if isinstance(value, Player):
+            return ("player", self.describe(value.pos), value.radius)
+        if isinstance(value, (list, tuple)):
+            return tuple(self.describe(v) for v in value)
+        if isinstance(value, dict):
+            return tuple((k, self.describe(value[k])) for k in sorted(value))
+        return value
+
+    def key(self, problem, optimized):
+        """
+        Computes the key of a graph in the cache.
+
+        :param problem: The problem of the graph.
+
+        :param optimized: The optimized flag of the graph.
+
+        :return: The key (an hexadecimal string).
+        """
+        # imported here, Graph.py imports this module
+        from src.Utils.Graph import Graph
+
+        content = (problem.type.name, self.describe(problem.inputs), bool(optimized), Graph.version)
+        return hashlib.sha256(repr(content).encode()).hexdigest()
+
+    def path(self, problem, optimized):
+        """
+        Computes the path of the file of a graph.
+
+        :param problem: The problem of the graph.
+
+        :param optimized: The optimized flag of the graph.
+
+        :return: The path of the file.
+        """
+        return os.path.join(self.directory, self.key(problem, optimized) + ".npz")
+
+    def load(self, graph):
+        """
+        Fills a graph with its stored version, if there is one. The opponents of the graph
+        must already be set.
+
+        :param graph: The graph to fill.
+
+        :return: True if the graph was in the cache (and has been filled), False otherwise.
+        """
+        path = self.path(graph.problem, graph.optimized)
+        try:
+            with np.load(path) as data:
+                data = dict(data)
+        except Exception:
+            return False
+
+        # this file has just been used
+        os.utime(path)
+
+        radius = graph.problem["radius"]
+        nb_opp = len(graph.opponents)
+
+        # the shots, one sub list per goal and opponent
+        start = 0
+        lengths = data["shot_lengths"].tolist()
+        for t in range(len(lengths)):
+            angles = data["shot_angles"][start:start + lengths[t]].tolist()
+            graph.shots.append(angles, t % nb_opp, t // nb_opp)
+            graph.shot_angles.append(angles)
+            graph.shot_trigonometry.append(graph.trigonometry(angles))
+            start += lengths[t]
+        graph.nb_shots = start
+        graph.dominant_value = pow(2, graph.nb_shots + 1) - 1
+
+        for t in range(len(data["triangles"])):
+            graph.triangles.append(ConvexShape([Point(float(x), float(y)) for x, y in data["triangles"][t]]))
+            line = data["goal_lines"][t]
+            graph.goal_lines.append(None if np.isnan(line[0]) else tuple(float(v) for v in line))
+            graph.triangle_geometry.append(graph.compute_triangle_geometry(graph.triangles[t]))
+
+        # the defenders and their edges (stored as fixed size big endian integers)
+        nb_bytes = data["edges"].shape[1]
+        edges = data["edges"].tobytes()
+        positions = data["positions"]
+        graph.defenders = DefenderTable(radius, positions[:, 0], positions[:, 1])
+        for i in range(len(positions)):
+            graph.edges.append(int.from_bytes(edges[i * nb_bytes:(i + 1) * nb_bytes], "big"))
+        graph.deg = data["deg"].tolist()
+        graph.total_distance_defender = data["distances"].tolist()
+        graph.max_deg = int(data["max_deg"])
+        graph.max_deg_index = int(data["max_deg_index"])
+
+        # the collisions between defenders, stored as pairs of indices
+        nb = len(graph.defenders)
+        pairs = data["conflicts"]
+        bounds = np.searchsorted(pairs[:, 0], np.arange(nb + 1))
+        for i in range(nb):
+            row = np.zeros((nb + 7) // 8, dtype=np.uint8)
+            js = pairs[bounds[i]:bounds[i + 1], 1]
+            np.bitwise_or.at(row, js // 8, (1 << (js % 8)).astype(np.uint8))
+            graph.conflicts.append(int.from_bytes(row.tobytes(), "little"))
+        return True
+
+    def store(self, graph):
+        """
+        Stores a computed graph (its edges must be integers), then removes the least recently
+        used files if the cache is too big. The graph just stored is never removed, even if it
+        is bigger than the maximum size on its own (the cache then only contains this graph).
+
+        :param graph: The graph to store.
+
+        :return: returns nothing.
+        """
+        nb = len(graph.defenders)
+        nb_bytes = (graph.nb_shots + 1 + 7) // 8
+        edges = b"".join(e.to_bytes(nb_bytes, "big") for e in graph.edges)
+
+        conflicts = [np.zeros((0, 2), dtype=np.int64)]
+        for i in range(nb):
+            bits = np.unpackbits(np.frombuffer(graph.conflicts[i].to_bytes((nb + 7) // 8, "little"), dtype=np.uint8),
+                                 bitorder="little")
+            js = np.nonzero(bits)[0]
+            conflicts.append(np.stack((np.full(len(js), i), js), axis=1))
+
+        goal_lines = [line if line != None else (np.nan, np.nan, np.nan) for line in graph.goal_lines]
+
+        data = {
+            "shot_lengths": np.array([len(shots) for shots in graph.shots], dtype=np.int64),
+            "shot_angles": np.array([a for angles in graph.shot_angles for a in angles], dtype=np.float64),
+            "triangles": np.array([[(p.x, p.y) for p in tr.points] for tr in graph.triangles],
+                                  dtype=np.float64).reshape(-1, 3, 2),
+            "goal_lines": np.array(goal_lines, dtype=np.float64).reshape(-1, 3),
+            "positions": np.stack((graph.defenders.x, graph.defenders.y), axis=1),
+            "edges": np.frombuffer(edges, dtype=np.uint8).reshape(nb, nb_bytes),
+            "deg": np.array(graph.deg, dtype=np.int64),
+            "distances": np.array(graph.total_distance_defender, dtype=np.float64),
+            "max_deg": np.array(graph.max_deg),
+            "max_deg_index": np.array(graph.max_deg_index),
+            "conflicts": np.concatenate(conflicts).astype(np.int64),
+        }
+
+        # written in a temporary file first, so that a file of the cache is always complete
+        path = self.path(graph.problem, graph.optimized)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, **data)
+        os.replace(tmp, path)
+
+        self.evict(path)
+
+    def evict(self, keep=None):
+        """
+        Removes the least recently used files until the cache is not too big.
+
+        :param keep (opt): The path of a file that must not be removed (default: None).
+
+        :return: returns nothing.
+        """
+        if self.max_size == None:
+            return
+
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                path = os.path.join(self.directory, name)
+                stat = os.stat(path)
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort()
+        total = sum(f[1] for f in files)
+        for _, size, path in files:
+            if total <= self.max_size:
+                break
+            if path == keep:
+                continue
+            os.remove(path)
+            total -= size
+
+    def invalidate(self, problem, optimized=None):
+        """
+        Removes the stored graphs of a problem.
+
+        :param problem: The problem.
+
+        :param optimized (opt): The optimized flag of the graph to remove, both if None (default).
+
+        :return: returns nothing.
+        """
+        flags = [True, False] if optimized == None else [optimized]
+        for flag in flags:
+            path = self.path(problem, flag)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def clear(self):
+        """
+        Removes every stored graph.
+
+        :return: returns nothing.
+        """
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.directory, name))
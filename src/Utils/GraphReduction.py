@@ -0,0 +1,357 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import numpy as np
+from src.Utils.BitMatrix import BitMatrix
+from src.Utils.SpatialHash import SpatialHash
+
+"""
+This module is used to reduce a graph before solving it, removing the defenders and shots
+that can not change the size of a minimum dominating set.
+"""
+
+class GraphReduction:
+
+    """
+    This class reduces a graph (see Graph.reduce). The graphs generated from the triangles are
+    very redundant: close positions block almost the same shots, and close shots are blocked by
+    almost the same defenders. Three rules are applied until none of them changes anything:
+
+    - Forced defenders: if a shot is blocked by a single defender, this defender is in every \
+    solution. It is selected, the shots it blocks and the defenders colliding with it are removed.
+    - Row dominance: a defender i is removed if another defender j blocks every shot i blocks \
+    and collides with no defender i does not collide with (i and j excepted). In any solution, \
+    i can be replaced by j (or simply removed if j is already selected).
+    - Column dominance: a shot a is removed if there is another shot b such that every defender \
+    blocking b also blocks a. Any set blocking b blocks a.
+
+    Each rule only considers the defenders and shots that have not been removed yet, therefore
+    a minimum dominating set of the reduced graph plus the forced defenders is a minimum
+    dominating set of the graph (and there is none in the reduced graph iff there is none in the
+    graph).
+
+    :ivar graph: The graph that has been reduced.
+
+    :ivar reduced: The reduced graph (see Graph.subgraph), None if the graph has no solution.
+
+    :ivar forced: The indices (in the graph) of the forced defenders.
+
+    :ivar defender_indices: For each defender of the reduced graph, its index in the graph \
+    (as long as the reduced graph has not been sorted, see original_indices).
+
+    :ivar shot_indices: For each shot of the reduced graph, its index in the graph.
+
+    :ivar feasible: False if the reduction found out that the graph has no solution.
+    """
+
+    def __init__(self, graph):
+        """
+        Constructs a new 'GraphReduction' object and reduces the graph.
+
+        :param graph: The graph to reduce, its edges can be integers or a BitMatrix.
+
+        :return: returns nothing.
+        """
+        self.graph = graph
+        self.reduced = None
+        self.forced = []
+        self.defender_indices = []
+        self.shot_indices = []
+        self.feasible = True
+
+        self.reduce()
+
+    def bitset(self, bools):
+        """
+        Converts a vector of booleans into an integer (the ith bit is the ith boolean).
+
+        :param bools: The vector of booleans.
+
+        :return: The integer.
+        """
+        return int.from_bytes(np.packbits(bools, bitorder="little").tobytes(), "little")
+
+    def indices(self, value):
+        """
+        Lists the bits set to 1 in an integer.
+
+        :param value: The integer.
+
+        :return: The list of indices of the bits set to 1, in increasing order.
+        """
+        res = []
+        while value:
+            low = value & -value
+            res.append(low.bit_length() - 1)
+            value ^= low
+        return res
+
+    def reduce(self):
+        """
+        Applies the rules described above until none of them changes anything, then builds
+        the reduced graph.
+
+        :return: returns nothing.
+        """
+        graph = self.graph
+        nb_def = len(graph.defenders)
+        nb_shots = graph.nb_shots
+
+        # the matrix of edges as booleans (defenders x shots, the first shot first)
+        edges = graph.edges
+        if not isinstance(edges, BitMatrix):
+            edges = BitMatrix.from_ints(edges, nb_shots)
+        matrix = edges.unpack(edges.words) if nb_def > 0 else np.zeros((0, nb_shots), dtype=bool)
+
+        # the shots blocked by each defender and the defenders blocking each shot, as integers
+        self.rows = [self.bitset(matrix[i]) for i in range(nb_def)]
+        self.columns = [self.bitset(matrix[:, s]) for s in range(nb_shots)]
+        self.matrix = matrix
+        self.edge_words = edges.words
+
+        # the collisions between defenders as a packed matrix (the bit j of the row i is set
+        # if i collides with j), and the pairs of defenders that might dominate each other
+        nb_words = max(1, (nb_def + 63) // 64)
+        raw = b"".join(c.to_bytes(nb_words * 8, "little") for c in graph.conflicts)
+        self.conflict_words = np.frombuffer(raw, dtype="<u8").reshape(nb_def, nb_words).astype(np.uint64)
+        self.pairs = self.close_pairs()
+
+        # the defenders and shots that have not been removed yet
+        self.alive_def = (1 << nb_def) - 1
+        self.alive_shots = (1 << nb_shots) - 1
+
+        changed = True
+        while changed and self.feasible:
+            changed = self.select_forced()
+            if self.feasible:
+                changed = self.remove_dominated_rows() or changed
+                changed = self.remove_dominated_columns() or changed
+
+        del self.rows, self.columns, self.matrix, self.edge_words, self.conflict_words, self.pairs
+
+        if not self.feasible:
+            return
+
+        self.defender_indices = self.indices(self.alive_def)
+        self.shot_indices = self.indices(self.alive_shots)
+        self.reduced = graph.subgraph(self.defender_indices, self.shot_indices)
+
+    def words(self, value, nb_words):
+        """
+        Converts an integer into a row of 64 bits words (the ith bit is the bit i % 64 of the
+        word i // 64, as in BitMatrix.py).
+
+        :param value: The integer.
+
+        :param nb_words: The number of words of the row.
+
+        :return: The row of words.
+        """
+        return np.frombuffer(value.to_bytes(nb_words * 8, "little"), dtype="<u8").astype(np.uint64)
+
+    def close_pairs(self):
+        """
+        Computes the pairs of defenders (i, j) closer than twice the collision distance (found
+        with a spatial hash). A defender j dominating
+        a defender i collides with no remaining defender i does not collide with, therefore j is 
+        either close to i or collides with no remaining defender.
+
+        :return: A tuple (I, J) of arrays of indices, sorted by I.
+        """
+        defenders = list(self.graph.defenders)
+        distance = 2 * self.graph.collision_distance() + self.graph.tolerance
+
+        grid = SpatialHash(distance)
+        for i in range(len(defenders)):
+            grid.insert(defenders[i].pos, i)
+
+        # the defenders of each cell and of the 3 x 3 cells around it
+        cells = {key: np.array([j for _, j in grid.cells[key]], dtype=np.int64) for key in grid.cells}
+        around = {}
+        for key in cells:
+            neighbours = [cells[(key[0] + di, key[1] + dj)] for di in (-1, 0, 1) for dj in (-1, 0, 1)
+                          if (key[0] + di, key[1] + dj) in cells]
+            around[key] = np.concatenate(neighbours)
+
+        first = [np.zeros(0, dtype=np.int64)]
+        second = [np.zeros(0, dtype=np.int64)]
+        for key in cells:
+            first.append(np.repeat(cells[key], len(around[key])))
+            second.append(np.tile(around[key], len(cells[key])))
+        first = np.concatenate(first)
+        second = np.concatenate(second)
+
+        # only the pairs that are actually close are kept
+        x = self.graph.defenders.x
+        y = self.graph.defenders.y
+        keep = np.hypot(x[first] - x[second], y[first] - y[second]) <= distance
+        first, second = first[keep], second[keep]
+
+        order = np.argsort(first, kind="stable")
+        return (first[order], second[order])
+
+    def select_forced(self):
+        """
+        Selects the defenders that are the only ones blocking a shot (see above). The reduction
+        is not feasible anymore if a shot can not be blocked or if two forced defenders collide.
+
+        :return: True if at least one defender has been selected.
+        """
+        changed = False
+        for s in self.indices(self.alive_shots):
+            if not (self.alive_shots >> s) & 1:
+                continue
+
+            blockers = self.columns[s] & self.alive_def
+            if blockers == 0:
+                self.feasible = False
+                return changed
+
+            # a single defender blocks this shot
+            if blockers & (blockers - 1) == 0:
+                index = blockers.bit_length() - 1
+                self.forced.append(index)
+
+                # the defenders colliding with it (itself included) are not available anymore,
+                # a forced defender colliding with it will not find its shot blocked anymore
+                self.alive_def &= ~self.graph.conflicts[index]
+                self.alive_shots &= ~self.rows[index]
+                changed = True
+        return changed
+
+    def remove_dominated_rows(self):
+        """
+        Removes the defenders dominated by another one (see above). The close pairs (see 
+        close_pairs) are checked at once with the packed matrices. The collisions are checked 
+        wrt the defenders remaining before any removal, which is enough since removing 
+        defenders can not make a collision appear.
+
+        :return: True if at least one defender has been removed.
+        """
+        nb_def = len(self.graph.defenders)
+        alive = np.zeros(nb_def, dtype=bool)
+        alive[self.indices(self.alive_def)] = True
+        rows = self.edge_words & self.words(self.alive_shots, self.edge_words.shape[1])
+        conflicts = self.conflict_words & self.words(self.alive_def, self.conflict_words.shape[1])
+
+        # the close pairs (i, j) such that j blocks every shot blocked by i
+        first, second = self.pairs
+        keep = alive[first] & alive[second] & (first != second)
+        first, second = first[keep], second[keep]
+        keep = ~(rows[first] & ~rows[second]).any(axis=1)
+        first, second = first[keep], second[keep]
+
+        # j collides with no remaining defender i does not collide with, the only bit left 
+        # is j itself when i and j do not collide (i is set in both rows or in none)
+        #
+        # the defenders colliding with j are close to it, their bits only span a few words
+        # of its row (the defenders are computed column by column), only this window of words 
+        # is compared (the rows are padded with zeros so that every window fits)
+        nb_words = conflicts.shape[1]
+        nonzero = conflicts != 0
+        low = np.where(nonzero.any(axis=1), nonzero.argmax(axis=1), 0)
+        high = np.where(nonzero.any(axis=1), nb_words - 1 - nonzero[:, ::-1].argmax(axis=1), 0)
+        width = int((high - low).max()) + 1 if len(low) > 0 else 1
+        padded = np.zeros((conflicts.shape[0], nb_words + width), dtype=np.uint64)
+        padded[:, :nb_words] = conflicts
+
+        valid = np.zeros(len(first), dtype=bool)
+        chunk = 16384
+        for start in range(0, len(first), chunk):
+            i = first[start:start + chunk]
+            j = second[start:start + chunk]
+            window = low[j][:, None] + np.arange(width)
+            extra = BitMatrix.count_bits(padded[j[:, None], window] & ~padded[i[:, None], window]).sum(axis=1)
+            collide = (conflicts[i, j // 64] >> (j % 64).astype(np.uint64)) & np.uint64(1)
+            valid[start:start + chunk] = extra == 1 - collide.astype(np.int64)
+        first, second = first[valid], second[valid]
+        bounds = np.searchsorted(first, np.arange(nb_def + 1))
+
+        # the defenders colliding with no other remaining defender
+        lonely = 0
+        for j in np.nonzero(BitMatrix.count_bits(conflicts).sum(axis=1) == 1)[0].tolist():
+            lonely |= 1 << j
+
+        changed = False
+        for i in self.indices(self.alive_def):
+            row = self.rows[i] & self.alive_shots
+
+            # a defender blocking no remaining shot is useless
+            if row == 0:
+                self.alive_def &= ~(1 << i)
+                changed = True
+                continue
+
+            # a close defender dominating it has not been removed
+            dominated = False
+            for j in second[bounds[i]:bounds[i + 1]].tolist():
+                if (self.alive_def >> j) & 1:
+                    dominated = True
+                    break
+
+            # a lonely defender blocking every shot blocked by i
+            candidates = lonely & self.alive_def & ~(1 << i)
+            if not dominated and candidates != 0:
+                for s in self.indices(row):
+                    candidates &= self.columns[s]
+                    if candidates == 0:
+                        break
+                dominated = candidates != 0
+
+            if dominated:
+                self.alive_def &= ~(1 << i)
+                changed = True
+        return changed
+
+    def remove_dominated_columns(self):
+        """
+        Removes the shots implied by another one (see above).
+
+        :return: True if at least one shot has been removed.
+        """
+        shots = self.indices(self.alive_shots)
+        if len(shots) < 2:
+            return False
+
+        # common[a, b] is the number of remaining defenders blocking both a and b
+        defenders = self.indices(self.alive_def)
+        sub = self.matrix[np.ix_(defenders, shots)].astype(np.float32)
+        common = sub.T @ sub
+        counts = np.diag(common).copy()
+
+        changed = False
+        for a in range(len(shots)):
+            for b in np.nonzero(common[a] == counts)[0]:
+                if b != a and (self.alive_shots >> shots[b]) & 1:
+                    self.alive_shots &= ~(1 << shots[a])
+                    changed = True
+                    break
+        return changed
+
+    def original_indices(self, defenders):
+        """
+        Computes the indices in the graph of some defenders of the reduced graph (the defenders
+        are identified by their positions, even if the reduced graph has been sorted).
+
+        :param defenders: The list of Defender objects.
+
+        :return: The list of indices.
+        """
+        graph = self.graph
+        positions = {(graph.defenders.x[i], graph.defenders.y[i]): i for i in range(len(graph.defenders))}
+        return [positions[(d.pos.x, d.pos.y)] for d in defenders]
+
+    def expand(self, defenders):
+        """
+        Converts a solution of the reduced graph into a solution of the graph, by adding the
+        forced defenders.
+
+        :param defenders: The list of Defender objects found in the reduced graph (None if \
+        no solution has been found).
+
+        :return: The list of Defender objects, None if there is no solution.
+        """
+        if defenders == None or not self.feasible:
+            return None
+        return self.graph.index_list_to_defenders(self.forced) + list(defenders)
@@ -0,0 +1,192 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import math
+import numpy as np
+from src.Utils.CoverModel import CoverModel
+
+# scipy is optional, it is only required by the linear relaxation
+try:
+    from scipy.optimize import linprog
+    from scipy.sparse import csr_matrix, vstack
+except ImportError:
+    linprog = None
+
+"""
+This module is used to compute lower bounds of the size of a minimum dominating set of a graph,
+so that the solvers can tell how far their solutions can be from a minimum one.
+"""
+
+class LowerBound:
+
+    """
+    This class computes lower bounds of the number of defenders needed to block every shot of
+    a graph, possibly once some shots are already blocked and some defenders can not be selected
+    anymore (the residual graph during a search):
+
+    - Packing: shots are taken from the one with the fewest blockers, and kept if none of their \
+    blockers blocks a shot already kept. The kept shots need pairwise different defenders.
+    - Sorted degrees: the k defenders blocking the most remaining shots block at most the sum of \
+    their residual degrees, k must be large enough for this sum to reach the number of remaining \
+    shots.
+    - Linear relaxation: the integer program of MILPSolver (see CoverModel) with variables in [0 ; 1] \
+    instead of {0 ; 1}, rounded up. It is usually the tightest one, but it requires scipy and is \
+    only computed on the whole graph.
+
+    A bound is math.inf when a remaining shot can not be blocked anymore.
+
+    :ivar graph: The graph.
+
+    :ivar full: The numerical representation of the set of every shot.
+
+    :ivar covers: For each defender, the shots it blocks (without the leading 1 of Graph.edges).
+
+    :ivar blockers: For each shot, the defenders blocking it.
+    """
+
+    def __init__(self, graph):
+        """
+        Constructs a new 'LowerBound' object.
+
+        :param graph: The graph, its edges can be integers or a BitMatrix.
+
+        :return: returns nothing.
+        """
+        self.graph = graph
+        self.full = (1 << graph.nb_shots) - 1
+        self.covers = [graph.edges[i] & self.full for i in range(len(graph.defenders))]
+
+        # the matrix of bits is transposed with numpy, bit k of a row being the shot k
+        nb_bytes = (graph.nb_shots + 7) // 8
+        raw = b"".join(cover.to_bytes(nb_bytes, "little") for cover in self.covers)
+        matrix = np.unpackbits(np.frombuffer(raw, dtype=np.uint8).reshape(len(self.covers), nb_bytes), axis=1,
+                               bitorder="little")
+        self.blockers = [int.from_bytes(np.packbits(matrix[:, s], bitorder="little").tobytes(), "little")
+                         for s in range(graph.nb_shots)]
+
+    def uncovered(self, covered):
+        """
+        Lists the shots not blocked yet.
+
+        :param covered: The shots already blocked (as Graph.edges, the leading 1 is ignored).
+
+        :return: The list of indices of these shots.
+        """
+        res = []
+        value = ~covered & self.full
+        while value:
+            low = value & -value
+            res.append(low.bit_length() - 1)
+            value ^= low
+        return res
+
+    def packing(self, covered=0, forbidden=0):
+        """
+        Computes the packing bound (see above).
+
+        :param covered (opt): The shots already blocked (default: 0, none).
+
+        :param forbidden (opt): The defenders that can not be selected (default: 0, none).
+
+        :return: The lower bound.
+        """
+        masks = []
+        for s in self.uncovered(covered):
+            mask = self.blockers[s] & ~forbidden
+            if mask == 0:
+                return math.inf
+            masks.append((bin(mask).count("1"), mask))
+        masks.sort(key=lambda x: x[0])
+
+        used = 0
+        res = 0
+        for _, mask in masks:
+            if mask & used == 0:
+                used |= mask
+                res += 1
+        return res
+
+    def sorted_degree(self, covered=0, forbidden=0):
+        """
+        Computes the sorted degrees bound (see above).
+
+        :param covered (opt): The shots already blocked (default: 0, none).
+
+        :param forbidden (opt): The defenders that can not be selected (default: 0, none).
+
+        :return: The lower bound.
+        """
+        remaining = ~covered & self.full
+        nb = bin(remaining).count("1")
+
+        # on the whole graph, the residual degrees are the degrees of the graph
+        if remaining == self.full:
+            degrees = [self.graph.deg[i] for i in range(len(self.covers)) if not (forbidden >> i) & 1]
+        else:
+            degrees = [bin(cover & remaining).count("1") for i, cover in enumerate(self.covers)
+                       if not (forbidden >> i) & 1]
+        degrees.sort(reverse=True)
+
+        res = 0
+        total = 0
+        for degree in degrees:
+            if total >= nb or degree == 0:
+                break
+            total += degree
+            res += 1
+        return res if total >= nb else math.inf
+
+    def linear_relaxation(self):
+        """
+        Computes the linear relaxation bound of the whole graph (see above).
+
+        :return: The lower bound, 0 if scipy is not installed.
+        """
+        if linprog == None or self.graph.nb_shots == 0:
+            return 0
+
+        model = CoverModel(self.graph)
+        if len(np.unique(model.shots)) < model.nb_shots:
+            return math.inf
+
+        # every shot is blocked: - sum of the defenders blocking it <= -1
+        rows = [csr_matrix((-np.ones(len(model.shots)), (model.shots, model.defenders)),
+                           shape=(model.nb_shots, model.nb_def))]
+        bounds = [-np.ones(model.nb_shots)]
+
+        # at most one defender of each clique of colliding defenders
+        cliques = model.conflict_cliques()
+        if len(cliques) > 0:
+            clique_rows = np.repeat(np.arange(len(cliques)), [len(c) for c in cliques])
+            columns = np.concatenate([np.array(c, dtype=np.int64) for c in cliques])
+            rows.append(csr_matrix((np.ones(len(columns)), (clique_rows, columns)), shape=(len(cliques), model.nb_def)))
+            bounds.append(np.ones(len(cliques)))
+
+        res = linprog(np.ones(model.nb_def), A_ub=vstack(rows), b_ub=np.concatenate(bounds), bounds=(0, 1),
+                      method="highs")
+
+        # the relaxation itself has no solution (because of the collisions)
+        if res.status == 2:
+            return math.inf
+        if res.status != 0:
+            return 0
+        return int(math.ceil(res.fun - 1e-6))
+
+    def compute(self, covered=0, forbidden=0, relaxation=True):
+        """
+        Computes the best of the bounds.
+
+        :param covered (opt): The shots already blocked (default: 0, none).
+
+        :param forbidden (opt): The defenders that can not be selected (default: 0, none).
+
+        :param relaxation (opt): If True, the linear relaxation is computed too, on the whole \
+        graph only (default: True).
+
+        :return: The lower bound.
+        """
+        res = max(self.packing(covered, forbidden), self.sorted_degree(covered, forbidden))
+        if relaxation and covered & self.full == 0 and forbidden == 0 and res != math.inf:
+            res = max(res, self.linear_relaxation())
+        return res
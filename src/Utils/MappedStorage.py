@@ -0,0 +1,490 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import tempfile
+import numpy as np
+from src.Utils.Point import Point
+from src.Utils.UsefulTypes import Defender
+from src.Utils.BitMatrix import BitMatrix
+
+"""
+This module is used to store the defenders and the edges of a graph in memory-mapped files,
+so that very fine graphs do not have to fit in memory (see the storage option of Graph).
+"""
+
+class MappedArray:
+
+    """
+    This class is an array stored in a memory-mapped file, that grows when elements are appended
+    (like a list). Only the pages of the file being used are in memory.
+
+    :ivar path: The path of the file.
+
+    :ivar dtype: The type of the elements.
+
+    :ivar shape: The shape of an element (() for a number).
+
+    :ivar size: The number of elements.
+
+    :ivar data: The memory-mapped array, its length is the capacity (not the size).
+    """
+
+    def __init__(self, path, dtype, shape=(), capacity=1024):
+        """
+        Constructs a new (empty) 'MappedArray' object, the file is created (or emptied).
+
+        :param path: The path of the file.
+
+        :param dtype: The type of the elements.
+
+        :param shape (opt): The shape of an element (default: (), a number).
+
+        :param capacity (opt): The initial capacity (default: 1024).
+
+        :return: returns nothing.
+        """
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(shape)
+        self.size = 0
+        self.data = None
+        open(path, "wb").close()
+        self.reserve(capacity)
+
+    def reserve(self, capacity):
+        """
+        Makes sure the file can store a given number of elements (the capacity is doubled).
+
+        :param capacity: The number of elements.
+
+        :return: returns nothing.
+        """
+        if self.data is not None and capacity <= len(self.data):
+            return
+        if self.data is not None:
+            capacity = max(capacity, 2 * len(self.data))
+            self.data.flush()
+            self.data = None
+
+        item_size = self.dtype.itemsize * int(np.prod(self.shape, dtype=np.int64))
+        with open(self.path, "r+b") as f:
+            f.truncate(max(1, capacity * item_size))
+        self.data = np.memmap(self.path, dtype=self.dtype, mode="r+", shape=(capacity,) + self.shape)
+
+    def append(self, value):
+        """
+        Adds an element at the end of the array.
+
+        :param value: The element.
+
+        :return: returns nothing.
+        """
+        self.reserve(self.size + 1)
+        self.data[self.size] = value
+        self.size += 1
+
+    def view(self):
+        """
+        Returns the elements of the array (without copying them).
+
+        :return: The memory-mapped array of the elements.
+        """
+        return self.data[:self.size]
+
+    def __len__(self):
+        """
+        Allows the use of len(a) where a is a 'MappedArray' object.
+
+        :return: The number of elements.
+        """
+        return self.size
+
+    def __getitem__(self, index):
+        """
+        Allows the use of a[i] where a is a 'MappedArray' object.
+
+        :param index: The index of the element.
+
+        :return: The element (a Python number if the elements are numbers).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("index out of range")
+        value = self.data[index]
+        if self.shape == ():
+            return value.item()
+        return value
+
+    def __setitem__(self, index, value):
+        """
+        Allows the use of a[i] = value where a is a 'MappedArray' object.
+
+        :param index: The index of the element.
+
+        :param value: The element.
+
+        :return: returns nothing.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("index out of range")
+        self.data[index] = value
+
+    def __iter__(self):
+        """
+        Allows the use of for value in a where a is a 'MappedArray' object.
+
+        :return: An iterator over the elements.
+        """
+        for i in range(self.size):
+            yield self[i]
+
+    def swap(self, i, j):
+        """
+        Swaps two elements of the array.
+
+        :param i: The index of the first element.
+
+        :param j: The index of the second element.
+
+        :return: returns nothing.
+        """
+        tmp = self.data[i].copy()
+        self.data[i] = self.data[j]
+        self.data[j] = tmp
+
+class MappedDefenders:
+
+    """
+    This class stores the positions of the defenders of a graph in a memory-mapped file.
+    It can be used as the list of defenders: the 'Defender' objects are only created when
+    they are accessed.
+
+    :ivar positions: The positions of the defenders (a MappedArray of (x, y)).
+
+    :ivar radius: The radius of the defenders.
+    """
+
+    def __init__(self, path, radius):
+        """
+        Constructs a new (empty) 'MappedDefenders' object.
+
+        :param path: The path of the file.
+
+        :param radius: The radius of the defenders.
+
+        :return: returns nothing.
+        """
+        self.positions = MappedArray(path, np.float64, (2,))
+        self.radius = radius
+
+    def append(self, defender):
+        """
+        Adds a defender at the end of the list.
+
+        :param defender: The defender.
+
+        :return: returns nothing.
+        """
+        self.positions.append((defender.pos.x, defender.pos.y))
+
+    def __len__(self):
+        """
+        Allows the use of len(d) where d is a 'MappedDefenders' object.
+
+        :return: The number of defenders.
+        """
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        """
+        Allows the use of d[i] where d is a 'MappedDefenders' object.
+
+        :param index: The index of the defender.
+
+        :return: The corresponding 'Defender' object.
+        """
+        x, y = self.positions[index].tolist()
+        return Defender(Point(x, y), self.radius)
+
+    def __iter__(self):
+        """
+        Allows the use of for defender in d where d is a 'MappedDefenders' object.
+
+        :return: An iterator over the defenders.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def swap(self, i, j):
+        """
+        Swaps two defenders.
+
+        :param i: The index of the first defender.
+
+        :param j: The index of the second defender.
+
+        :return: returns nothing.
+        """
+        self.positions.swap(i, j)
+
+class MappedBitMatrix(BitMatrix):
+
+    """
+    This class is a 'BitMatrix' stored in a memory-mapped file, rows can be appended to it while
+    the graph is computed. The batch operations go through the rows by chunks, so that the memory
+    used does not depend on the number of rows, and only a bounded number of rows are kept as
+    integers (see BitMatrix).
+
+    :ivar table: The words of the rows (a MappedArray).
+
+    :ivar chunk: The maximum number of rows considered at once.
+
+    :ivar max_ints: The maximum number of rows kept as integers.
+    """
+
+    def __init__(self, path, nb_bits, budget):
+        """
+        Constructs a new (empty) 'MappedBitMatrix' object.
+
+        :param path: The path of the file.
+
+        :param nb_bits: The number of columns (shots).
+
+        :param budget: The memory (in bytes) the batch operations and the integers can use.
+
+        :return: returns nothing.
+        """
+        self.nb_bits = nb_bits
+        self.nb_words = max(1, (nb_bits + 63) // 64)
+        self.table = MappedArray(path, np.uint64, (self.nb_words,))
+        self.ints = {}
+
+        # a chunk and its temporary arrays (counts...) take about 4 times the size of its words
+        row_size = 8 * self.nb_words
+        self.chunk = max(1, budget // (8 * row_size))
+        self.max_ints = max(1, budget // (4 * row_size))
+
+    @property
+    def words(self):
+        """
+        The words of the rows, see BitMatrix.
+
+        :return: The memory-mapped array of words.
+        """
+        return self.table.view()
+
+    def append(self, value):
+        """
+        Adds a row at the end of the matrix.
+
+        :param value: The integer (with the leading 1) to store.
+
+        :return: returns nothing.
+        """
+        self.table.append(self.words_from_int(value))
+
+    def chunks(self):
+        """
+        Splits the rows of the matrix into chunks.
+
+        :return: A generator of slices.
+        """
+        for start in range(0, len(self), self.chunk):
+            yield slice(start, min(len(self), start + self.chunk))
+
+    def __getitem__(self, index):
+        """
+        Allows the use of m[i] where m is a 'MappedBitMatrix' object.
+
+        :param index: The index of the row.
+
+        :return: The row as an integer (with the leading 1).
+        """
+        if index in self.ints:
+            return self.ints[index]
+        if len(self.ints) >= self.max_ints:
+            self.ints.clear()
+        self.ints[index] = self.int_from_words(self.words[index])
+        return self.ints[index]
+
+    def __setitem__(self, index, value):
+        """
+        Allows the use of m[i] = value where m is a 'MappedBitMatrix' object.
+
+        :param index: The index of the row.
+
+        :param value: The integer (with the leading 1) to store.
+
+        :return: returns nothing.
+        """
+        self.words[index] = self.words_from_int(value)
+        self.ints.pop(index, None)
+
+    def copy(self):
+        """
+        Copies the matrix (in a new file next to this one).
+
+        :return: The new 'MappedBitMatrix' object.
+        """
+        handle, path = tempfile.mkstemp(suffix=".bits", dir=os.path.dirname(self.table.path))
+        os.close(handle)
+        res = MappedBitMatrix(path, self.nb_bits, 0)
+        res.chunk = self.chunk
+        res.max_ints = self.max_ints
+        res.table.reserve(len(self))
+        for rows in self.chunks():
+            res.table.data[rows] = self.words[rows]
+        res.table.size = len(self)
+        return res
+
+    def swap(self, i, j):
+        """
+        Swaps two rows of the matrix.
+
+        :param i: The index of the first row.
+
+        :param j: The index of the second row.
+
+        :return: returns nothing.
+        """
+        self.table.swap(i, j)
+        self.ints.pop(i, None)
+        self.ints.pop(j, None)
+
+    def or_rows(self, indices=None):
+        """
+        Computes the disjunction of some rows, see BitMatrix.
+
+        :param indices (opt): The indices of the rows, all of them if None.
+
+        :return: The resulting row of words.
+        """
+        if indices is not None:
+            return super().or_rows(indices)
+        res = np.zeros(self.nb_words, dtype=np.uint64)
+        for rows in self.chunks():
+            res |= np.bitwise_or.reduce(self.words[rows], axis=0)
+        return res
+
+    def and_rows(self, indices=None):
+        """
+        Computes the conjunction of some rows, see BitMatrix.
+
+        :param indices (opt): The indices of the rows, all of them if None.
+
+        :return: The resulting row of words.
+        """
+        if indices is not None:
+            return super().and_rows(indices)
+        res = self.full_row()
+        for rows in self.chunks():
+            res &= np.bitwise_and.reduce(self.words[rows], axis=0)
+        return res
+
+    def popcount(self, indices=None, mask=None):
+        """
+        Counts the number of bits set in some rows, see BitMatrix.
+
+        :param indices (opt): The indices of the rows, all of them if None.
+
+        :param mask (opt): If given, only the bits set in this row of words are counted.
+
+        :return: The array of counts, one per row.
+        """
+        if indices is not None:
+            return super().popcount(indices, mask)
+        res = np.zeros(len(self), dtype=np.int64)
+        for rows in self.chunks():
+            words = self.words[rows]
+            if mask is not None:
+                words = words & mask
+            res[rows] = BitMatrix.count_bits(words).sum(axis=-1)
+        return res
+
+    def andnot(self, mask, indices=None):
+        """
+        Clears, in place, the bits set in the given row of words from some rows, see BitMatrix.
+
+        :param mask: The row of words to remove.
+
+        :param indices (opt): The indices of the rows, all of them if None.
+
+        :return: returns nothing.
+        """
+        if indices is None:
+            for rows in self.chunks():
+                self.words[rows] &= ~mask
+        else:
+            self.words[indices] &= ~mask
+        self.ints.clear()
+
+class LazyConflicts:
+
+    """
+    This class computes the collisions between the defenders of a graph (see Graph.conflicts)
+    only when they are accessed, instead of storing them (which takes a number of bits
+    quadratic in the number of defenders). The defenders are sorted by x coordinate once,
+    the defenders colliding with a given one are then found with a binary search.
+
+    :ivar graph: The graph.
+
+    :ivar distance: The collision distance.
+
+    :ivar order: The indices of the defenders sorted by x coordinate.
+
+    :ivar xs: The sorted x coordinates.
+    """
+
+    def __init__(self, graph):
+        """
+        Constructs a new 'LazyConflicts' object.
+
+        :param graph: The graph (its defenders must be a MappedDefenders object).
+
+        :return: returns nothing.
+        """
+        self.graph = graph
+        self.distance = graph.collision_distance()
+        positions = graph.defenders.positions.view()
+        self.order = np.argsort(positions[:, 0], kind="stable")
+        self.xs = positions[self.order, 0]
+
+    def __len__(self):
+        """
+        Allows the use of len(c) where c is a 'LazyConflicts' object.
+
+        :return: The number of defenders.
+        """
+        return len(self.order)
+
+    def __getitem__(self, index):
+        """
+        Allows the use of c[i] where c is a 'LazyConflicts' object.
+
+        :param index: The index of the defender.
+
+        :return: The numerical representation of the defenders colliding with it (itself included).
+        """
+        positions = self.graph.defenders.positions.view()
+        x, y = positions[index]
+        low = np.searchsorted(self.xs, x - self.distance, side="left")
+        high = np.searchsorted(self.xs, x + self.distance, side="right")
+        candidates = self.order[low:high]
+
+        # the exact same computation as Player.collision
+        dx = positions[candidates, 0] - x
+        dy = positions[candidates, 1] - y
+        js = candidates[np.sqrt(dx * dx + dy * dy) < self.distance]
+
+        bits = bytearray((len(self) + 7) // 8)
+        for j in js.tolist():
+            bits[j // 8] |= 1 << (j % 8)
+        return int.from_bytes(bits, "little")
+
+def temporary_directory():
+    """
+    Creates a new temporary directory for the files of a graph.
+
+    :return: The path of the directory.
+    """
+    return tempfile.mkdtemp(prefix="graph-")
@@ -0,0 +1,358 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import math
+import itertools
+import numpy as np
+from src.Utils.Point import Point
+from src.Utils.UsefulTypes import Defender
+from src.ProblemUtils.ProblemType import ProblemType
+
+"""
+This module is used to compute the positions of the defenders of a graph with NumPy,
+a whole block of the field at a time instead of one position and one shot at a time.
+"""
+
+class NumpyGraphBuilder:
+
+    """
+    This class computes the defenders, edges, degrees and distances of a graph. The result
+    is exactly the same as Graph.compute_all_positions, the graph (and therefore the solvers)
+    can not tell the difference.
+
+    The geometry is computed with floating point arrays, which is not exactly how the scalar
+    version computes it (it rounds a lot of intermediate values, see Point.py and LinearEquation.py).
+    Therefore, whenever a value is too close to a threshold (the radius of a robot, a bound
+    of a shot...) to be sure of the result, the scalar method is used for this specific
+    position (this happens very rarely).
+
+    :ivar graph: The graph to fill, its shots and triangles must already be computed.
+
+    :ivar block_size: The maximum number of positions considered at once (bounds the memory used).
+    """
+
+    def __init__(self, graph, block_size=4096):
+        """
+        Constructs a new 'NumpyGraphBuilder' object.
+
+        :param graph: The graph to compute the positions of.
+
+        :param block_size (opt): The maximum number of positions considered at once (default: 4096).
+
+        :return: returns nothing.
+        """
+        self.graph = graph
+        self.block_size = block_size
+
+    def compute_shots(self, goals):
+        """
+        Flattens the shots of the graph into arrays (in the order of the bits of the edges).
+
+        :param goals: The list of goals.
+
+        :return: A dictionnary of arrays, with for each shot: its opponent coordinates, its cosine \
+        and sine, the index of its triangle, if it is a special shot (horizontal or vertical, checked \
+        with the scalar methods) and, for each goal, the interval the interception point must be in \
+        (see Goal.interception_bounds) and, in the case of max_speed, the interval the closest point \
+        must be in (see Goal.interception_bounds_with_speed, empty if there is none).
+        """
+        max_speed = self.graph.problem.type == ProblemType.MAX_SPEED
+        shots = self.graph.shots
+
+        # the opponent and the triangle of every shot
+        o_x = np.array([opponent.pos.x for opponent in shots.opponents], dtype=np.float64)[shots.opponent]
+        o_y = np.array([opponent.pos.y for opponent in shots.opponents], dtype=np.float64)[shots.opponent]
+        tri = np.repeat(np.arange(len(shots), dtype=np.int64), np.diff(shots.starts))
+        angles = shots.angles
+        special = (angles == 0) | (np.abs(angles) == math.pi) | (np.abs(angles) == math.pi / 2)
+
+        axis, low, high, speed_low, speed_high = [], [], [], [], []
+        for goal in goals:
+            bounds = goal.batch_interception_bounds(o_x, o_y, angles)
+            axis.append(bounds[0])
+            low.append(bounds[1])
+            high.append(bounds[2])
+
+            # the special shots are checked with the scalar method
+            bounds = (np.full(len(angles), math.inf), np.full(len(angles), -math.inf))
+            if max_speed:
+                bounds = goal.batch_interception_bounds_with_speed(o_x, o_y, angles)
+                bounds[0][special] = math.inf
+                bounds[1][special] = -math.inf
+            speed_low.append(bounds[0])
+            speed_high.append(bounds[1])
+
+        # the trigonometry of the shots is computed with the shots (see Graph.trigonometry)
+        trigonometry = self.graph.shot_trigonometry
+        return {
+            "o_x": o_x,
+            "o_y": o_y,
+            "cos": np.concatenate([np.zeros(0)] + [trig[0] for trig in trigonometry]),
+            "sin": np.concatenate([np.zeros(0)] + [trig[1] for trig in trigonometry]),
+            "tri": tri,
+            "special": special,
+            "axis": axis,
+            "low": low,
+            "high": high,
+            "speed_low": speed_low,
+            "speed_high": speed_high
+        }
+
+    def collision_mask(self, xs, ys, distance):
+        """
+        Computes, for a block of positions, if a defender placed there collides with an opponent.
+        The computation is exactly the same as Player.collision, no tolerance is needed. Only the
+        opponents close to the block are considered (see Graph.opponents_near).
+
+        :param xs: The x coordinates of the positions.
+
+        :param ys: The y coordinates of the positions.
+
+        :param distance: The minimum distance between a defender and an opponent.
+
+        :return: A boolean array, True if there is a collision.
+        """
+        res = np.zeros(len(xs), dtype=bool)
+        if len(xs) == 0:
+            return res
+
+        # only the opponents close to this block are checked
+        opponents = self.graph.opponents_near(xs.min(), ys.min(), xs.max(), ys.max(), distance)
+        for opponent in opponents:
+            res |= np.sqrt((opponent.pos.x - xs) ** 2 + (opponent.pos.y - ys) ** 2) < distance
+        return res
+
+    def intercepted(self, xs, ys, shots, radius, goals):
+        """
+        Computes, for a block of positions and all the shots, if a defender placed there
+        intercepts the shot wrt at least one goal (in the sense of Graph.exist_goal).
+
+        :param xs: The x coordinates of the positions.
+
+        :param ys: The y coordinates of the positions.
+
+        :param shots: The shots as arrays (see compute_shots).
+
+        :param radius: The radius of the robots.
+
+        :param goals: The list of goals.
+
+        :return: Two boolean matrices (positions x shots), the result and where this result \
+        is not reliable.
+        """
+        tol = self.graph.tolerance
+        d_x = xs[:, None] - shots["o_x"][None, :]
+        d_y = ys[:, None] - shots["o_y"][None, :]
+
+        # distance between the defender and the line of the shot
+        dst = np.abs(d_x * shots["sin"] - d_y * shots["cos"])
+        circle = dst <= radius
+        amb_circle = np.abs(dst - radius) <= tol
+
+        # projection of the defender on the line of the shot
+        t = d_x * shots["cos"] + d_y * shots["sin"]
+        p_x = shots["o_x"] + t * shots["cos"]
+        p_y = shots["o_y"] + t * shots["sin"]
+
+        res = np.zeros(dst.shape, dtype=bool)
+        ambiguous = np.zeros(dst.shape, dtype=bool)
+        ambiguous[:, shots["special"]] = True
+
+        for g in range(len(goals)):
+            axis = shots["axis"][g]
+            coord = np.where(axis == 1, p_y, p_x)
+            low = shots["low"][g]
+            high = shots["high"][g]
+
+            between = (low <= coord) & (coord <= high) & (axis != -1)
+            amb_between = (np.minimum(np.abs(coord - low), np.abs(coord - high)) <= tol) & (axis != -1)
+
+            res |= circle & between
+            ambiguous |= (amb_circle & (between | amb_between)) | ((circle | amb_circle) & amb_between)
+
+        return res, ambiguous
+
+    def intercepted_with_speed(self, xs, ys, shots, goals):
+        """
+        Computes, for a block of positions and all the shots, if a defender placed there can
+        move to the line of the shot before the ball and intercept it wrt at least one goal (in
+        the sense of Goal.shot_intercepted_with_speed, the radius of the robots is not used).
+
+        :param xs: The x coordinates of the positions.
+
+        :param ys: The y coordinates of the positions.
+
+        :param shots: The shots as arrays (see compute_shots).
+
+        :param goals: The list of goals.
+
+        :return: Two boolean matrices (positions x shots), the result and where this result \
+        is not reliable.
+        """
+        tol = self.graph.tolerance
+        ball_speed = self.graph.problem["ball_max_speed"]
+        player_speed = self.graph.problem["robot_max_speed"]
+        d_x = xs[:, None] - shots["o_x"][None, :]
+        d_y = ys[:, None] - shots["o_y"][None, :]
+
+        # the point of the line of the shot the closest to the defender, the defender
+        # must reach it before the ball
+        t = d_x * shots["cos"] + d_y * shots["sin"]
+        p_x = shots["o_x"] + t * shots["cos"]
+        d_defender = np.abs(d_x * shots["sin"] - d_y * shots["cos"])
+        delay = d_defender / player_speed - np.abs(t) / ball_speed
+        reached = delay <= 0
+        amb_reached = np.abs(delay) <= tol
+
+        res = np.zeros(t.shape, dtype=bool)
+        ambiguous = np.zeros(t.shape, dtype=bool)
+        ambiguous[:, shots["special"]] = True
+
+        for g in range(len(goals)):
+            low = shots["speed_low"][g]
+            high = shots["speed_high"][g]
+
+            between = (low <= p_x) & (p_x <= high)
+            amb_between = np.minimum(np.abs(p_x - low), np.abs(p_x - high)) <= tol
+
+            res |= reached & between
+            ambiguous |= (amb_reached & (between | amb_between)) | ((reached | amb_reached) & amb_between)
+
+        return res, ambiguous
+
+    def compute_all_positions(self, bottom_left, top_right, step, radius, goals):
+        """
+        Computes all useful positions for the defenders, see Graph.compute_all_positions.
+
+        :param bottom_left: The bottom left point of the field.
+
+        :param top_right: The top right point of the field.
+
+        :param step: Used to compute a finite number of positions for the defensers.
+
+        :param radius: Radius of a robot.
+
+        :param goals: The list of goals.
+
+        :return: returns nothing.
+        """
+        graph = self.graph
+
+        # the exact same coordinates as the scalar method (rounded like a Point)
+        xs = [round(x, Point.n_digits_round) for x in graph.lattice(bottom_left.x, top_right.x, step)]
+        ys = [round(y, Point.n_digits_round) for y in graph.lattice(bottom_left.y, top_right.y, step)]
+
+        # the positions that can block a shot, in the same order as the scalar method (x first, then y)
+        # they are enumerated block by block, so that they are never all in memory
+        self.compute_positions(graph.candidate_cells(xs, ys, radius, goals), xs, ys, radius, goals)
+
+    def compute_positions(self, cells, xs, ys, radius, goals):
+        """
+        Computes the defenders placed at some positions of the lattice, and adds the useful 
+        ones to the graph (in the order of the positions).
+
+        :param cells: An iterable of tuples (i, j), (xs[i], ys[j]) being a position.
+
+        :param xs: The x coordinates of the lattice (rounded like a Point).
+
+        :param ys: The y coordinates of the lattice (rounded like a Point).
+
+        :param radius: Radius of a robot.
+
+        :param goals: The list of goals.
+
+        :return: returns nothing.
+        """
+        graph = self.graph
+        problem = graph.problem
+        max_speed = problem.type == ProblemType.MAX_SPEED
+
+        collision_dist = problem["radius"] * 2
+        if problem.type == ProblemType.MIN_DIST:
+            collision_dist = problem["min_dist"]
+
+        shots = self.compute_shots(goals)
+        nb_tr = len(graph.triangles)
+
+        # the optimal distance of every triangle (see distance_from_triangle)
+        opt = np.array([graph.perfect_distance_from_triangle(tr, radius) for tr in graph.triangles])
+        apex_x = np.array([tr.points[0].x for tr in graph.triangles])
+        apex_y = np.array([tr.points[0].y for tr in graph.triangles])
+
+        cells = iter(cells)
+        lattice_x = np.array(xs, dtype=np.float64)
+        lattice_y = np.array(ys, dtype=np.float64)
+
+        while True:
+            block = np.array(list(itertools.islice(cells, self.block_size)), dtype=np.int64).reshape(-1, 2)
+            if len(block) == 0:
+                break
+            b_x = lattice_x[block[:, 0]]
+            b_y = lattice_y[block[:, 1]]
+
+            # triangles each position is in (all of them in the case of max_speed)
+            if max_speed:
+                in_tr = np.ones((len(b_x), nb_tr), dtype=bool)
+                keep = np.ones(len(b_x), dtype=bool)
+            else:
+                in_tr = graph.points_in_triangles(b_x, b_y)
+                keep = in_tr.any(axis=1)
+
+            # remove the positions colliding with an opponent
+            keep &= ~self.collision_mask(b_x, b_y, collision_dist)
+
+            kept = np.nonzero(keep)[0]
+            if len(kept) == 0:
+                continue
+
+            b_x = b_x[kept]
+            b_y = b_y[kept]
+            in_tr = in_tr[kept]
+
+            # the incidence matrix of this block, a shot can only be blocked
+            # if the position is in its triangle
+            shot_in_tr = in_tr[:, shots["tri"]]
+            if max_speed:
+                blocked, ambiguous = self.intercepted_with_speed(b_x, b_y, shots, goals)
+            else:
+                blocked, ambiguous = self.intercepted(b_x, b_y, shots, radius, goals)
+                blocked &= shot_in_tr
+                ambiguous &= shot_in_tr
+
+            # distance to the optimal position of every triangle the position is in
+            dst = np.sqrt((apex_x - b_x[:, None]) ** 2 + (apex_y - b_y[:, None]) ** 2)
+            distances = np.where(in_tr, np.abs(opt - dst) * 10, np.inf).min(axis=1)
+
+            flat_shots = None
+            for k in range(len(b_x)):
+                row = blocked[k]
+                defender = Defender(Point(float(b_x[k]), float(b_y[k])), radius)
+
+                # positions too close to a threshold are computed with the scalar method
+                amb = np.nonzero(ambiguous[k])[0]
+                if len(amb) > 0:
+                    if flat_shots == None:
+                        flat_shots = [shot for shot_list in graph.shots for shot in shot_list]
+                    row = row.copy()
+                    for s in amb:
+                        row[s] = graph.exist_goal(defender, flat_shots[s], goals)
+
+                deg = int(np.count_nonzero(row))
+                if deg == 0:
+                    continue
+
+                graph.add_defender(defender, self.to_edges(row), deg, float(distances[k]))
+
+    def to_edges(self, row):
+        """
+        Converts a boolean row of the incidence matrix into the numerical representation
+        of the edges used by the graph (with the leading 1).
+
+        :param row: The boolean row (one value per shot).
+
+        :return: The corresponding integer.
+        """
+        bits = np.concatenate(([True], row))
+        padding = (-len(bits)) % 8
+        return int.from_bytes(np.packbits(bits).tobytes(), "big") >> padding
@@ -0,0 +1,107 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from concurrent.futures import ProcessPoolExecutor
+
+"""
+This module is used to compute the positions of the defenders of a graph with several
+processes, each one computing a vertical strip of the field.
+"""
+
+def compute_strip(problem, optimized, engine, analytic, columns, cells):
+    """
+    Computes the defenders of a strip of the field (executed by a worker process).
+
+    :param problem: The problem of the graph.
+
+    :param optimized: The optimized flag of the graph.
+
+    :param engine: The engine of the graph ("python" or "numpy").
+
+    :param analytic: The analytic flag of the graph.
+
+    :param columns: The range of columns of the lattice of the strip.
+
+    :param cells: The positions of the lattice to consider (see Graph.cells).
+
+    :return: A tuple (defenders, edges, deg, total_distance_defender) of the strip.
+    """
+    # imported here, Graph.py imports this module
+    from src.Utils.Graph import Graph
+
+    strip = Graph(problem, optimized, engine, "int", analytic, columns=columns, cells=cells)
+    return (strip.defenders, strip.edges, strip.deg, strip.total_distance_defender)
+
+class ParallelGraphBuilder:
+
+    """
+    This class computes the defenders, edges, degrees and distances of a graph by splitting
+    the columns of the lattice into strips, each strip being computed by a worker process
+    (with the engine of the graph). The strips are merged in the order of the columns,
+    therefore the result is exactly the same as the serial computation.
+
+    :ivar graph: The graph to fill, its shots must already be computed.
+
+    :ivar workers: The number of worker processes.
+
+    :ivar strips_per_worker: The number of strips given to each worker (more strips balance \
+    the work better, some strips are almost empty).
+    """
+
+    def __init__(self, graph, workers, strips_per_worker=4):
+        """
+        Constructs a new 'ParallelGraphBuilder' object.
+
+        :param graph: The graph to compute the positions of.
+
+        :param workers: The number of worker processes.
+
+        :param strips_per_worker (opt): The number of strips given to each worker (default: 4).
+
+        :return: returns nothing.
+        """
+        self.graph = graph
+        self.workers = workers
+        self.strips_per_worker = strips_per_worker
+
+    def strips(self, nb_columns):
+        """
+        Splits the columns of the lattice into strips of (almost) the same width.
+
+        :param nb_columns: The number of columns of the lattice.
+
+        :return: The list of ranges of columns, from left to right.
+        """
+        nb_strips = max(1, min(nb_columns, self.workers * self.strips_per_worker))
+        bounds = [nb_columns * k // nb_strips for k in range(nb_strips + 1)]
+        return [range(bounds[k], bounds[k + 1]) for k in range(nb_strips) if bounds[k] < bounds[k + 1]]
+
+    def compute_all_positions(self, bottom_left, top_right, step, radius, goals):
+        """
+        Computes all useful positions for the defenders, see Graph.compute_all_positions.
+
+        :param bottom_left: The bottom left point of the field.
+
+        :param top_right: The top right point of the field.
+
+        :param step: Used to compute a finite number of positions for the defensers.
+
+        :param radius: Radius of a robot.
+
+        :param goals: The list of goals.
+
+        :return: returns nothing.
+        """
+        graph = self.graph
+        strips = self.strips(len(graph.lattice(bottom_left.x, top_right.x, step)))
+
+        args = ([graph.problem] * len(strips), [graph.optimized] * len(strips),
+                [graph.engine] * len(strips), [graph.analytic] * len(strips), strips, [graph.cells] * len(strips))
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+
+            # map keeps the order of the strips, whatever the order they are computed in
+            for defenders, edges, deg, distances in executor.map(compute_strip, *args):
+                for i in range(len(defenders)):
+                    graph.add_defender(defenders[i], edges[i], deg[i], distances[i])
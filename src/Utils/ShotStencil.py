@@ -0,0 +1,131 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import math
+import bisect
+
+"""
+This module is used to find the shots blocked by a defender from its offset to the opponent,
+without computing the geometry again for every opponent and every goal.
+"""
+
+class ShotStencil:
+
+    """
+    This class associates an offset between a defender and an opponent to the ranges of angles
+    (indices in the lattice of angles, see Graph.angle_lattice) of the shots of the opponent
+    whose line goes through the defender (see Graph.blocked_shots). This only depends on the
+    offset, the radius of the robots and the lattice of angles: the ranges computed for an
+    opponent are reused for its other goals, for the other opponents placed the same way with
+    regard to the lattice of positions and for the next positions of an opponent moved by whole
+    steps (see Graph.move_opponent).
+
+    The ranges are computed the first time an offset is used. An offset is identified by its
+    coordinates rounded to 'n_digits_round' digits (the offsets of two opponents placed the same
+    way differ by rounding errors), the difference between two offsets with the same key being
+    far smaller than the margins taken around the bounds of the ranges.
+
+    :ivar angles: The lattice of angles.
+
+    :ivar radius: The radius of the robots.
+
+    :ivar tolerance: The tolerance of the graph (see Graph.tolerance).
+
+    :ivar max_size: The maximum number of offsets stored, the ranges of the other offsets are \
+    computed every time.
+
+    :ivar ranges: A dictionnary associating the key of an offset to its ranges (see ranges_of).
+    """
+
+    n_digits_round = 9
+
+    def __init__(self, angles, radius, tolerance, max_size=1 << 16):
+        """
+        Constructs a new 'ShotStencil' object.
+
+        :param angles: The lattice of angles (sorted).
+
+        :param radius: The radius of the robots.
+
+        :param tolerance: The tolerance of the graph (see Graph.tolerance).
+
+        :param max_size (opt): The maximum number of offsets stored (default: 2^16).
+
+        :return: returns nothing.
+        """
+        self.angles = angles
+        self.radius = radius
+        self.tolerance = tolerance
+        self.max_size = max_size
+        self.ranges = {}
+
+    def ranges_of(self, d_x, d_y):
+        """
+        Returns the ranges of angles of an offset, computed if it is not stored yet.
+
+        :param d_x: The x coordinate of the defender minus the one of the opponent.
+
+        :param d_y: The y coordinate of the defender minus the one of the opponent.
+
+        :return: None if the defender is (almost) on the opponent, otherwise a tuple (dst, ranges), \
+        dst being the distance between the defender and the opponent and ranges a list of tuples \
+        (low, in_low, in_high, high, forward). The shots whose index is in [low ; high[ have their \
+        line close to the defender, the ones in [in_low ; in_high[ surely go through it, and forward \
+        is True if these shots go towards the defender (False if it is behind the opponent).
+        """
+        key = (round(d_x, self.n_digits_round), round(d_y, self.n_digits_round))
+        res = self.ranges.get(key)
+        if res == None:
+            res = self.compute_ranges(d_x, d_y)
+            if len(self.ranges) < self.max_size:
+                self.ranges[key] = res
+        return res if res != False else None
+
+    def compute_ranges(self, d_x, d_y):
+        """
+        Computes the ranges of angles of an offset (see ranges_of), exactly like Graph.blocked_shots
+        did for every sub list of shots: a defender at a distance d blocks every shot whose angle
+        is in [phi - alpha ; phi + alpha], phi being the angle from the opponent to the defender and
+        alpha = asin(radius / d).
+
+        :param d_x: The x coordinate of the defender minus the one of the opponent.
+
+        :param d_y: The y coordinate of the defender minus the one of the opponent.
+
+        :return: The ranges, False if the defender is (almost) on the opponent.
+        """
+        tol = self.tolerance
+        dst = math.sqrt(d_x * d_x + d_y * d_y)
+
+        # no interval can be defined
+        if dst - self.radius <= tol:
+            return False
+
+        phi = math.atan2(d_y, d_x)
+        alpha = math.asin(self.radius / dst)
+        margin = 2 * tol / math.sqrt(dst * dst - self.radius * self.radius)
+
+        # shots going towards the defender and shots going the other way (their line goes
+        # through the defender too), the angles are in [-pi ; pi[ hence the shifts
+        ranges = []
+        for center, forward in ((phi, True), (phi + math.pi, False)):
+            for shift in (-2 * math.pi, 0, 2 * math.pi):
+                low = bisect.bisect_left(self.angles, center + shift - alpha - margin)
+                high = bisect.bisect_right(self.angles, center + shift + alpha + margin)
+                if low >= high:
+                    continue
+                in_low = bisect.bisect_left(self.angles, center + shift - alpha + margin)
+                in_high = bisect.bisect_right(self.angles, center + shift + alpha - margin)
+                ranges.append((low, in_low, in_high, high, forward))
+        return (dst, ranges)
+
+    def __getstate__(self):
+        """
+        The ranges are not pickled (a graph sent to another process), they are computed again.
+
+        :return: The state of the object.
+        """
+        state = dict(self.__dict__)
+        state["ranges"] = {}
+        return state
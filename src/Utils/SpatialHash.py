@@ -0,0 +1,127 @@
+import math
+
+"""
+This module is used to quickly find the points close to a given point.
+"""
+
+class SpatialHash:
+
+    """
+    This class is a uniform grid over the plane, each cell of the grid stores the points
+    (and their associated values) that are in it. Finding the points close to a given point
+    then only requires to look at a few cells instead of all the points.
+
+    :ivar cell_size: The size of the side of a cell.
+
+    :ivar cells: A dictionnary associating a cell (i, j) to the list of (point, value) in it.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Constructs a new 'SpatialHash' object.
+
+        :param cell_size: The size of the side of a cell, ideally the distance used in the \
+        queries (must not be 0).
+
+        :return: returns nothing.
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def cell(self, x, y):
+        """
+        Computes the cell a point is in.
+
+        :param x: The x coordinate of the point.
+
+        :param y: The y coordinate of the point.
+
+        :return: The cell as a tuple (i, j).
+        """
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, point, value):
+        """
+        Adds a point to the grid.
+
+        :param point: The point to add.
+
+        :param value: The value associated to the point (an index for example).
+
+        :return: returns nothing.
+        """
+        key = self.cell(point.x, point.y)
+        if key not in self.cells:
+            self.cells[key] = []
+        self.cells[key].append((point, value))
+
+    def remove(self, point, value):
+        """
+        Removes a point from the grid (does nothing if it is not in it).
+
+        :param point: The point to remove.
+
+        :param value: The value associated to the point.
+
+        :return: returns nothing.
+        """
+        key = self.cell(point.x, point.y)
+        if key in self.cells:
+            self.cells[key] = [e for e in self.cells[key] if e[1] != value]
+
+    def neighbours_in_box(self, x_min, y_min, x_max, y_max, distance):
+        """
+        Returns every point of the grid that might be closer than the given distance to at least
+        one point of the given rectangle (a whole row or block of positions for example).
+
+        :param x_min: The left bound of the rectangle.
+
+        :param y_min: The bottom bound of the rectangle.
+
+        :param x_max: The right bound of the rectangle.
+
+        :param y_max: The top bound of the rectangle.
+
+        :param distance: The distance to consider.
+
+        :return: A generator of tuples (point, value).
+        """
+        i_min, j_min = self.cell(x_min - distance, y_min - distance)
+        i_max, j_max = self.cell(x_max + distance, y_max + distance)
+
+        # a huge rectangle, it is faster to go through the non empty cells
+        if (i_max - i_min + 1) * (j_max - j_min + 1) > len(self.cells):
+            for key in self.cells:
+                if i_min <= key[0] and key[0] <= i_max and j_min <= key[1] and key[1] <= j_max:
+                    for e in self.cells[key]:
+                        yield e
+            return
+
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                if (i, j) in self.cells:
+                    for e in self.cells[(i, j)]:
+                        yield e
+
+    def neighbours(self, point, distance):
+        """
+        Returns every point of the grid that might be closer than the given distance to the
+        given point. This is a superset (the distance still has to be checked), but a small one.
+
+        :param point: The point to consider.
+
+        :param distance: The distance to consider.
+
+        :return: A generator of tuples (point, value).
+        """
+        i, j = self.cell(point.x, point.y)
+        rng = int(math.ceil(distance / self.cell_size))
+        for di in range(-rng, rng + 1):
+            for dj in range(-rng, rng + 1):
+                key = (i + di, j + dj)
+                if key in self.cells:
+                    for e in self.cells[key]:
+                        yield e
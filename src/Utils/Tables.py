@@ -0,0 +1,414 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import numpy as np
+from src.Utils.Point import Point
+from src.Utils.UsefulTypes import Defender, Shot
+
+"""
+This module is used to store the defenders and the shots of a graph as arrays (one array per
+attribute) instead of lists of objects.
+"""
+
+class DefenderTable:
+
+    """
+    This class stores the positions of the defenders of a graph in two arrays of floats. It can
+    be used as the list of defenders: the 'Defender' objects are only created when they are
+    accessed (like MappedDefenders), a defender takes 16 bytes instead of three Python objects.
+    Two accesses to the same defender give two different objects, the defenders must then be
+    identified by their positions (or indices), not by the objects themselves.
+
+    The coordinates can be given to NumPy without any copy (see x and y).
+
+    :ivar radius: The radius of the defenders.
+
+    :ivar size: The number of defenders.
+
+    :ivar xs: The x coordinates, its length is the capacity (not the size).
+
+    :ivar ys: The y coordinates, its length is the capacity (not the size).
+    """
+
+    def __init__(self, radius, x=None, y=None):
+        """
+        Constructs a new 'DefenderTable' object.
+
+        :param radius: The radius of the defenders.
+
+        :param x (opt): The x coordinates of the defenders (default: None, no defender).
+
+        :param y (opt): The y coordinates of the defenders (default: None, no defender).
+
+        :return: returns nothing.
+        """
+        self.radius = radius
+        if x is None:
+            x, y = np.zeros(0), np.zeros(0)
+        self.xs = np.array(x, dtype=np.float64)
+        self.ys = np.array(y, dtype=np.float64)
+        self.size = len(self.xs)
+
+    @property
+    def x(self):
+        """
+        The x coordinates of the defenders (without copying them).
+
+        :return: The array of coordinates.
+        """
+        return self.xs[:self.size]
+
+    @property
+    def y(self):
+        """
+        The y coordinates of the defenders (without copying them).
+
+        :return: The array of coordinates.
+        """
+        return self.ys[:self.size]
+
+    def reserve(self, capacity):
+        """
+        Makes sure the arrays can store a given number of defenders (the capacity is doubled).
+
+        :param capacity: The number of defenders.
+
+        :return: returns nothing.
+        """
+        if capacity <= len(self.xs):
+            return
+        capacity = max(capacity, 2 * len(self.xs), 16)
+        for name in ("xs", "ys"):
+            values = np.zeros(capacity)
+            values[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, values)
+
+    def append(self, defender):
+        """
+        Adds a defender at the end of the list.
+
+        :param defender: The defender.
+
+        :return: returns nothing.
+        """
+        self.reserve(self.size + 1)
+        self.xs[self.size] = defender.pos.x
+        self.ys[self.size] = defender.pos.y
+        self.size += 1
+
+    def take(self, indices):
+        """
+        Creates the list of some of the defenders.
+
+        :param indices: The indices of the defenders (in the order of the new list).
+
+        :return: The new 'DefenderTable' object.
+        """
+        indices = np.array(indices, dtype=np.int64)
+        return DefenderTable(self.radius, self.x[indices], self.y[indices])
+
+    def copy(self):
+        """
+        Copies the list of defenders.
+
+        :return: The new 'DefenderTable' object.
+        """
+        return DefenderTable(self.radius, self.x, self.y)
+
+    def __len__(self):
+        """
+        Allows the use of len(d) where d is a 'DefenderTable' object.
+
+        :return: The number of defenders.
+        """
+        return self.size
+
+    def __getitem__(self, index):
+        """
+        Allows the use of d[i] where d is a 'DefenderTable' object.
+
+        :param index: The index of the defender.
+
+        :return: A new 'Defender' object placed at the position of the defender.
+        """
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("index out of range")
+        return Defender(Point(float(self.xs[index]), float(self.ys[index])), self.radius)
+
+    def __setitem__(self, index, defender):
+        """
+        Allows the use of d[i] = defender where d is a 'DefenderTable' object.
+
+        :param index: The index of the defender.
+
+        :param defender: The defender (only its position is stored).
+
+        :return: returns nothing.
+        """
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("index out of range")
+        self.xs[index] = defender.pos.x
+        self.ys[index] = defender.pos.y
+
+    def __iter__(self):
+        """
+        Allows the use of for defender in d where d is a 'DefenderTable' object.
+
+        :return: An iterator over the defenders.
+        """
+        for i in range(self.size):
+            yield self[i]
+
+    def swap(self, i, j):
+        """
+        Swaps two defenders.
+
+        :param i: The index of the first defender.
+
+        :param j: The index of the second defender.
+
+        :return: returns nothing.
+        """
+        self.xs[i], self.xs[j] = self.xs[j], self.xs[i]
+        self.ys[i], self.ys[j] = self.ys[j], self.ys[i]
+
+    def __getstate__(self):
+        """
+        Only the defenders are pickled, not the unused capacity.
+
+        :return: The state of the object.
+        """
+        state = dict(self.__dict__)
+        state["xs"] = self.x.copy()
+        state["ys"] = self.y.copy()
+        return state
+
+class ShotList:
+
+    """
+    This class is a sub list of shots of a 'ShotTable' (the shots of an opponent towards a goal).
+    It can be used as a list of shots, the 'Shot' objects are only created when they are accessed.
+
+    :ivar table: The table of the shots.
+
+    :ivar index: The index of the sub list in the table.
+    """
+
+    def __init__(self, table, index):
+        """
+        Constructs a new 'ShotList' object.
+
+        :param table: The table of the shots.
+
+        :param index: The index of the sub list in the table.
+
+        :return: returns nothing.
+        """
+        self.table = table
+        self.index = index
+
+    @property
+    def angles(self):
+        """
+        The angles of the shots of the sub list (without copying them).
+
+        :return: The array of angles.
+        """
+        return self.table.angles[self.table.row(self.index)]
+
+    def __len__(self):
+        """
+        Allows the use of len(s) where s is a 'ShotList' object.
+
+        :return: The number of shots.
+        """
+        return self.table.starts[self.index + 1] - self.table.starts[self.index]
+
+    def __getitem__(self, index):
+        """
+        Allows the use of s[i] where s is a 'ShotList' object.
+
+        :param index: The index of the shot in the sub list.
+
+        :return: A new 'Shot' object.
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("index out of range")
+        return self.table.shot(self.table.starts[self.index] + index)
+
+    def __iter__(self):
+        """
+        Allows the use of for shot in s where s is a 'ShotList' object.
+
+        :return: An iterator over the shots.
+        """
+        for i in range(self.table.starts[self.index], self.table.starts[self.index + 1]):
+            yield self.table.shot(i)
+
+class ShotTable:
+
+    """
+    This class stores the shots of a graph, one sub list per goal and opponent (see Graph.shots),
+    as three arrays: the angle of every shot, the index of its opponent and the index of its goal.
+    It can be used as the list of sub lists of shots, the sub lists being views of these arrays
+    (see ShotList).
+
+    :ivar opponents: The list of opponents, shared with the graph (the opponents of the shots \
+    are the ones of this list).
+
+    :ivar angles: The angle of every shot (in the order of the bits of the edges).
+
+    :ivar opponent: The index of the opponent of every shot.
+
+    :ivar goal: The index of the goal of every shot.
+
+    :ivar starts: The index of the first shot of every sub list, followed by the number of shots.
+    """
+
+    def __init__(self, opponents):
+        """
+        Constructs a new (empty) 'ShotTable' object.
+
+        :param opponents: The list of opponents of the graph.
+
+        :return: returns nothing.
+        """
+        self.opponents = opponents
+        self.angles = np.zeros(0)
+        self.opponent = np.zeros(0, dtype=np.int64)
+        self.goal = np.zeros(0, dtype=np.int64)
+        self.starts = [0]
+
+    def row(self, index):
+        """
+        Returns the indices of the shots of a sub list.
+
+        :param index: The index of the sub list.
+
+        :return: The slice of the shots.
+        """
+        return slice(self.starts[index], self.starts[index + 1])
+
+    def shot(self, index):
+        """
+        Creates a shot of the table.
+
+        :param index: The index of the shot (in the whole table).
+
+        :return: A new 'Shot' object.
+        """
+        return Shot(self.opponents[self.opponent[index]], float(self.angles[index]))
+
+    def insert(self, index, angles, opponent, goal):
+        """
+        Inserts a sub list of shots.
+
+        :param index: The index of the new sub list.
+
+        :param angles: The angles of the shots.
+
+        :param opponent: The index of the opponent of the shots.
+
+        :param goal: The index of the goal of the shots.
+
+        :return: returns nothing.
+        """
+        start = self.starts[index]
+        n = len(angles)
+        self.angles = np.insert(self.angles, start, np.array(angles, dtype=np.float64))
+        self.opponent = np.insert(self.opponent, start, np.full(n, opponent, dtype=np.int64))
+        self.goal = np.insert(self.goal, start, np.full(n, goal, dtype=np.int64))
+        self.starts = self.starts[:index + 1] + [s + n for s in self.starts[index:]]
+
+    def append(self, angles, opponent, goal):
+        """
+        Adds a sub list of shots at the end of the table.
+
+        :param angles: The angles of the shots.
+
+        :param opponent: The index of the opponent of the shots.
+
+        :param goal: The index of the goal of the shots.
+
+        :return: returns nothing.
+        """
+        self.insert(len(self), angles, opponent, goal)
+
+    def __delitem__(self, index):
+        """
+        Allows the use of del s[t] where s is a 'ShotTable' object (removes a sub list).
+
+        :param index: The index of the sub list.
+
+        :return: returns nothing.
+        """
+        start, end = self.starts[index], self.starts[index + 1]
+        self.angles = np.delete(self.angles, np.s_[start:end])
+        self.opponent = np.delete(self.opponent, np.s_[start:end])
+        self.goal = np.delete(self.goal, np.s_[start:end])
+        self.starts = self.starts[:index] + [s - (end - start) for s in self.starts[index + 1:]]
+
+    def remove_opponent(self, index):
+        """
+        Renumbers the opponents of the shots once an opponent has been removed from the list
+        of opponents (its shots must be removed too).
+
+        :param index: The index the opponent had.
+
+        :return: returns nothing.
+        """
+        self.opponent[self.opponent > index] -= 1
+
+    def take(self, indices):
+        """
+        Creates the table of some of the shots, with the same sub lists (some of them may be empty).
+
+        :param indices: The indices of the shots (in the whole table), in increasing order.
+
+        :return: The new 'ShotTable' object.
+        """
+        indices = np.array(indices, dtype=np.int64)
+        res = ShotTable(self.opponents)
+        res.angles = self.angles[indices]
+        res.opponent = self.opponent[indices]
+        res.goal = self.goal[indices]
+        res.starts = np.searchsorted(indices, self.starts).tolist()
+        return res
+
+    def __len__(self):
+        """
+        Allows the use of len(s) where s is a 'ShotTable' object.
+
+        :return: The number of sub lists.
+        """
+        return len(self.starts) - 1
+
+    def __getitem__(self, index):
+        """
+        Allows the use of s[t] where s is a 'ShotTable' object.
+
+        :param index: The index of the sub list.
+
+        :return: The corresponding 'ShotList' object.
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("index out of range")
+        return ShotList(self, index)
+
+    def __iter__(self):
+        """
+        Allows the use of for shots in s where s is a 'ShotTable' object.
+
+        :return: An iterator over the sub lists.
+        """
+        for t in range(len(self)):
+            yield ShotList(self, t)
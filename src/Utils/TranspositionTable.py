@@ -0,0 +1,77 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from collections import OrderedDict
+
+"""
+This module is used to remember the states of a search already known to lead nowhere, so that
+they are not explored twice.
+"""
+
+class TranspositionTable:
+
+    """
+    This class is a dictionnary of bounded size. When it is full, the least recently used entry
+    is removed (an entry is used when it is read or stored), so that the memory used by a search
+    does not depend on the number of states it explores.
+
+    :ivar max_size: The maximum number of entries (0 to store nothing).
+
+    :ivar evictions: The number of entries removed so far.
+
+    :ivar entries: The entries, from the least recently used to the most recently used one.
+    """
+
+    def __init__(self, max_size):
+        """
+        Constructs a new 'TranspositionTable' object.
+
+        :param max_size: The maximum number of entries (0 to store nothing).
+
+        :return: returns nothing.
+        """
+        self.max_size = max_size
+        self.evictions = 0
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        """
+        Allows the use of len(t) where t is a 'TranspositionTable' object.
+
+        :return: The number of entries.
+        """
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Reads an entry.
+
+        :param key: The key of the entry.
+
+        :return: The value of the entry, None if there is none.
+        """
+        value = self.entries.get(key)
+        if value != None:
+            self.entries.move_to_end(key)
+        return value
+
+    def store(self, key, value):
+        """
+        Stores an entry (replacing the previous one with the same key), the least recently
+        used entry is removed if the table is full.
+
+        :param key: The key of the entry.
+
+        :param value: The value of the entry.
+
+        :return: returns nothing.
+        """
+        if self.max_size <= 0:
+            return
+
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
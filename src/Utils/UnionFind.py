@@ -0,0 +1,68 @@
+"""
+This module is used to group elements into disjoint sets.
+"""
+
+class UnionFind:
+
+    """
+    This class is a disjoint-set forest: each element points towards another element of its set,
+    the root of a tree being the representative of the set. Merging two sets only requires to
+    link their roots.
+
+    :ivar parent: For each element, the element it points towards (itself for a root).
+    """
+
+    def __init__(self, size):
+        """
+        Constructs a new 'UnionFind' object, each element being alone in its set.
+
+        :param size: The number of elements.
+
+        :return: returns nothing.
+        """
+        self.parent = list(range(size))
+
+    def find(self, a):
+        """
+        Finds the representative of the set of an element. The elements on the way point
+        towards their grandparent afterwards, so that the trees remain flat.
+
+        :param a: The element.
+
+        :return: The representative of its set.
+        """
+        parent = self.parent
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    def union(self, a, b):
+        """
+        Merges the sets of two elements.
+
+        :param a: The first element.
+
+        :param b: The second element.
+
+        :return: returns nothing.
+        """
+        a = self.find(a)
+        b = self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+    def groups(self):
+        """
+        Lists the sets.
+
+        :return: The list of sets, each set being the sorted list of its elements. The sets are \
+        sorted by their smallest element.
+        """
+        res = {}
+        for a in range(len(self.parent)):
+            root = self.find(a)
+            if root not in res:
+                res[root] = []
+            res[root].append(a)
+        return [res[root] for root in sorted(res)]
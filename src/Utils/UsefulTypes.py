@@ -6,6 +6,7 @@ from src.Utils.Point import Point
 from src.Utils.Vector import Vector
 from src.Utils.LinearEquation import LinearEquation
 import math
+import numpy as np
 
 """
 This module regroups a lot of class definition that are basic encapsulations
@@ -173,6 +174,30 @@ class Goal:
     """
     This class represents a Goal. A goal is a defined by two points (to form a segment)
     and a vector that defines the orientation of the goal (where you can score from).
+
+    Everything that only depends on the goal (its mid point, its line, its bounds...) is 
+    computed once by the constructor, a goal must therefore not be modified afterwards. 
+
+    The methods starting with batch_ do the same checks as the scalar ones for whole arrays of
+    shots or positions at once. The special cases (vertical goal, horizontal or vertical shots) 
+    are handled exactly like the scalar methods, the other values are computed without the 
+    intermediate rounding of Point and Vector: the results can only differ from the scalar 
+    methods for values within rounding errors of a threshold (see Graph.tolerance). 
+
+    :ivar mid: The mid point of the segment.
+
+    :ivar mid_direction: The direction of the goal, as a vector from the mid point (see check_position).
+
+    :ivar x_min: The minimum x coordinate of the segment (x_max, y_min and y_max likewise).
+
+    :ivar vertical: True if the segment is vertical.
+
+    :ivar ratio: The slope of the line of the goal (None if it is vertical).
+
+    :ivar line: The linear equation of the line of the goal (None if it is vertical).
+
+    :ivar normal: A tuple (n_x, n_y, c) such that n_x * x + n_y * y + c is the signed distance \
+    of the point (x, y) to the line of the goal (None if the posts are the same point).
     """
 
     def __init__(self, start_pos, end_pos, direction):
@@ -191,6 +216,33 @@ class Goal:
         self.e_pos = end_pos
         self.dir = direction
 
+        # the mid point and the direction of the goal (see check_position)
+        self.mid = Point.mid_point(self.s_pos, self.e_pos)
+        self.mid_direction = Vector.v_from_pp(self.mid, self.dir + self.mid)
+
+        # the x and y intervals of the segment
+        self.x_min = min(self.s_pos.x, self.e_pos.x)
+        self.x_max = max(self.s_pos.x, self.e_pos.x)
+        self.y_min = min(self.s_pos.y, self.e_pos.y)
+        self.y_max = max(self.s_pos.y, self.e_pos.y)
+
+        # the line of the goal, a vertical goal has no slope
+        self.vertical = self.e_pos.x - self.s_pos.x == 0
+        self.ratio = None
+        self.line = None
+        if not self.vertical:
+            self.ratio = (self.e_pos.y - self.s_pos.y) / (self.e_pos.x - self.s_pos.x)
+            self.line = LinearEquation(self.ratio, self.e_pos.y - self.e_pos.x * self.ratio)
+
+        # the unit normal of the line of the goal
+        self.normal = None
+        n_x = self.s_pos.y - self.e_pos.y
+        n_y = self.e_pos.x - self.s_pos.x
+        norm = math.sqrt(n_x * n_x + n_y * n_y)
+        if norm != 0:
+            n_x, n_y = n_x / norm, n_y / norm
+            self.normal = (n_x, n_y, -(n_x * self.s_pos.x + n_y * self.s_pos.y))
+
     def __str__(self):
         """
         Allows the use of print(g) where g is a 'Goal' object. 
@@ -234,22 +286,36 @@ class Goal:
         :return: True if the player is correctly placed, False otherwise.
         """
 
-        # Mid point of the segment defining the goal
-        mid = Point.mid_point(self.s_pos, self.e_pos)
-
-        # Transposition of this point by the direction vector of the goal
-        # to get the direction vector with its origin in the center of the goal
-        mid_prime = self.dir + mid
-
-        # Creating both needed vectors
-        v1 = Vector.v_from_pp(mid, player.pos)
-        v2 = Vector.v_from_pp(mid, mid_prime)
+        # The vector from the center of the goal to the player, the direction 
+        # of the goal (from its center) is computed once (see mid_direction)
+        v1 = Vector.v_from_pp(self.mid, player.pos)
 
         # Getting the angle and checking if it is a valid one
-        angle = v1.angle(v2)
+        angle = v1.angle(self.mid_direction)
 
         return self.is_in_interval(-math.pi / 2, math.pi / 2, angle)
 
+    def batch_check_position(self, xs, ys):
+        """
+        Checks, for arrays of positions, if a player placed there is correctly placed with
+        regard to the orientation of the goal (see check_position).
+
+        :param xs: The x coordinates of the positions.
+
+        :param ys: The y coordinates of the positions.
+
+        :return: A boolean array.
+        """
+        v_x = np.asarray(xs, dtype=np.float64) - self.mid.x
+        v_y = np.asarray(ys, dtype=np.float64) - self.mid.y
+        norms = np.sqrt(v_x ** 2 + v_y ** 2) * self.mid_direction.norm()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cosine = (v_x * self.mid_direction.x + v_y * self.mid_direction.y) / norms
+
+        # acos(cosine) <= pi / 2, the angle being rounded up by the scalar method, the
+        # positions on the line of the goal (and the mid point itself) are not valid
+        return cosine > 0
+
     def check_shot_direction(self, shot):
         """
         Checks if the given shot goes towards this goal. To do so,
@@ -268,6 +334,26 @@ class Goal:
         """
         return Vector.v_from_a(shot.angle) * self.dir < 0
 
+    def batch_check_shot_direction(self, angles):
+        """
+        Checks, for an array of angles, if the shots go towards this goal (see check_shot_direction).
+
+        :param angles: The angles of the shots.
+
+        :return: A boolean array.
+        """
+        angles = np.asarray(angles, dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            tan = np.tan(angles)
+
+        # the vector of the shot is (1, tan) or (-1, -tan), (0, 1) or (0, -1) if it is vertical,
+        # rounded like Vector.v_from_a and the scalar product
+        sign = np.where(np.abs(angles) > math.pi / 2, -1.0, 1.0)
+        product = sign * self.dir.x + sign * np.round(tan, 10) * self.dir.y
+        product = np.where(angles == math.pi / 2, self.dir.y, product)
+        product = np.where(angles == -math.pi / 2, -self.dir.y, product)
+        return np.round(product, 10) < 0
+
     def check_shot_on_target(self, shot):
         """
         Checks if the shot (abstracted to an infinite line) intersects the goal's
@@ -282,12 +368,9 @@ class Goal:
         :return: True if the shot intersects the goal's segment, False otherwise.
         """
         # Defining a few variables to ease the reading
-        # Here we define the x and y interval of the goal's segment
-        x_min = min(self.s_pos.x, self.e_pos.x)
-        x_max = max(self.s_pos.x, self.e_pos.x)
-
-        y_min = min(self.s_pos.y, self.e_pos.y)
-        y_max = max(self.s_pos.y, self.e_pos.y)
+        # Here we use the x and y interval of the goal's segment
+        x_min, x_max = self.x_min, self.x_max
+        y_min, y_max = self.y_min, self.y_max
 
         # Shortening variables names
         o_x = shot.opponent.pos.x
@@ -325,22 +408,19 @@ class Goal:
         # computing the application of the shot's LE on this ex coordinate
         #
         # Then, the resulting y is valid iff it is in the goal's segment interval
-        if self.e_pos.x - self.s_pos.x == 0:
+        if self.vertical:
             y = le1.apply(self.e_pos.x)
             return self.is_in_interval(y_min, y_max, y)
 
         # The normal way of solving the intersection of these two LEs
         else:
 
-            # Shortening variables by computing the coefficient of the goal's LE
-            ratio = (self.e_pos.y - self.s_pos.y) / (self.e_pos.x - self.s_pos.x)
-
             # If the lines are parallels (have the same coefficient) return False
-            if math.tan(shot.angle) == ratio:
+            if tan_theta == self.ratio:
                 return False
 
-            # Defining the goal's LE
-            le2 = LinearEquation(ratio, self.e_pos.y - self.e_pos.x * ratio)
+            # The goal's LE (computed once)
+            le2 = self.line
 
         # Finding the intersection point of the two LEs
         # If there isn't one, return False (but there should be one
@@ -353,6 +433,40 @@ class Goal:
         # a valid abstracted shot going 
         return self.is_in_interval(x_min, x_max, p_intersect.x)
 
+    def batch_check_shot_on_target(self, o_x, o_y, angles):
+        """
+        Checks, for arrays of shots, if their lines intersect the goal's segment (see 
+        check_shot_on_target).
+
+        :param o_x: The x coordinates of the opponents shooting.
+
+        :param o_y: The y coordinates of the opponents shooting.
+
+        :param angles: The angles of the shots.
+
+        :return: A boolean array.
+        """
+        o_x, o_y, angles = np.broadcast_arrays(np.asarray(o_x, dtype=np.float64), np.asarray(o_y, dtype=np.float64),
+                                               np.asarray(angles, dtype=np.float64))
+        vertical = np.abs(angles) == math.pi / 2
+        horizontal = (np.abs(angles) == math.pi) | (angles == 0)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            tan = np.tan(angles)
+
+            # the LE of the shots, rounded like LinearEquation
+            a = np.round(tan, 15)
+            b = np.round(o_y - tan * o_x, 15)
+            if self.vertical:
+                y = np.round(a * self.e_pos.x + b, 15)
+                res = (self.y_min <= y) & (y <= self.y_max)
+            else:
+                x = np.round((self.line.b - b) / (a - self.line.a), 10)
+                res = (self.x_min <= x) & (x <= self.x_max) & (tan != self.ratio) & (a != self.line.a)
+
+        res = np.where(vertical, (self.x_min <= o_x) & (o_x <= self.x_max), res)
+        return np.where(horizontal, (self.y_min <= o_y) & (o_y <= self.y_max), res)
+
     def is_shot_valid(self, shot):
         """
         Checks if a shot is valid (going in the goal) or not. To do so, three
@@ -378,13 +492,77 @@ class Goal:
         c = self.check_shot_on_target(shot)
         return a and b and c
 
+    def batch_is_shot_valid(self, o_x, o_y, angles):
+        """
+        Checks, for arrays of shots, if they are valid (see is_shot_valid).
+
+        :param o_x: The x coordinates of the opponents shooting.
+
+        :param o_y: The y coordinates of the opponents shooting.
+
+        :param angles: The angles of the shots.
+
+        :return: A boolean array.
+        """
+        return (self.batch_check_position(o_x, o_y) & self.batch_check_shot_direction(angles) &
+                self.batch_check_shot_on_target(o_x, o_y, angles))
+
+    def shot_angle_boundaries(self, opponent):
+        """
+        Computes the angles at which the validity of the shots of an opponent can change (see 
+        is_shot_valid): the angles of the lines going through the opponent and a post (check 3)
+        and the angles of the shots orthogonal to the direction of the goal (check 2). Between
+        two consecutive boundaries, either every shot is valid or none is (see shot_goes_in).
+
+        :param opponent: The opponent to consider. 
+
+        :return: The list of angles (in [-pi ; pi[), None if the opponent is on a post or if the \
+        direction of the goal is null.
+        """
+        if self.dir.x == 0 and self.dir.y == 0:
+            return None
+
+        res = []
+        for post in (self.s_pos, self.e_pos):
+            if post.x == opponent.pos.x and post.y == opponent.pos.y:
+                return None
+            angle = math.atan2(post.y - opponent.pos.y, post.x - opponent.pos.x)
+            res += [angle, angle + math.pi]
+
+        angle = math.atan2(self.dir.y, self.dir.x)
+        res += [angle + math.pi / 2, angle - math.pi / 2]
+
+        return [(a + math.pi) % (2 * math.pi) - math.pi for a in res]
+
+    def shot_goes_in(self, opponent, angle):
+        """
+        Checks, without any rounding, if a shot goes towards the goal (check 2 of is_shot_valid) 
+        and if its line intersects the goal's segment (check 3). This is the same as is_shot_valid 
+        (for a correctly placed opponent) except for the shots too close to a boundary 
+        (see shot_angle_boundaries).
+
+        :param opponent: The opponent shooting. 
+
+        :param angle: The angle of the shot. 
+
+        :return: True if the shot goes in the goal, False otherwise.
+        """
+        u_x, u_y = math.cos(angle), math.sin(angle)
+        if u_x * self.dir.x + u_y * self.dir.y >= 0:
+            return False
+
+        c1 = u_x * (self.s_pos.y - opponent.pos.y) - u_y * (self.s_pos.x - opponent.pos.x)
+        c2 = u_x * (self.e_pos.y - opponent.pos.y) - u_y * (self.e_pos.x - opponent.pos.x)
+        return c1 * c2 <= 0
+
     def shot_intercepted(self, defender, shot):
         """
         Checks if the given shot is intercepted by the given player with regard to this goal. 
 
         To do so, we check if the circle defined by the player and its radius intersects the
         shot. Then, it is checked if the intersection is between the opponent and the goal. 
-        There are plenty of special cases, find more information below. 
+        There are plenty of special cases, find more information in 
+        :func:`~src.Utils.UsefulTypes.Goal.interception_bounds`. 
 
         :param defender: The defender that should intercept the shot. 
 
@@ -392,6 +570,33 @@ class Goal:
             
         :return: True if the shot is intercepted, False otherwise.
         """
+        p = LinearEquation.intersection_circle(shot.opponent, shot.angle, defender.pos, defender.radius)
+
+        if p == None:
+            return False
+
+        bounds = self.interception_bounds(shot)
+        if bounds == None:
+            return False
+
+        # bounds is (axis, low, high), the coordinate 'axis' of the intersection point
+        # must be between the opponent and the goal
+        axis, low, high = bounds
+        return self.is_in_interval(low, high, p.x if axis == 0 else p.y)
+
+    def interception_bounds(self, shot):
+        """
+        Computes the interval in which the intersection point of a defender and the given shot
+        must be for the shot to be intercepted before reaching this goal. This interval only
+        depends on the shot and the goal, not on the defender, therefore it can be computed
+        once per shot and reused for every defender. 
+
+        :param shot: The shot to consider. 
+
+        :return: None if no defender can intercept this shot wrt this goal, otherwise a tuple \
+        (axis, low, high) where axis is 0 if the x coordinate of the intersection point must be \
+        in [low ; high] and 1 if it is the y coordinate.
+        """
 
         o_x = shot.opponent.pos.x
         o_y = shot.opponent.pos.y
@@ -399,20 +604,14 @@ class Goal:
         le1 = None
         le2 = None
 
-        p = None
         q = None
 
-        p = LinearEquation.intersection_circle(shot.opponent, shot.angle, defender.pos, defender.radius)
-
-        if p == None:
-            return False
-
         # If the goal is vertical, solving the intersection won't work
         # it is then done "by hand"
-        if self.e_pos.x - self.s_pos.x == 0:
-            # If the goal and the shot are vertical, return False
+        if self.vertical:
+            # If the goal and the shot are vertical, return None
             if abs(shot.angle) == math.pi / 2:
-                return False
+                return None
             
             # If the angle = 0, pi or -pi, then tan(angle) is 0 which can lead to
             # undefined behaviors (namely if the goal is vertical)
@@ -422,26 +621,25 @@ class Goal:
             # is between the goal and the opponent x coordinates
             if abs(shot.angle) == math.pi or shot.angle == 0:
                 q = Point(self.e_pos.x, o_y)
-                return self.is_in_interval(min(q.x, o_x), max(q.x, o_x), p.x)
+                return (0, min(q.x, o_x), max(q.x, o_x))
 
             tan_theta = math.tan(shot.angle)
 
             le2 = LinearEquation(tan_theta, o_y - tan_theta * o_x)
             q = Point(self.e_pos.x, le2.apply(self.e_pos.x)) 
-            return self.is_in_interval(min(q.x, o_x), max(q.x, o_x), p.x)     
+            return (0, min(q.x, o_x), max(q.x, o_x))
 
-        # If the goal is not vertical, it is now possible to define the coefficient
-        # of the goal's LE
-        ratio = (self.e_pos.y - self.s_pos.y) / (self.e_pos.x - self.s_pos.x)
+        # If the goal is not vertical, its LE is known (see line)
+        tan_theta = math.tan(shot.angle)
 
         # If the shot is parallel to the goal (same coefficient) it doesn't
         # matter if it is intercepted (this method should only be used
         # with valid shot in the first place, this is just for completion sake)
-        if math.tan(shot.angle) == ratio:
-            return False
+        if tan_theta == self.ratio:
+            return None
 
         # LE of the goal
-        le1 = LinearEquation(ratio, self.e_pos.y - self.e_pos.x * ratio)
+        le1 = self.line
 
         # If the angle = pi / 2 or - pi / 2, then tan(angle) is undefined
         # In these cases, the shot is vertical, therefore it is valid
@@ -449,7 +647,7 @@ class Goal:
         # is between the goal and the opponent
         if abs(shot.angle) == math.pi / 2:
             q = Point(o_x, le1.apply(o_x))
-            return self.is_in_interval(min(q.y, o_y), max(q.y, o_y), p.y)
+            return (1, min(q.y, o_y), max(q.y, o_y))
         
         # If the angle = 0, pi or -pi, then tan(angle) is 0 which can lead to
         # undefined behaviors (namely if the goal is vertical)
@@ -459,18 +657,124 @@ class Goal:
         # is between the goal and the opponent y coordinates
         if abs(shot.angle) == math.pi or shot.angle == 0:
             q = Point(le1.reverse(o_y), o_y)
-            return self.is_in_interval(min(q.x, o_x), max(q.x, o_x), p.x)
+            return (0, min(q.x, o_x), max(q.x, o_x))
 
-        tan_theta = math.tan(shot.angle)
-        
         # LE of the shot
         le2 = LinearEquation(tan_theta, o_y - tan_theta * o_x)
 
-        # Find the intersection of the two lines and check if the defender
-        # is between this point and the opponent
+        # Find the intersection of the two lines, the defender must be 
+        # between this point and the opponent
         q = le1.intersection(le2)
 
-        return self.is_in_interval(min(q.x, o_x), max(q.x, o_x), p.x)
+        return (0, min(q.x, o_x), max(q.x, o_x))
+
+    def batch_interception_bounds(self, o_x, o_y, angles):
+        """
+        Computes the intervals of interception_bounds for arrays of shots.
+
+        :param o_x: The x coordinates of the opponents shooting.
+
+        :param o_y: The y coordinates of the opponents shooting.
+
+        :param angles: The angles of the shots.
+
+        :return: Three arrays (axis, low, high), see interception_bounds, axis is -1 for the \
+        shots that cannot be intercepted.
+        """
+        o_x, o_y, angles = np.broadcast_arrays(np.asarray(o_x, dtype=np.float64), np.asarray(o_y, dtype=np.float64),
+                                               np.asarray(angles, dtype=np.float64))
+        vertical = np.abs(angles) == math.pi / 2
+        horizontal = (np.abs(angles) == math.pi) | (angles == 0)
+        axis = np.zeros(len(angles), dtype=np.int64)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            tan = np.tan(angles)
+
+            # the LE of the shots, rounded like LinearEquation
+            a = np.round(tan, 15)
+            b = np.round(o_y - tan * o_x, 15)
+
+            # the goal is vertical: the point of the shot on the line of the goal
+            if self.vertical:
+                q = np.full(len(angles), round(self.e_pos.x, 10))
+                axis[vertical] = -1
+
+            # the intersection of the shot and the line of the goal, the vertical and
+            # horizontal shots are computed like in interception_bounds
+            else:
+                q = np.round((b - self.line.b) / (self.line.a - a), 10)
+                q = np.where(horizontal, np.round(np.round((o_y - self.line.b) / self.ratio), 10), q)
+                q_y = np.round(np.round(self.ratio * o_x + self.line.b, 15), 10)
+                q = np.where(vertical, q_y, q)
+                axis[vertical] = 1
+                axis[(tan == self.ratio) | (a == self.line.a)] = -1
+
+        coord = np.where(axis == 1, o_y, o_x)
+        low = np.minimum(q, coord)
+        high = np.maximum(q, coord)
+        axis[~np.isfinite(low) | ~np.isfinite(high)] = -1
+        low[axis == -1] = 0
+        high[axis == -1] = 0
+        return axis, low, high
+
+    def interception_bounds_with_speed(self, shot):
+        """
+        Computes the interval in which the x coordinate of the point of the shot the closest to
+        a defender must be for the defender to intercept the shot before it reaches this goal,
+        exactly like shot_intercepted_with_speed. Like interception_bounds, this interval can be
+        computed once per shot and reused for every defender.
+
+        :param shot: The shot to consider, it must not be vertical (see shot_intercepted_with_speed).
+
+        :return: None if no defender can intercept this shot wrt this goal, otherwise a tuple \
+        (low, high).
+        """
+        o_x = shot.opponent.pos.x
+        o_y = shot.opponent.pos.y
+
+        # If the goal is vertical, the interval goes from the goal to the opponent
+        if self.vertical:
+            return (min(self.e_pos.x, o_x), max(self.e_pos.x, o_x))
+
+        tan_theta = math.tan(shot.angle)
+        if tan_theta == self.ratio:
+            return None
+
+        le2 = LinearEquation(tan_theta, o_y - tan_theta * o_x)
+        q = self.line.intersection(le2)
+
+        return (min(q.x, o_x), max(q.x, o_x))
+
+    def batch_interception_bounds_with_speed(self, o_x, o_y, angles):
+        """
+        Computes the intervals of interception_bounds_with_speed for arrays of shots.
+
+        :param o_x: The x coordinates of the opponents shooting.
+
+        :param o_y: The y coordinates of the opponents shooting.
+
+        :param angles: The angles of the shots (not vertical).
+
+        :return: Two arrays (low, high), the interval is [inf ; -inf] for the shots that \
+        cannot be intercepted.
+        """
+        o_x, o_y, angles = np.broadcast_arrays(np.asarray(o_x, dtype=np.float64), np.asarray(o_y, dtype=np.float64),
+                                               np.asarray(angles, dtype=np.float64))
+        if self.vertical:
+            q = np.full(len(angles), float(self.e_pos.x))
+        else:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                tan = np.tan(angles)
+                a = np.round(tan, 15)
+                q = np.round((np.round(o_y - tan * o_x, 15) - self.line.b) / (self.line.a - a), 10)
+                q[(tan == self.ratio) | (a == self.line.a)] = np.nan
+
+        low = np.minimum(q, o_x)
+        high = np.maximum(q, o_x)
+        none = ~np.isfinite(low) | ~np.isfinite(high)
+        low[none] = math.inf
+        high[none] = -math.inf
+        return low, high
 
     def shot_intercepted_with_speed(self, defender, shot, ball_speed, player_speed):
         """
@@ -526,21 +830,17 @@ class Goal:
 
         # If the goal is vertical, solving the intersection won't work
         # it is then done "by hand"
-        if self.e_pos.x - self.s_pos.x == 0:
+        if self.vertical:
             return self.is_in_interval(min(self.e_pos.x, o_x), max(self.e_pos.x, o_x), p_inter.x)     
 
-        # If the goal is not vertical, it is now possible to define the coefficient
-        # of the goal's LE
-        ratio = (self.e_pos.y - self.s_pos.y) / (self.e_pos.x - self.s_pos.x)
-
         # If the shot is parallel to the goal (same coefficient) it doesn't
         # matter if it is intercepted (this method should only be used
         # with valid shot in the first place, this is just for completion sake)
-        if math.tan(shot.angle) == ratio:
+        if math.tan(shot.angle) == self.ratio:
             return False
 
-        # LE of the goal
-        le1 = LinearEquation(ratio, self.e_pos.y - self.e_pos.x * ratio)
+        # LE of the goal (see line)
+        le1 = self.line
 
         # Find the intersection of the two lines and check if the defender
         # is between this point and the opponent
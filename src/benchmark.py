@@ -0,0 +1,144 @@
+"""
+Compares the exact solvers (BranchAndBoundSolver and BruteForceSolver) on random problems.
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+import src.Decoders.JSonDecoder as JSonDecoder
+from src.ProblemUtils.Problem import Problem
+from src.ProblemUtils.ProblemType import ProblemType
+from src.ProblemUtils.ProblemGenerator import problem_generator
+from src.Utils.Graph import Graph
+from src.Solvers.BruteForceSolver import BruteForceSolver
+from src.Solvers.BranchAndBoundSolver import BranchAndBoundSolver
+from src.Solvers.SolverArgs import SolverArgs
+
+import multiprocessing
+import tempfile
+import operator
+import random
+import time
+
+##################################################################################
+################################# VARIABLES ######################################
+##################################################################################
+
+nb_problems = 5 # number of random problems generated
+opponents = 8 # number of opponents of each problem
+timeout = 600.0 # maximum time given to each solver (in seconds)
+seed = 0 # seed of the random problems
+
+# args of the exact solvers
+args = SolverArgs()
+args.compare_func = operator.lt # x < y
+
+##################################################################################
+################################# UTILS ##########################################
+##################################################################################
+
+def run(solver, graph, queue):
+    """
+    Solves a graph and sends the result (size of the solution, time spent) through a queue.
+
+    :param solver: The class of the solver.
+
+    :param graph: The graph to solve.
+
+    :param queue: The queue to send the result to.
+    """
+    start = time.time()
+    res = solver(graph).solve(args)
+    queue.put((None if res == None else len(res), time.time() - start))
+
+def timed(solver, graph):
+    """
+    Solves a graph in another process, stopped after 'timeout' seconds.
+
+    :param solver: The class of the solver.
+
+    :param graph: The graph to solve.
+
+    :return: A tuple (size, time), size being None if there is no solution and time being \
+    None if the solver has been stopped.
+
+    :raise RuntimeError: If the process has stopped without giving a result.
+    """
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run, args=(solver, graph, queue))
+    process.start()
+    process.join(timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        return (None, None)
+
+    # the solver failed, nothing has been sent
+    if process.exitcode != 0:
+        raise RuntimeError(solver.__name__ + " s'est arrete avec le code " + str(process.exitcode))
+    return queue.get()
+
+def show_time(value):
+    """
+    Formats a time (or the timeout if the solver has been stopped).
+
+    :param value: The time in seconds (None if stopped).
+
+    :return: The corresponding string.
+    """
+    if value == None:
+        return "> " + str(timeout)
+    return str(round(value, 4))
+
+def usage():
+    print("Usage: python3 benchmark.py [<file> ...]")
+    print("file: chemin vers un probleme (par defaut " + str(nb_problems) + " problemes aleatoires a " +
+          str(opponents) + " adversaires)")
+
+##################################################################################
+################################# MAIN ###########################################
+##################################################################################
+
+# the processes of the solvers import this module again on some platforms (spawn)
+if __name__ == "__main__":
+
+    if len(sys.argv) >= 2 and sys.argv[1] in ("-h", "--help"):
+        usage()
+        exit(0)
+
+    # the problems given, or random ones
+    directory = tempfile.TemporaryDirectory()
+    paths = sys.argv[1:]
+    if len(paths) == 0:
+        random.seed(seed)
+        for i in range(nb_problems):
+            paths.append(os.path.join(directory.name, "problem" + str(i) + ".json"))
+            problem_generator(ProblemType.BASIC, paths[-1], opponents)
+
+    print("probleme | defenseurs | tirs | taille b&b | temps b&b | taille brute | temps brute | acceleration")
+
+    for path in paths:
+        problem = Problem(JSonDecoder.decode)
+        problem.decode(path)
+        graph = Graph(problem, engine="numpy")
+
+        try:
+            size_bnb, time_bnb = timed(BranchAndBoundSolver, graph)
+            size_brute, time_brute = timed(BruteForceSolver, graph)
+        except RuntimeError as e:
+            print(os.path.basename(path) + " | " + str(e))
+            continue
+
+        # the brute force solver has been stopped, the speedup is at least timeout / time_bnb
+        # (smaller than 1 if brute force is faster)
+        speedup = "?"
+        if time_bnb != None:
+            speedup = (">" if time_brute == None else "") + \
+                      str(round((timeout if time_brute == None else time_brute) / max(time_bnb, 1e-6), 2))
+
+        print(" | ".join([os.path.basename(path), str(len(graph.defenders)), str(graph.nb_shots),
+                          str(size_bnb), show_time(time_bnb), str(size_brute) if time_brute != None else "?",
+                          show_time(time_brute), speedup]))
+
+    directory.cleanup()
@@ -10,12 +10,21 @@ import src.Decoders.JSonDecoder as JSonDecoder
 from src.ProblemUtils.Problem import Problem
 from src.ProblemUtils.ProblemType import ProblemType
 from src.Utils.Graph import Graph
+from src.Utils.GraphCache import GraphCache
 from src.Solvers.RandomSolver import RandomSolver
 from src.Solvers.BruteForceSolver import BruteForceSolver
+from src.Solvers.BranchAndBoundSolver import BranchAndBoundSolver
+from src.Solvers.MILPSolver import MILPSolver
+from src.Solvers.CPSATSolver import CPSATSolver
 from src.Solvers.GreedySolver import GreedySolver
 from src.Solvers.SolverArgs import SolverArgs
+from src.Solvers.ComponentSolver import ComponentSolver
+from src.Solvers.MultiResolutionSolver import MultiResolutionSolver
+from src.Solvers.StreamingSolver import StreamingSolver
 
+import math
 import time
+import operator
 
 ##################################################################################
 ################################# VARIABLES ######################################
@@ -25,10 +34,23 @@ import time
 BRUTE = BruteForceSolver
 RANDOM = RandomSolver
 GREEDY = GreedySolver
+BNB = BranchAndBoundSolver
+MILP = MILPSolver
+CPSAT = CPSATSolver
 UNKNOWN = None
 
 # args for the graph generation
 optimized = True # if true some problem with valid solution may become unsolvable
+engine = "numpy" # "python" or "numpy", both generate the exact same graph
+edges_backend = "bitset" # "int" or "bitset" (packed matrix, faster for the greedy solver)
+workers = 1 # number of processes used to generate the graph (same graph whatever the value)
+cache_dir = None # directory where the generated graphs are stored and reused (None to disable)
+cache_size = 500 * 1024 * 1024 # maximum size of this directory in bytes
+storage = "memory" # "memory" or "mmap" (defenders and edges in files, for very fine problems)
+reduce = False # if true the graph is reduced before solving (same size of solutions, see GraphReduction.py)
+components = False # if true the independent parts of the graph are solved separately (by workers processes, see the __main__ guard below)
+resolution = 1 # if greater than 1, solved with a pos_step this many times bigger first, then refined (greedy or random)
+streaming = False # if true the solver starts as soon as the most promising defenders block every shot (greedy or random)
 
 # args for the greedy algorithm
 greedy_args = SolverArgs()
@@ -37,7 +59,7 @@ greedy_args.greedy_random = True
 # args for the random solver (please do modify)
 # see more info in SolverArgs.py
 random_args = SolverArgs()
-random_args.compare_func = lambda x, y : x < y
+random_args.compare_func = operator.lt # x < y (not a lambda, so that it can be sent to other processes)
 random_args.random_tries = 10000
 random_args.random_i_max = 1000
 random_args.random_prob = 0.2
@@ -46,7 +68,22 @@ random_args.random_perm = None
 
 # args for the brute solver
 brute_args = SolverArgs()
-brute_args.compare_func = lambda x, y: x < y
+brute_args.compare_func = operator.lt # x < y
+brute_args.brute_memo_size = 100000 # states leading nowhere remembered by the search (0 to disable)
+
+# args for the branch and bound solver (the order of the defenders does not matter)
+bnb_args = SolverArgs()
+
+# args for the integer programming solver (requires scipy)
+milp_args = SolverArgs()
+milp_args.milp_timeout = 60.0 # the best solution found is returned after this delay (None for no limit)
+milp_args.milp_cliques = True # collisions as cliques of defenders (tighter) or as pairs
+
+# args for the constraint programming solver (requires ortools)
+cpsat_args = SolverArgs()
+cpsat_args.sat_timeout = 60.0 # the best solution found is returned after this delay (None for no limit)
+cpsat_args.sat_workers = os.cpu_count() or 1 # number of threads searching in parallel
+cpsat_args.sat_goalkeeper = (0, 1) # at most one defender in the goalkeeper area, as checked by the viewer (goal keeper problems only)
 
 # path to the problem file
 path = None
@@ -72,60 +109,117 @@ def str_to_solver(string):
         return (RANDOM, random_args)
     if string == "brute":
         return (BRUTE, brute_args)
+    if string == "bnb":
+        return (BNB, bnb_args)
+    if string == "milp":
+        return (MILP, milp_args)
+    if string == "cpsat":
+        return (CPSAT, cpsat_args)
     return (UNKNOWN, None)
 
 def usage():
     print("Usage: python3 main.py <file> <solveur>")
     print("file: chemin vers le probleme a resoudre")
-    print("solveur: le solveur a utiliser greedy|random|brute")
+    print("solveur: le solveur a utiliser greedy|random|brute|bnb|milp|cpsat")
 
 ##################################################################################
 ################################# MAIN ###########################################
 ##################################################################################
 
-# reads the given arguments (no safety check)
-if len(sys.argv) >= 3:
-    path = sys.argv[1]
-    solver, args = str_to_solver(sys.argv[2])
+# the worker processes (workers > 1) import this module again on the platforms that do not
+# use fork (macOS, Windows), the script must only run in the main process
+if __name__ == "__main__":
+
+    # reads the given arguments (no safety check)
+    if len(sys.argv) >= 3:
+        path = sys.argv[1]
+        solver, args = str_to_solver(sys.argv[2])
 
-    if solver == UNKNOWN:
+        if solver == UNKNOWN:
+            usage()
+            exit(1)
+    else:
         usage()
         exit(1)
-else:
-    usage()
-    exit(1)
-
-# Creates the problem
-problem = Problem(JSonDecoder.decode)
-problem.decode(path)
-
-# timer for the graph generation
-
-start = time.time()
-
-# creates the graph
-graph = Graph(problem, optimized=optimized)
-
-print("")
-
-print("Le graphe a mis " + str(round(time.time() - start, 4)) + " secondes à se générer.")
-
-# creates the solver
-s = solver(graph)
-
-start = time.time()
-
-# solves the graph
-res = s.solve(args)
-
-print("Le solveur s'est exécuté en " + str(round(time.time() - start, 4)) + " secondes.")
-
-print("")
-
-# if no results are found, stop here
-if res == None:
-    print("No solution found with this solver.")
-    exit(2)
 
-# Fetch the results
-JSonDecoder.save_json(res, "data.json")
\ No newline at end of file
+    # Creates the problem
+    problem = Problem(JSonDecoder.decode)
+    problem.decode(path)
+
+    # timer for the graph generation
+
+    start = time.time()
+
+    # creates the graph
+    cache = None
+    if cache_dir != None:
+        cache = GraphCache(cache_dir, cache_size)
+    graph_args = {"optimized": optimized, "engine": engine, "edges_backend": edges_backend, "workers": workers,
+                  "cache": cache, "storage": storage}
+
+    # with multiple resolutions, the solver computes its own graphs (never the whole graph)
+    graph = None
+    if resolution == 1:
+        graph = Graph(problem, lazy=streaming, **graph_args)
+
+        print("")
+
+        print("Le graphe a mis " + str(round(time.time() - start, 4)) + " secondes à se générer.")
+
+    # reduces the graph, the solver works on the reduced graph
+    reduction = None
+    if reduce and graph != None and not streaming:
+        start = time.time()
+        reduction = graph.reduce()
+        print("La réduction a mis " + str(round(time.time() - start, 4)) + " secondes, " +
+              str(len(reduction.forced)) + " défenseur(s) imposé(s).")
+        if reduction.feasible:
+            graph = reduction.reduced
+
+    # creates the solver (on each independent part of the graph if required)
+    if graph == None:
+        s = MultiResolutionSolver(problem, solver, resolution, graph_args=graph_args)
+    elif streaming:
+        s = StreamingSolver(graph, solver)
+    elif components:
+        s = ComponentSolver(graph, solver, workers)
+    else:
+        s = solver(graph)
+
+    start = time.time()
+
+    # solves the graph (the reduction may have already selected every needed defender)
+    if reduction != None and not reduction.feasible:
+        res = None
+    elif reduction != None and graph.nb_shots == 0:
+        res = []
+    else:
+        res = s.solve(args)
+
+    # adds the defenders selected by the reduction
+    if reduction != None:
+        res = reduction.expand(res)
+
+    print("Le solveur s'est exécuté en " + str(round(time.time() - start, 4)) + " secondes.")
+
+    # statistics of the solver (nodes explored, branches pruned...)
+    for key in s.stats:
+        print(key + ": " + str(s.stats[key]))
+
+    # size of the solution found and proven lower bound (on the reduced graph, plus the forced defenders)
+    if "best" in s.stats and "lower_bound" in s.stats:
+        nb_forced = len(reduction.forced) if reduction != None else 0
+        best = s.stats["best"] + nb_forced
+        lower_bound = s.stats["lower_bound"] + nb_forced
+        print("Meilleure solution / borne inférieure : " + str(best) + " / " + str(lower_bound) +
+              (" (solution minimum)" if best == lower_bound and best != math.inf else ""))
+
+    print("")
+
+    # if no results are found, stop here
+    if res == None:
+        print("No solution found with this solver.")
+        exit(2)
+
+    # Fetch the results
+    JSonDecoder.save_json(res, "data.json")
@@ -8,5 +8,5 @@ if [[ ! ($# -le 1) ]]; then
 else
     echo "Usage: ./solve.sh <file> <solveur>"
     echo "file: chemin vers le problème à résoudre"
-    echo "solveur: le solveur à utiliser greedy|random|brute"
+    echo "solveur: le solveur à utiliser greedy|random|brute|bnb|milp|cpsat"
 fi
\ No newline at end of file
@@ -0,0 +1,79 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+import json
+import subprocess
+import src.Decoders.JSonDecoder as JSonDecoder
+from src.ProblemUtils.Problem import Problem
+from src.Utils.Graph import Graph
+from src.Solvers.BranchAndBoundSolver import BranchAndBoundSolver
+from src.Solvers.ComponentSolver import ComponentSolver
+from src.Solvers.SolverArgs import SolverArgs
+
+"""
+Checks that ComponentSolver gives the same result with several worker processes, including
+on the platforms that spawn them (macOS, Windows).
+"""
+
+# two opponents whose shots are blocked by different defenders (two components)
+PROBLEM = {"field_limits": [[-4.5, 4.5], [-3, 3]], "goals": [{"posts": [[4.5, -0.5], [4.5, 0.5]], "direction": [-1, 0]}],
+           "opponents": [[-1.02, -2.84], [-3.66, 1.31]], "robot_radius": 0.09, "theta_step": 0.031416, "pos_step": 0.1}
+
+# solves the problem with two spawned workers, the solver processes import the script again
+SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+import multiprocessing
+import src.Decoders.JSonDecoder as JSonDecoder
+from src.ProblemUtils.Problem import Problem
+from src.Utils.Graph import Graph
+from src.Solvers.BranchAndBoundSolver import BranchAndBoundSolver
+from src.Solvers.ComponentSolver import ComponentSolver
+from src.Solvers.SolverArgs import SolverArgs
+
+if __name__ == "__main__":
+    multiprocessing.set_start_method("spawn")
+    problem = Problem(JSonDecoder.decode)
+    problem.decode({path!r})
+    s = ComponentSolver(Graph(problem), BranchAndBoundSolver, 2)
+    print(len(s.solve(SolverArgs())), s.stats["components"])
+"""
+
+def load(tmp_path):
+    """
+    Writes the problem in a file and decodes it.
+
+    :param tmp_path: The directory of the file.
+
+    :return: A tuple (path, problem), the path of the file and the Problem object.
+    """
+    path = str(tmp_path / "problem.json")
+    with open(path, "w") as f:
+        json.dump(PROBLEM, f)
+    res = Problem(JSonDecoder.decode)
+    res.decode(path)
+    return (path, res)
+
+def test_same_solution_with_workers(tmp_path):
+    _, problem = load(tmp_path)
+    graph = Graph(problem)
+
+    single = ComponentSolver(graph, BranchAndBoundSolver, 1)
+    res = single.solve(SolverArgs())
+    multiple = ComponentSolver(graph, BranchAndBoundSolver, 2)
+    positions = [(d.pos.x, d.pos.y) for d in multiple.solve(SolverArgs())]
+    assert positions == [(d.pos.x, d.pos.y) for d in res]
+
+    assert multiple.stats["components"] == 2
+    assert multiple.stats["best"] == len(res) == multiple.stats["lower_bound"]
+
+def test_spawned_workers(tmp_path):
+    path, problem = load(tmp_path)
+    expected = len(ComponentSolver(Graph(problem), BranchAndBoundSolver, 1).solve(SolverArgs()))
+
+    script = tmp_path / "solve.py"
+    script.write_text(SCRIPT.format(root=os.path.abspath(os.path.join(os.path.dirname(__file__), '../')), path=path))
+    out = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=300)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.split() == [str(expected), "2"]
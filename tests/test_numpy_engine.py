@@ -0,0 +1,85 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+import json
+import pytest
+import src.Decoders.JSonDecoder as JSonDecoder
+from src.ProblemUtils.Problem import Problem
+from src.Utils.Graph import Graph
+
+"""
+Checks that the "numpy" engine (see NumpyGraphBuilder.py) computes exactly the same graph as
+the "python" engine.
+"""
+
+FIELD = [[-4.5, 4.5], [-3, 3]]
+GOAL = {"posts": [[4.5, -0.5], [4.5, 0.5]], "direction": [-1, 0]}
+OTHER_GOAL = {"posts": [[-4.5, 0.5], [-4.5, -0.5]], "direction": [1, 0]}
+
+def problem(opponents, goals=[GOAL], **extra):
+    """
+    Creates the json description of a problem.
+
+    :param opponents: The positions of the opponents.
+
+    :param goals (opt): The goals (default: a single goal).
+
+    :param extra (opt): The other fields of the problem (min_dist, goalkeeper_area...).
+
+    :return: The dictionnary of the problem.
+    """
+    res = {"field_limits": FIELD, "goals": goals, "opponents": opponents, "robot_radius": 0.09,
+           "theta_step": 0.031416, "pos_step": 0.1}
+    res.update(extra)
+    return res
+
+PROBLEMS = {
+    "basic": problem([[-3.29, 2.08], [2.37, -1.47], [-0.04, -0.30]]),
+    "min_dist": problem([[-1.77, 0.53], [3.44, 2.08], [0.05, 0.53], [-4.19, -1.54]], min_dist=0.16),
+    "goal_keeper": problem([[3.82, 2.69], [3.53, -2.50], [0.83, -0.46], [0.27, -2.22]],
+                           goalkeeper_area=[[4.06, 4.5], [-0.48, 0.48]]),
+    "multi_goal": problem([[0.5, 0.3], [-1.5, 1.0], [2.0, -1.2]], goals=[GOAL, OTHER_GOAL]),
+}
+
+def load(tmp_path, name):
+    """
+    Writes a problem of PROBLEMS in a file and decodes it.
+
+    :param tmp_path: The directory of the file.
+
+    :param name: The name of the problem.
+
+    :return: The Problem object.
+    """
+    path = str(tmp_path / (name + ".json"))
+    with open(path, "w") as f:
+        json.dump(PROBLEMS[name], f)
+    res = Problem(JSonDecoder.decode)
+    res.decode(path)
+    return res
+
+def assert_same_graph(a, b):
+    """
+    Checks that two graphs have the same defenders, edges, degrees, shots and distances.
+
+    :param a: The first graph.
+
+    :param b: The second graph.
+    """
+    assert [(d.pos.x, d.pos.y) for d in a.defenders] == [(d.pos.x, d.pos.y) for d in b.defenders]
+    assert list(a.edges) == list(b.edges)
+    assert list(a.deg) == list(b.deg)
+    assert a.nb_shots == b.nb_shots
+    assert list(a.total_distance_defender) == list(b.total_distance_defender)
+
+@pytest.mark.parametrize("name", sorted(PROBLEMS))
+def test_same_graph(tmp_path, name):
+    problem = load(tmp_path, name)
+    graph = Graph(problem, engine="python")
+    assert len(graph.defenders) > 0
+    assert_same_graph(Graph(problem, engine="numpy"), graph)
+
+def test_same_graph_not_optimized(tmp_path):
+    problem = load(tmp_path, "basic")
+    assert_same_graph(Graph(problem, optimized=False, engine="numpy"), Graph(problem, optimized=False, engine="python"))